@@ -0,0 +1,73 @@
+"""
+Compare the csv engines of the archive readers on a F&O bhav copy: the pandas C parser against the multithreaded
+pyarrow one (libutil.set_csv_engine).
+
+Uses a synthetic UDiFF F&O bhav copy of --rows rows, or the file given with --file (a BhavCopy_NSE_FO_*.csv.zip
+or its csv, eg: downloaded once with transport.RecordTransport). Run from the repository root:
+        python benchmarks/bench_csv_engine.py --rows 200000
+        python benchmarks/bench_csv_engine.py --file BhavCopy_NSE_FO_0_0_0_20250217_F_0000.csv.zip
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import time
+import zipfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# run as a plain script: nselib from the checkout, the payload builders from tests/
+sys.path[:0] = [ROOT, os.path.join(ROOT, "tests")]
+
+import payloads  # noqa: E402
+from nselib import libutil  # noqa: E402
+from nselib.constants import udiff_bhavcopy_schema  # noqa: E402
+
+
+def _csv_bytes(path: str = None, rows: int = 200000) -> bytes:
+    if path:
+        with open(path, "rb") as fh:
+            content = fh.read()
+    else:
+        content = payloads.udiff_bhav_copy_zip(rows, segment="FO")
+    if not zipfile.is_zipfile(io.BytesIO(content)):
+        return content
+    with zipfile.ZipFile(io.BytesIO(content)) as zip_file:
+        return zip_file.read(zip_file.namelist()[0])
+
+
+def bench_engine(engine: str, content: bytes, repeat: int) -> float:
+    libutil.set_csv_engine(engine)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        libutil.read_csv_with_schema(io.BytesIO(content), udiff_bhavcopy_schema)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="csv engines of the archive readers on a F&O bhav copy")
+    parser.add_argument("--file", help="recorded bhav copy, zip or csv")
+    parser.add_argument("--rows", type=int, default=200000, help="rows of the synthetic bhav copy")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    content = _csv_bytes(args.file, args.rows)
+    report = {"file": os.path.basename(args.file) if args.file else "synthetic", "csv_bytes": len(content),
+              "cpu_count": os.cpu_count(), "seconds": {}}
+    try:
+        report["seconds"]["c"] = round(bench_engine("c", content, args.repeat), 4)
+        try:
+            report["seconds"]["pyarrow"] = round(bench_engine("pyarrow", content, args.repeat), 4)
+            report["pyarrow_speedup"] = round(report["seconds"]["c"] / report["seconds"]["pyarrow"], 2)
+        except ImportError as e:
+            report["pyarrow_skipped"] = str(e)
+    finally:
+        libutil.set_csv_engine("auto")
+    print(json.dumps(report, indent=2))
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""
+Time and peak memory of every report parser, on payloads shaped and sized like the real files.
+
+The NSE reports go through their public function with the payload replayed by nselib.transport.ReplayTransport, so
+the numbers cover the whole path after the download. The NSDL and AMFI parsers are called directly with the payload.
+Synthetic payloads (tests/payloads.py) are used unless --fixtures points to responses recorded with
+nselib.transport.RecordTransport for --trade-date. Cases whose optional dependency is missing are reported as
+skipped, the results are printed (or written to --output) as JSON to be kept for trend tracking.
+
+Run from the repository root:
+        python benchmarks/bench_parsers.py --repeat 5 --output parser_bench.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# run as a plain script: nselib from the checkout, the payload builders from tests/
+sys.path[:0] = [ROOT, os.path.join(ROOT, "tests")]
+
+import payloads  # noqa: E402
+from nselib import nsdl_fpi, transport  # noqa: E402
+from nselib.capital_market import capital_market_data, get_func as capital_market_get_func  # noqa: E402
+from nselib.derivatives import derivative_data  # noqa: E402
+from nselib.errors import FixtureNotFound  # noqa: E402
+from nselib.mutual_funds import mutual_fund_data  # noqa: E402
+
+DEFAULT_TRADE_DATE = "17-02-2025"
+AMFI_URL = "https://www.amfiindia.com/spages/amjan2025repo"
+# financial results keys to extract, the last two are missing from the synthetic filing
+XBRL_KEYS = [
+    "Symbol", "NameOfTheCompany", "DateOfStartOfReportingPeriod", "DateOfEndOfReportingPeriod",
+    "RevenueFromOperations", "OtherIncome", "Income", "CostOfMaterialsConsumed", "EmployeeBenefitExpense",
+    "FinanceCosts", "DepreciationDepletionAndAmortisationExpense", "OtherExpenses", "Expenses", "ProfitBeforeTax",
+    "CurrentTax", "DeferredTax", "TaxExpense", "ProfitLossForPeriod", "ComprehensiveIncomeForThePeriod",
+    "PaidUpValueOfEquityShareCapital", "FaceValueOfEquityShareCapital",
+    "BasicEarningsLossPerShareFromContinuingOperations", "DilutedEarningsLossPerShareFromContinuingOperations",
+    "DescriptionOfOtherExpenses", "AmountOfItemThatWillBeReclassifiedToProfitAndLoss",
+]
+
+
+class _PayloadTransport(transport.LiveTransport):
+    """answers every url with its synthetic payload, only used to write the replay fixtures"""
+
+    def __init__(self, bodies: dict):
+        self.bodies = bodies
+
+    def send(self, session, url, headers, **kwargs):
+        response = requests.Response()
+        response.url = url
+        response.status_code = 200 if url in self.bodies else 404
+        response.encoding = "utf-8"
+        response._content = self.bodies.get(url, b"")
+        return response
+
+
+def _nse_cases(trade_date: datetime, scale: int) -> list:
+    """
+    (name, url, payload builder, call) of the NSE reports parsed by a public function.
+    """
+    day = trade_date.strftime("%d-%m-%Y")
+    ymd, dmy, dmy2 = trade_date.strftime("%Y%m%d"), trade_date.strftime("%d%m%Y"), trade_date.strftime("%d%m%y")
+    return [
+        ("nse_live_option_chain",
+         "https://www.nseindia.com/api/option-chain-v3?type=Indices&symbol=NIFTY&expiry=None",
+         lambda: payloads.option_chain_json(strikes=250 * scale, expiries=4),
+         lambda: derivative_data.nse_live_option_chain("NIFTY")),
+        ("fno_bhav_copy",
+         f"https://nsearchives.nseindia.com/content/fo/BhavCopy_NSE_FO_0_0_0_{ymd}_F_0000.csv.zip",
+         lambda: payloads.udiff_bhav_copy_zip(40000 * scale, segment="FO"),
+         lambda: derivative_data.fno_bhav_copy(day)),
+        ("bhav_copy_equities",
+         f"https://nsearchives.nseindia.com/content/cm/BhavCopy_NSE_CM_0_0_0_{ymd}_F_0000.csv.zip",
+         lambda: payloads.udiff_bhav_copy_zip(3000 * scale, segment="CM"),
+         lambda: capital_market_data.bhav_copy_equities(day)),
+        ("category_turnover_cash",
+         f"https://archives.nseindia.com/archives/equities/cat/cat_turnover_{dmy2}.xls",
+         lambda: payloads.category_turnover_xls(blocks=3, days=scale),
+         lambda: capital_market_data.category_turnover_cash(day)),
+        ("category_turnover_fo",
+         f"https://archives.nseindia.com/archives/fo/cat/fo_cat_turnover_{dmy2}.xls",
+         lambda: payloads.category_turnover_xls(blocks=1, days=scale, category_header="Client Categories"),
+         lambda: derivative_data.category_turnover_fo(day)),
+        ("participant_wise_open_interest",
+         f"https://nsearchives.nseindia.com/content/nsccl/fao_participant_oi_{dmy}.csv",
+         payloads.participant_oi_csv,
+         lambda: derivative_data.participant_wise_open_interest(day)),
+    ]
+
+
+def _amfi_call(parser, file_type: str, content: bytes):
+    return lambda: parser(report_content=content, report_month=date(2025, 1, 1), period_label="January 2025",
+                          source_url=f"{AMFI_URL}.{file_type}", source_file_type=file_type)
+
+
+def _parser_cases(scale: int) -> list:
+    """
+    (name, payload builder, call taking the payload) of the parsers called directly.
+    """
+    return [
+        ("nsdl_fpi._parse_report_bundle", lambda: payloads.nsdl_fpi_html(days=22 * scale),
+         lambda html: lambda: nsdl_fpi._parse_report_bundle(html, "Archive.aspx", date(2025, 2, 28))),
+        ("mutual_fund_data._parse_excel_report[xls]", lambda: payloads.amfi_report_xls(400 * scale),
+         lambda content: _amfi_call(mutual_fund_data._parse_excel_report, "xls", content)),
+        ("mutual_fund_data._parse_excel_report[xlsx]", lambda: payloads.amfi_report_xlsx(400 * scale),
+         lambda content: _amfi_call(mutual_fund_data._parse_excel_report, "xlsx", content)),
+        ("mutual_fund_data._parse_html_report", lambda: payloads.amfi_report_html(400 * scale),
+         lambda content: _amfi_call(mutual_fund_data._parse_html_report, "html", content)),
+        ("mutual_fund_data._parse_pdf_report", lambda: payloads.amfi_report_pdf(400 * scale),
+         lambda content: _amfi_call(mutual_fund_data._parse_pdf_report, "pdf", content)),
+        ("capital_market.get_func.parse_xbrl_financial_result",
+         lambda: payloads.xbrl_financial_result(XBRL_KEYS[:-2], segments=200 * scale),
+         lambda content: lambda: capital_market_get_func.parse_xbrl_financial_result(
+             content, payloads.XBRL_NAMESPACES, XBRL_KEYS)),
+    ]
+
+
+def _rows(result) -> int:
+    if isinstance(result, nsdl_fpi.NSDLFPIReportBundle):
+        return len(result.investment) + len(result.derivative)
+    return len(result)
+
+
+def measure(call, repeat: int) -> dict:
+    """
+    Run call once to warm up, then repeat times for the timings and once more under tracemalloc for the peak memory.
+    """
+    rows = _rows(call())
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "status": "ok",
+        "rows": rows,
+        "min_seconds": round(min(timings), 6),
+        "median_seconds": round(statistics.median(timings), 6),
+        "mean_seconds": round(statistics.fmean(timings), 6),
+        "peak_memory_bytes": peak,
+    }
+
+
+def _run_case(name: str, build, call_for, repeat: int) -> dict:
+    result = {"case": name}
+    try:
+        payload = build()
+    except ImportError as e:
+        return {**result, "status": "skipped", "reason": f"payload needs {e.name}"}
+    result["payload_bytes"] = len(payload)
+    try:
+        return {**result, **measure(call_for(payload), repeat)}
+    except ImportError as e:
+        return {**result, "status": "skipped", "reason": f"parser needs {e.name}"}
+    except Exception as e:
+        return {**result, "status": "error", "reason": f"{type(e).__name__}: {e}"}
+
+
+def _safe_measure(call, repeat: int) -> dict:
+    try:
+        return measure(call, repeat)
+    except FixtureNotFound as e:
+        return {"status": "skipped", "reason": str(e)}
+    except Exception as e:
+        return {"status": "error", "reason": f"{type(e).__name__}: {e}"}
+
+
+def run(repeat: int = 5, scale: int = 1, trade_date: str = DEFAULT_TRADE_DATE, fixtures: str = None,
+        cases: list = None) -> dict:
+    """
+    Run the benchmark cases (all of them by default, else the names given in cases) and get the report.
+    """
+    trade_day = datetime.strptime(trade_date, "%d-%m-%Y")
+    results = []
+    previous_transport = transport.get_transport()
+    with tempfile.TemporaryDirectory() as synthetic_dir:
+        try:
+            for name, url, build, call in _nse_cases(trade_day, scale):
+                if cases and name not in cases:
+                    continue
+                if fixtures:
+                    transport.set_transport(transport.ReplayTransport(fixtures))
+                    results.append({"case": name, "payload": "recorded", **_safe_measure(call, repeat)})
+                    continue
+
+                def replay(content, url=url, call=call):
+                    recorder = transport.RecordTransport(synthetic_dir, transport=_PayloadTransport({url: content}))
+                    recorder.send(None, url, {})
+                    transport.set_transport(transport.ReplayTransport(synthetic_dir))
+                    return call
+
+                results.append({**_run_case(name, build, replay, repeat), "payload": "synthetic"})
+        finally:
+            transport.set_transport(previous_transport)
+    for name, build, call_for in _parser_cases(scale):
+        if cases and name not in cases:
+            continue
+        results.append({**_run_case(name, build, call_for, repeat), "payload": "synthetic"})
+    return {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "repeat": repeat,
+        "scale": scale,
+        "trade_date": trade_date,
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs of every case")
+    parser.add_argument("--scale", type=int, default=1, help="multiply the synthetic payload sizes")
+    parser.add_argument("--trade-date", default=DEFAULT_TRADE_DATE, help="trade date of the NSE reports, dd-mm-YYYY")
+    parser.add_argument("--fixtures", help="directory of responses recorded with RecordTransport")
+    parser.add_argument("--case", action="append", dest="cases", help="run only this case, can be repeated")
+    parser.add_argument("--output", help="write the JSON report to this file instead of stdout")
+    args = parser.parse_args(argv)
+    report = run(repeat=args.repeat, scale=args.scale, trade_date=args.trade_date, fixtures=args.fixtures,
+                 cases=args.cases)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    return report
+
+
+if __name__ == "__main__":
+    main()
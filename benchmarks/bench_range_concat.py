@@ -0,0 +1,84 @@
+"""
+Time the range fetchers against synthetic windows to check they scale linearly with the number of windows.
+
+Run from the repository root:
+        python benchmarks/bench_range_concat.py
+"""
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+# run as a plain script, nselib from the checkout
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nselib.constants import future_price_volume_data_column  # noqa: E402
+from nselib.derivatives import derivative_data  # noqa: E402
+
+ROWS_PER_WINDOW = 5000
+WINDOW_COUNTS = (4, 8, 16, 32, 64)
+
+
+def _window_frame(rows: int = ROWS_PER_WINDOW) -> pd.DataFrame:
+    data = {name: np.arange(rows, dtype=float) for name in future_price_volume_data_column}
+    data["TIMESTAMP"] = "01-Jan-2024"
+    data["INSTRUMENT"] = "OPTIDX"
+    data["SYMBOL"] = "NIFTY"
+    data["EXPIRY_DT"] = "25-Jan-2024"
+    data["OPTION_TYPE"] = "CE"
+    return pd.DataFrame(data)
+
+
+def _legacy_accumulate(frames):
+    """the old pattern, every window copies all the rows collected so far"""
+    nse_df = pd.DataFrame(columns=future_price_volume_data_column)
+    for data_df in frames:
+        if nse_df.empty:
+            nse_df = data_df
+        else:
+            nse_df = pd.concat([nse_df, data_df], ignore_index=True)
+    return nse_df
+
+
+def bench_option_price_volume_data(windows: int) -> float:
+    frame = _window_frame()
+    from_date = datetime(2020, 1, 1)
+    to_date = from_date + timedelta(91 * windows - 1)
+    with patch.object(derivative_data, "get_option_price_volume_data", return_value=frame):
+        start = time.perf_counter()
+        derivative_data.option_price_volume_data(
+            symbol="NIFTY", instrument="OPTIDX", option_type="CE",
+            from_date=from_date.strftime("%d-%m-%Y"), to_date=to_date.strftime("%d-%m-%Y"))
+        return time.perf_counter() - start
+
+
+def bench_legacy_accumulate(windows: int) -> float:
+    frames = [_window_frame() for _ in range(windows)]
+    start = time.perf_counter()
+    _legacy_accumulate(frames)
+    return time.perf_counter() - start
+
+
+def main():
+    results = []
+    for windows in WINDOW_COUNTS:
+        current = bench_option_price_volume_data(windows)
+        legacy = bench_legacy_accumulate(windows)
+        results.append({
+            "windows": windows,
+            "rows": windows * ROWS_PER_WINDOW,
+            "seconds": round(current, 4),
+            "seconds_per_window": round(current / windows, 5),
+            "legacy_concat_seconds": round(legacy, 4),
+            "legacy_concat_seconds_per_window": round(legacy / windows, 5),
+        })
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,17 @@
 import logging
 
-from .libutil import trading_holiday_calendar
 from .logger import enable_logging
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 __version__ = "2.5.1"
 __all__ = ["trading_holiday_calendar", "enable_logging"]
+
+
+def __getattr__(name):
+    # libutil pulls in pandas and requests, only import it when it is used
+    if name == "trading_holiday_calendar":
+        from .libutil import trading_holiday_calendar
+
+        return trading_holiday_calendar
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
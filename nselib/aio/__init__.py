@@ -0,0 +1,4 @@
+from . import capital_market, derivatives, indices, debt
+from .base import run_sync, set_max_concurrency
+
+__all__ = ["capital_market", "derivatives", "indices", "debt", "run_sync", "set_max_concurrency"]
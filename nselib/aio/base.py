@@ -0,0 +1,69 @@
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+_executor = None
+_max_concurrency = DEFAULT_MAX_CONCURRENCY
+_executor_lock = threading.Lock()
+
+
+def set_max_concurrency(max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+    """
+    Set how many NSE calls the async API runs at the same time. A call may make several requests at once (a range
+    function with max_workers), the requests per host are bounded by the rate limits (see nselib.rate_limit).
+
+    Args:
+        max_concurrency (int, optional): Number of calls running across all event loops. Defaults to 8.
+
+    Example:
+            from nselib import aio
+            aio.set_max_concurrency(4)
+    """
+    global _executor, _max_concurrency
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency should be at least 1")
+    with _executor_lock:
+        _max_concurrency = max_concurrency
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+            _executor = None
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared executor which runs the blocking NSE calls on the pooled NSE client.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_max_concurrency, thread_name_prefix="nselib-aio")
+        return _executor
+
+
+async def run_sync(func, *args, **kwargs):
+    """
+    Await a blocking nselib function without blocking the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    # like asyncio.to_thread, the call runs in a copy of the caller context (trace tags)
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(get_executor(), functools.partial(context.run, func, *args, **kwargs))
+
+
+def asyncify(func):
+    """
+    Build the async equivalent of a blocking nselib function.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await run_sync(func, *args, **kwargs)
+
+    return wrapper
@@ -0,0 +1,55 @@
+"""
+Async equivalents of the nselib.capital_market functions.
+
+Example:
+        import asyncio
+        from nselib import aio
+        df = asyncio.run(aio.capital_market.price_volume_and_deliverable_position_data('SBIN', period='1M'))
+"""
+from nselib import capital_market as _capital_market
+from nselib.aio.base import asyncify
+
+price_volume_and_deliverable_position_data = asyncify(_capital_market.price_volume_and_deliverable_position_data)
+price_volume_data = asyncify(_capital_market.price_volume_data)
+deliverable_position_data = asyncify(_capital_market.deliverable_position_data)
+bulk_deal_data = asyncify(_capital_market.bulk_deal_data)
+block_deals_data = asyncify(_capital_market.block_deals_data)
+short_selling_data = asyncify(_capital_market.short_selling_data)
+bhav_copy_with_delivery = asyncify(_capital_market.bhav_copy_with_delivery)
+bhav_copy_equities = asyncify(_capital_market.bhav_copy_equities)
+bhav_copy_equities_range = asyncify(_capital_market.bhav_copy_equities_range)
+equity_list = asyncify(_capital_market.equity_list)
+fno_equity_list = asyncify(_capital_market.fno_equity_list)
+fno_index_list = asyncify(_capital_market.fno_index_list)
+nifty50_equity_list = asyncify(_capital_market.nifty50_equity_list)
+niftynext50_equity_list = asyncify(_capital_market.niftynext50_equity_list)
+niftymidcap150_equity_list = asyncify(_capital_market.niftymidcap150_equity_list)
+niftysmallcap250_equity_list = asyncify(_capital_market.niftysmallcap250_equity_list)
+india_vix_data = asyncify(_capital_market.india_vix_data)
+index_data = asyncify(_capital_market.index_data)
+market_watch_all_indices = asyncify(_capital_market.market_watch_all_indices)
+daily_volatility = asyncify(_capital_market.daily_volatility)
+var_begin_day = asyncify(_capital_market.var_begin_day)
+var_1st_intra_day = asyncify(_capital_market.var_1st_intra_day)
+var_2nd_intra_day = asyncify(_capital_market.var_2nd_intra_day)
+var_3rd_intra_day = asyncify(_capital_market.var_3rd_intra_day)
+var_4th_intra_day = asyncify(_capital_market.var_4th_intra_day)
+var_end_of_day = asyncify(_capital_market.var_end_of_day)
+var_all_snapshots = asyncify(_capital_market.var_all_snapshots)
+var_all_snapshots_range = asyncify(_capital_market.var_all_snapshots_range)
+sme_bhav_copy = asyncify(_capital_market.sme_bhav_copy)
+sme_band_complete = asyncify(_capital_market.sme_band_complete)
+week_52_high_low_report = asyncify(_capital_market.week_52_high_low_report)
+financial_results_for_equity = asyncify(_capital_market.financial_results_for_equity)
+corporate_bond_trade_report = asyncify(_capital_market.corporate_bond_trade_report)
+bhav_copy_sme = asyncify(_capital_market.bhav_copy_sme)
+pe_ratio = asyncify(_capital_market.pe_ratio)
+corporate_actions_for_equity = asyncify(_capital_market.corporate_actions_for_equity)
+event_calendar_for_equity = asyncify(_capital_market.event_calendar_for_equity)
+top_gainers_or_losers = asyncify(_capital_market.top_gainers_or_losers)
+most_active_equities = asyncify(_capital_market.most_active_equities)
+total_traded_stocks = asyncify(_capital_market.total_traded_stocks)
+category_turnover_cash = asyncify(_capital_market.category_turnover_cash)
+category_turnover_cash_range = asyncify(_capital_market.category_turnover_cash_range)
+business_growth_cm_segment = asyncify(_capital_market.business_growth_cm_segment)
+fii_dii_trading_activity = asyncify(_capital_market.fii_dii_trading_activity)
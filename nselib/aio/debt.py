@@ -0,0 +1,12 @@
+"""
+Async equivalents of the nselib.debt functions.
+
+Example:
+        import asyncio
+        from nselib import aio
+        df = asyncio.run(aio.debt.securities_available_for_trading('17-03-2022'))
+"""
+from nselib import debt as _debt
+from nselib.aio.base import asyncify
+
+securities_available_for_trading = asyncify(_debt.securities_available_for_trading)
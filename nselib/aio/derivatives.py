@@ -0,0 +1,27 @@
+"""
+Async equivalents of the nselib.derivatives functions.
+
+Example:
+        import asyncio
+        from nselib import aio
+        df = asyncio.run(aio.derivatives.future_price_volume_data(symbol='SBIN', instrument='FUTSTK', period='1M'))
+"""
+from nselib import derivatives as _derivatives
+from nselib.aio.base import asyncify
+
+future_price_volume_data = asyncify(_derivatives.future_price_volume_data)
+option_price_volume_data = asyncify(_derivatives.option_price_volume_data)
+fno_bhav_copy = asyncify(_derivatives.fno_bhav_copy)
+fno_bhav_copy_range = asyncify(_derivatives.fno_bhav_copy_range)
+participant_wise_open_interest = asyncify(_derivatives.participant_wise_open_interest)
+participant_wise_trading_volume = asyncify(_derivatives.participant_wise_trading_volume)
+expiry_dates_future = asyncify(_derivatives.expiry_dates_future)
+expiry_dates_option_index = asyncify(_derivatives.expiry_dates_option_index)
+nse_live_option_chain = asyncify(_derivatives.nse_live_option_chain)
+fii_derivatives_statistics = asyncify(_derivatives.fii_derivatives_statistics)
+fno_security_in_ban_period = asyncify(_derivatives.fno_security_in_ban_period)
+live_most_active_underlying = asyncify(_derivatives.live_most_active_underlying)
+daily_volatility = asyncify(_derivatives.daily_volatility)
+category_turnover_fo = asyncify(_derivatives.category_turnover_fo)
+category_turnover_fo_range = asyncify(_derivatives.category_turnover_fo_range)
+business_growth_fo_segment = asyncify(_derivatives.business_growth_fo_segment)
@@ -0,0 +1,14 @@
+"""
+Async equivalents of the nselib.indices functions.
+
+Example:
+        import asyncio
+        from nselib import aio
+        df = asyncio.run(aio.indices.index_list('BroadMarketIndices'))
+"""
+from nselib import indices as _indices
+from nselib.aio.base import asyncify
+
+index_list = asyncify(_indices.index_list)
+constituent_stock_list = asyncify(_indices.constituent_stock_list)
+live_index_performances = asyncify(_indices.live_index_performances)
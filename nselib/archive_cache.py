@@ -0,0 +1,243 @@
+import contextlib
+import contextvars
+import hashlib
+import logging
+import os
+import shutil
+import threading
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ARCHIVE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "nselib", "archives")
+DEFAULT_ARCHIVE_CACHE_SIZE = 1024 ** 3
+
+# 'use' reads and writes the cache, 'refresh' only writes, 'bypass' neither
+_cache_mode = contextvars.ContextVar("nselib_archive_cache_mode", default="use")
+
+
+class ArchiveCache:
+    """
+    On-disk cache of the raw bytes of NSE archive files (bhav copies, VaR files, ...), keyed by URL.
+
+    Archive reports of a past trade date never change once published, so they are served from directory instead
+    of being downloaded again. When the files grow beyond max_bytes the least recently used ones are removed.
+
+    Example:
+            from nselib import archive_cache
+            archive_cache.configure_archive_cache(directory='/data/nse_archives', max_bytes=2 * 1024 ** 3)
+    """
+
+    def __init__(self, directory: str = DEFAULT_ARCHIVE_CACHE_DIR, max_bytes: int = DEFAULT_ARCHIVE_CACHE_SIZE):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # bytes of the cached files, from a scan of the directory on the first write, then kept up to date by the
+        # writes and removals of this process
+        self._total = None
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(url.encode("utf-8")).hexdigest() + ".bin")
+
+    def get(self, url: str):
+        """
+        Get the cached bytes of url, None when not cached.
+        """
+        path = self._path(url)
+        try:
+            with open(path, "rb") as fh:
+                content = fh.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.debug(f"Ignoring unreadable archive cache file {path}: {e}")
+            return None
+        try:
+            # the modification time is the last use, for the LRU eviction
+            os.utime(path)
+        except OSError:
+            pass
+        logger.debug(f"Serving {url} from the archive cache")
+        return content
+
+    def open(self, url: str):
+        """
+        Open the cached file of url for binary reading, None when not cached. The caller closes it.
+        """
+        path = self._path(url)
+        try:
+            fh = open(path, "rb")
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.debug(f"Ignoring unreadable archive cache file {path}: {e}")
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        logger.debug(f"Serving {url} from the archive cache")
+        return fh
+
+    def set_file(self, url: str, fh):
+        """
+        Store the content of the binary file fh (read from its current position) downloaded from url, without
+        loading it in memory.
+        """
+        path = self._path(url)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as tmp:
+                shutil.copyfileobj(fh, tmp)
+                size = tmp.tell()
+            if size > self.max_bytes:
+                os.remove(tmp_path)
+                return
+            self._replace(tmp_path, path, size)
+        except OSError as e:
+            logger.debug(f"Could not write archive cache file {path}: {e}")
+            return
+        self._evict()
+
+    def set(self, url: str, content: bytes):
+        """
+        Store the bytes downloaded from url and evict the least recently used files above max_bytes.
+        """
+        if len(content) > self.max_bytes:
+            return
+        path = self._path(url)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as fh:
+                fh.write(content)
+            self._replace(tmp_path, path, len(content))
+        except OSError as e:
+            logger.debug(f"Could not write archive cache file {path}: {e}")
+            return
+        self._evict()
+
+    def _replace(self, tmp_path: str, path: str, size: int):
+        with self._lock:
+            try:
+                replaced = os.stat(path).st_size
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(tmp_path, path)
+            if self._total is not None:
+                self._total += size - replaced
+
+    def _evict(self):
+        with self._lock:
+            if self._total is not None and self._total <= self.max_bytes:
+                return
+            # the directory is only scanned over the limit, the other processes sharing it may have written too
+            entries = []
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.endswith(".bin"):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    pass
+            self._total = total
+
+    def invalidate(self, url: str):
+        path = self._path(url)
+        with self._lock:
+            try:
+                size = os.stat(path).st_size
+                os.remove(path)
+            except FileNotFoundError:
+                return
+            if self._total is not None:
+                self._total -= size
+
+    def clear(self):
+        with self._lock:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.endswith(".bin"):
+                        os.remove(entry.path)
+            self._total = None
+
+    def size(self) -> int:
+        """
+        Total bytes stored in the cache directory.
+        """
+        with os.scandir(self.directory) as it:
+            return sum(entry.stat().st_size for entry in it if entry.is_file() and entry.name.endswith(".bin"))
+
+
+_archive_cache = None
+
+
+def get_archive_cache():
+    """
+    Get the process wide archive cache, None while it is not configured (the default).
+    """
+    return _archive_cache
+
+
+def configure_archive_cache(directory: str = DEFAULT_ARCHIVE_CACHE_DIR,
+                            max_bytes: int = DEFAULT_ARCHIVE_CACHE_SIZE) -> ArchiveCache:
+    """
+    Turn on the archive cache for the past trade date reports.
+
+    Args:
+        directory (str, optional): Directory of the cached files. Defaults to ~/.cache/nselib/archives.
+        max_bytes (int, optional): Size limit of the directory, least recently used files are removed above it.
+            Defaults to 1 GiB.
+
+    Returns:
+        ArchiveCache: The new cache.
+    """
+    global _archive_cache
+    _archive_cache = ArchiveCache(directory=directory, max_bytes=max_bytes)
+    return _archive_cache
+
+
+def disable_archive_cache():
+    """
+    Turn off the archive cache, the files already stored are kept on disk.
+    """
+    global _archive_cache
+    _archive_cache = None
+
+
+def cache_mode() -> str:
+    return _cache_mode.get()
+
+
+@contextlib.contextmanager
+def bypass():
+    """
+    Download the archive files again inside the block, without reading or updating the cache.
+
+    Example:
+            with archive_cache.bypass():
+                df = capital_market.bhav_copy_equities('17-03-2022')
+    """
+    token = _cache_mode.set("bypass")
+    try:
+        yield
+    finally:
+        _cache_mode.reset(token)
+
+
+@contextlib.contextmanager
+def refresh():
+    """
+    Download the archive files again inside the block and replace the cached copies.
+    """
+    token = _cache_mode.set("refresh")
+    try:
+        yield
+    finally:
+        _cache_mode.reset(token)
@@ -7,6 +7,7 @@ from .capital_market_data import (
     short_selling_data,
     bhav_copy_with_delivery,
     bhav_copy_equities,
+    bhav_copy_equities_range,
     equity_list,
     fno_equity_list,
     fno_index_list,
@@ -24,6 +25,8 @@ from .capital_market_data import (
     var_3rd_intra_day,
     var_4th_intra_day,
     var_end_of_day,
+    var_all_snapshots,
+    var_all_snapshots_range,
     sme_bhav_copy,
     sme_band_complete,
     week_52_high_low_report,
@@ -37,6 +40,7 @@ from .capital_market_data import (
     most_active_equities,
     total_traded_stocks,
     category_turnover_cash,
+    category_turnover_cash_range,
     business_growth_cm_segment,
     fii_dii_trading_activity,
 )
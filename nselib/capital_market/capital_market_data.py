@@ -1,10 +1,9 @@
-import datetime as dt
-import zipfile
 import xml.etree.ElementTree as ET
 import pandas as pd
 from datetime import datetime
 import logging
 import requests
+from functools import partial
 from io import BytesIO
 
 from nselib.capital_market.get_func import *
@@ -21,14 +20,23 @@ from nselib.constants import (
     block_deals_data_columns,
     short_selling_data_columns,
     var_columns,
+    var_schema,
+    var_snapshots,
+    sec_bhavdata_full_schema,
+    udiff_bhavcopy_schema,
 )
+from nselib import archive_cache
+from nselib import trace as nse_trace
 from nselib.errors import NSEdataNotFound
+from nselib.trace import traced
+from nselib.xbrl_cache import get_xbrl_cache
 
 logger = logging.getLogger(__name__)
 
 
+@traced
 def price_volume_and_deliverable_position_data(symbol: str, from_date: str = None, to_date: str = None,
-                                               period: str = None):
+                                               period: str = None, max_workers: int = None):
     """
     get Security wise price volume & Deliverable position data set. use get_nse_symbols() to get all symbols
     :param symbol: symbol eg: 'SBIN'
@@ -36,34 +44,28 @@ def price_volume_and_deliverable_position_data(symbol: str, from_date: str = Non
     :param to_date: '17-06-2023' ('dd-mm-YYYY')
     :param period: use one {'1D': last day data,'1W': for last 7 days data,
                             '1M': from last month same date, '6M': last 6 month data, '1Y': from last year same date)
+    :param max_workers: number of 365 days windows to download concurrently, default one after another
     :return: pandas.DataFrame
     :raise ValueError if the parameter input is not proper
     """
     validate_date_param(from_date, to_date, period)
     symbol = cleaning_nse_symbol(symbol=symbol)
     from_date, to_date = derive_from_and_to_date(from_date=from_date, to_date=to_date, period=period)
-    nse_df = pd.DataFrame(columns=price_volume_and_deliverable_position_data_columns)
     from_date = datetime.strptime(from_date, dd_mm_yyyy)
     to_date = datetime.strptime(to_date, dd_mm_yyyy)
-    load_days = (to_date - from_date).days
-    while load_days > 0:
-        if load_days > 365:
-            end_date = (from_date + dt.timedelta(364)).strftime(dd_mm_yyyy)
-            start_date = from_date.strftime(dd_mm_yyyy)
-        else:
-            end_date = to_date.strftime(dd_mm_yyyy)
-            start_date = from_date.strftime(dd_mm_yyyy)
-        data_df = get_price_volume_and_deliverable_position_data(symbol=symbol, from_date=start_date, to_date=end_date)
-        from_date = from_date + dt.timedelta(365)
-        load_days = (to_date - from_date).days
-        if not data_df.empty:
-            # Drop all-NaN columns from both frames
-            data_df = data_df.fillna('-')
-            nse_df = nse_df.fillna('-')
-            data_df = data_df.dropna(axis=1, how='all')
-            nse_df = nse_df.dropna(axis=1, how='all')
-            if not data_df.empty:
-                nse_df = pd.concat([nse_df, data_df], ignore_index=True)
+    windows = date_windows(from_date, to_date)
+    frames = fetch_date_windows(partial(get_price_volume_and_deliverable_position_data, symbol=symbol), windows,
+                                max_workers=max_workers)
+    frames = [data_df for data_df in frames if not data_df.empty]
+    if frames:
+        # concat once, then fill the blanks with '-' as the NSE csv does
+        nse_df = pd.concat(frames, ignore_index=True)
+        extra_columns = [name for name in nse_df.columns
+                         if name not in price_volume_and_deliverable_position_data_columns]
+        nse_df = nse_df.reindex(columns=price_volume_and_deliverable_position_data_columns + extra_columns)
+        nse_df = nse_df.fillna('-')
+    else:
+        nse_df = pd.DataFrame(columns=price_volume_and_deliverable_position_data_columns)
 
     nse_df["TotalTradedQuantity"] = pd.to_numeric(nse_df["TotalTradedQuantity"].astype(str).str.replace(",", ""), errors="coerce")
     nse_df["TurnoverInRs"] = pd.to_numeric(nse_df["TurnoverInRs"].astype(str).str.replace(",", ""), errors="coerce")
@@ -72,7 +74,9 @@ def price_volume_and_deliverable_position_data(symbol: str, from_date: str = Non
     return nse_df
 
 
-def price_volume_data(symbol: str, from_date: str = None, to_date: str = None, period: str = None):
+@traced
+def price_volume_data(symbol: str, from_date: str = None, to_date: str = None, period: str = None,
+                      max_workers: int = None):
     """
     get Security wise price volume data set.
     :param symbol: symbol eg: 'SBIN'
@@ -80,6 +84,7 @@ def price_volume_data(symbol: str, from_date: str = None, to_date: str = None, p
     :param to_date: '17-06-2023' ('dd-mm-YYYY')
     :param period: use one {'1D': last day data,'1W': for last 7 days data,
                             '1M': from last month same date, '6M': last 6 month data, '1Y': from last year same date)
+    :param max_workers: number of 365 days windows to download concurrently, default one after another
     :return: pandas.DataFrame
     :raise ValueError if the parameter input is not proper
         Example:
@@ -90,28 +95,17 @@ def price_volume_data(symbol: str, from_date: str = None, to_date: str = None, p
     validate_date_param(from_date, to_date, period)
     symbol = cleaning_nse_symbol(symbol=symbol)
     from_date, to_date = derive_from_and_to_date(from_date=from_date, to_date=to_date, period=period)
-    nse_df = pd.DataFrame(columns=price_volume_data_columns)
     from_date = datetime.strptime(from_date, dd_mm_yyyy)
     to_date = datetime.strptime(to_date, dd_mm_yyyy)
-    load_days = (to_date - from_date).days
-    while load_days > 0:
-        if load_days > 365:
-            end_date = (from_date + dt.timedelta(364)).strftime(dd_mm_yyyy)
-            start_date = from_date.strftime(dd_mm_yyyy)
-        else:
-            end_date = to_date.strftime(dd_mm_yyyy)
-            start_date = from_date.strftime(dd_mm_yyyy)
-        data_df = get_price_volume_data(symbol=symbol, from_date=start_date, to_date=end_date)
-        from_date = from_date + dt.timedelta(365)
-        load_days = (to_date - from_date).days
-        if nse_df.empty:
-            nse_df = data_df
-        else:
-            nse_df = pd.concat([nse_df, data_df], ignore_index=True)
+    windows = date_windows(from_date, to_date)
+    frames = fetch_date_windows(partial(get_price_volume_data, symbol=symbol), windows, max_workers=max_workers)
+    nse_df = concat_window_frames(frames, columns=price_volume_data_columns)
     return nse_df
 
 
-def deliverable_position_data(symbol: str, from_date: str = None, to_date: str = None, period: str = None):
+@traced
+def deliverable_position_data(symbol: str, from_date: str = None, to_date: str = None, period: str = None,
+                              max_workers: int = None):
     """
     get Security wise deliverable position data set.
     :param symbol: symbol eg: 'SBIN'
@@ -122,6 +116,7 @@ def deliverable_position_data(symbol: str, from_date: str = None, to_date: str =
                             '1M': from last month same date,
                             '6M': last 6 month data,
                             '1Y': from last year same date)
+    :param max_workers: number of 365 days windows to download concurrently, default one after another
     :return: pandas.DataFrame
     :raise ValueError if the parameter input is not proper
         Example:
@@ -132,34 +127,24 @@ def deliverable_position_data(symbol: str, from_date: str = None, to_date: str =
     validate_date_param(from_date, to_date, period)
     symbol = cleaning_nse_symbol(symbol=symbol)
     from_date, to_date = derive_from_and_to_date(from_date=from_date, to_date=to_date, period=period)
-    nse_df = pd.DataFrame(columns=deliverable_data_columns)
     from_date = datetime.strptime(from_date, dd_mm_yyyy)
     to_date = datetime.strptime(to_date, dd_mm_yyyy)
-    load_days = (to_date - from_date).days
-    while load_days > 0:
-        if load_days > 365:
-            end_date = (from_date + dt.timedelta(364)).strftime(dd_mm_yyyy)
-            start_date = from_date.strftime(dd_mm_yyyy)
-        else:
-            end_date = to_date.strftime(dd_mm_yyyy)
-            start_date = from_date.strftime(dd_mm_yyyy)
-        data_df = get_deliverable_position_data(symbol=symbol, from_date=start_date, to_date=end_date)
-        from_date = from_date + dt.timedelta(365)
-        load_days = (to_date - from_date).days
-        if nse_df.empty:
-            nse_df = data_df
-        else:
-            nse_df = pd.concat([nse_df, data_df], ignore_index=True)
+    windows = date_windows(from_date, to_date)
+    frames = fetch_date_windows(partial(get_deliverable_position_data, symbol=symbol), windows, max_workers=max_workers)
+    nse_df = concat_window_frames(frames, columns=deliverable_data_columns)
     return nse_df
 
 
-def india_vix_data(from_date: str = None, to_date: str = None, period: str = None):
+@traced
+def india_vix_data(from_date: str = None, to_date: str = None, period: str = None,
+                   max_workers: int = None):
     """
     get india vix spot data  set for the specific time period.
     :param from_date: '17-03-2022' ('dd-mm-YYYY')
     :param to_date: '17-06-2023' ('dd-mm-YYYY')
     :param period: use one {'1D': last day data,'1W': for last 7 days data,
                             '1M': from last month same date, '6M': last 6 month data, '1Y': from last year same date)
+    :param max_workers: number of 365 days windows to download concurrently, default one after another
     :return: pandas.DataFrame
     :raise ValueError if the parameter input is not proper
         Example:
@@ -169,28 +154,17 @@ def india_vix_data(from_date: str = None, to_date: str = None, period: str = Non
     logger.debug(f"Fetching data for india_vix_data")
     validate_date_param(from_date, to_date, period)
     from_date, to_date = derive_from_and_to_date(from_date=from_date, to_date=to_date, period=period)
-    nse_df = pd.DataFrame(columns=india_vix_data_column)
     from_date = datetime.strptime(from_date, dd_mm_yyyy)
     to_date = datetime.strptime(to_date, dd_mm_yyyy)
-    load_days = (to_date - from_date).days
-    while load_days > 0:
-        if load_days > 365:
-            end_date = (from_date + dt.timedelta(364)).strftime(dd_mm_yyyy)
-            start_date = from_date.strftime(dd_mm_yyyy)
-        else:
-            end_date = to_date.strftime(dd_mm_yyyy)
-            start_date = from_date.strftime(dd_mm_yyyy)
-        data_df = get_india_vix_data(from_date=start_date, to_date=end_date)
-        from_date = from_date + dt.timedelta(365)
-        load_days = (to_date - from_date).days
-        if nse_df.empty:
-            nse_df = data_df
-        else:
-            nse_df = pd.concat([nse_df, data_df], ignore_index=True)
+    windows = date_windows(from_date, to_date)
+    frames = fetch_date_windows(get_india_vix_data, windows, max_workers=max_workers)
+    nse_df = concat_window_frames(frames, columns=india_vix_data_column)
     return nse_df
 
 
-def index_data(index: str, from_date: str = None, to_date: str = None, period: str = None):
+@traced
+def index_data(index: str, from_date: str = None, to_date: str = None, period: str = None,
+               max_workers: int = None):
     """
     get historical index data set for the specific time period.
     apply the index name as per the nse india site
@@ -199,6 +173,7 @@ def index_data(index: str, from_date: str = None, to_date: str = None, period: s
     :param to_date: '17-06-2023' ('dd-mm-YYYY')
     :param period: use one {'1D': last day data,'1W': for last 7 days data,
                             '1M': from last month same date, '6M': last 6 month data, '1Y': from last year same date)
+    :param max_workers: number of 365 days windows to download concurrently, default one after another
     :return: pandas.DataFrame
     :raise ValueError if the parameter input is not proper
         Example:
@@ -208,28 +183,17 @@ def index_data(index: str, from_date: str = None, to_date: str = None, period: s
     logger.debug(f"Fetching data for index_data")
     validate_date_param(from_date, to_date, period)
     from_date, to_date = derive_from_and_to_date(from_date=from_date, to_date=to_date, period=period)
-    nse_df = pd.DataFrame()
     from_date = datetime.strptime(from_date, dd_mm_yyyy)
     to_date = datetime.strptime(to_date, dd_mm_yyyy)
-    load_days = (to_date - from_date).days
-    while load_days > 0:
-        if load_days > 365:
-            end_date = (from_date + dt.timedelta(364)).strftime(dd_mm_yyyy)
-            start_date = from_date.strftime(dd_mm_yyyy)
-        else:
-            end_date = to_date.strftime(dd_mm_yyyy)
-            start_date = from_date.strftime(dd_mm_yyyy)
-        data_df = get_index_data(index=index, from_date=start_date, to_date=end_date)
-        from_date = from_date + dt.timedelta(365)
-        load_days = (to_date - from_date).days
-        if nse_df.empty:
-            nse_df = data_df
-        else:
-            nse_df = pd.concat([nse_df, data_df], ignore_index=True)
+    windows = date_windows(from_date, to_date)
+    frames = fetch_date_windows(partial(get_index_data, index=index), windows, max_workers=max_workers)
+    nse_df = concat_window_frames(frames)
     return nse_df
 
 
-def bulk_deal_data(from_date: str = None, to_date: str = None, period: str = None):
+@traced
+def bulk_deal_data(from_date: str = None, to_date: str = None, period: str = None,
+                   max_workers: int = None):
     """
     get bulk deal data set.
     :param from_date: '17-03-2022' ('dd-mm-YYYY')
@@ -239,6 +203,7 @@ def bulk_deal_data(from_date: str = None, to_date: str = None, period: str = Non
                             '1M': from last month same date,
                             '6M': last 6 month data,
                             '1Y': from last year same date)
+    :param max_workers: number of 365 days windows to download concurrently, default one after another
     :return: pandas.DataFrame
     :raise ValueError if the parameter input is not proper
         Example:
@@ -248,28 +213,17 @@ def bulk_deal_data(from_date: str = None, to_date: str = None, period: str = Non
     logger.debug(f"Fetching data for bulk_deal_data")
     validate_date_param(from_date, to_date, period)
     from_date, to_date = derive_from_and_to_date(from_date=from_date, to_date=to_date, period=period)
-    nse_df = pd.DataFrame(columns=bulk_deal_data_columns)
     from_date = datetime.strptime(from_date, dd_mm_yyyy)
     to_date = datetime.strptime(to_date, dd_mm_yyyy)
-    load_days = (to_date - from_date).days
-    while load_days > 0:
-        if load_days > 365:
-            end_date = (from_date + dt.timedelta(364)).strftime(dd_mm_yyyy)
-            start_date = from_date.strftime(dd_mm_yyyy)
-        else:
-            end_date = to_date.strftime(dd_mm_yyyy)
-            start_date = from_date.strftime(dd_mm_yyyy)
-        data_df = get_bulk_deal_data(from_date=start_date, to_date=end_date)
-        from_date = from_date + dt.timedelta(365)
-        load_days = (to_date - from_date).days
-        if nse_df.empty:
-            nse_df = data_df
-        else:
-            nse_df = pd.concat([nse_df, data_df], ignore_index=True)
+    windows = date_windows(from_date, to_date)
+    frames = fetch_date_windows(get_bulk_deal_data, windows, max_workers=max_workers)
+    nse_df = concat_window_frames(frames, columns=bulk_deal_data_columns)
     return nse_df
 
 
-def block_deals_data(from_date: str = None, to_date: str = None, period: str = None):
+@traced
+def block_deals_data(from_date: str = None, to_date: str = None, period: str = None,
+                     max_workers: int = None):
     """
     get block deals data set.
     :param from_date: '17-03-2022' ('dd-mm-YYYY')
@@ -279,6 +233,7 @@ def block_deals_data(from_date: str = None, to_date: str = None, period: str = N
                             '1M': from last month same date,
                             '6M': last 6 month data,
                             '1Y': from last year same date)
+    :param max_workers: number of 365 days windows to download concurrently, default one after another
     :return: pandas.DataFrame
     :raise ValueError if the parameter input is not proper
         Example:
@@ -288,28 +243,17 @@ def block_deals_data(from_date: str = None, to_date: str = None, period: str = N
     logger.debug(f"Fetching data for block_deals_data")
     validate_date_param(from_date, to_date, period)
     from_date, to_date = derive_from_and_to_date(from_date=from_date, to_date=to_date, period=period)
-    nse_df = pd.DataFrame(columns=block_deals_data_columns)
     from_date = datetime.strptime(from_date, dd_mm_yyyy)
     to_date = datetime.strptime(to_date, dd_mm_yyyy)
-    load_days = (to_date - from_date).days
-    while load_days > 0:
-        if load_days > 365:
-            end_date = (from_date + dt.timedelta(364)).strftime(dd_mm_yyyy)
-            start_date = from_date.strftime(dd_mm_yyyy)
-        else:
-            end_date = to_date.strftime(dd_mm_yyyy)
-            start_date = from_date.strftime(dd_mm_yyyy)
-        data_df = get_block_deals_data(from_date=start_date, to_date=end_date)
-        from_date = from_date + dt.timedelta(365)
-        load_days = (to_date - from_date).days
-        if nse_df.empty:
-            nse_df = data_df
-        else:
-            nse_df = pd.concat([nse_df, data_df], ignore_index=True)
+    windows = date_windows(from_date, to_date)
+    frames = fetch_date_windows(get_block_deals_data, windows, max_workers=max_workers)
+    nse_df = concat_window_frames(frames, columns=block_deals_data_columns)
     return nse_df
 
 
-def short_selling_data(from_date: str = None, to_date: str = None, period: str = None):
+@traced
+def short_selling_data(from_date: str = None, to_date: str = None, period: str = None,
+                       max_workers: int = None):
     """
     get short selling data set.
     :param from_date: '17-03-2022' ('dd-mm-YYYY')
@@ -319,6 +263,7 @@ def short_selling_data(from_date: str = None, to_date: str = None, period: str =
                             '1M': from last month same date,
                             '6M': last 6 month data,
                             '1Y': from last year same date)
+    :param max_workers: number of 365 days windows to download concurrently, default one after another
     :return: pandas.DataFrame
     :raise ValueError if the parameter input is not proper
         Example:
@@ -328,27 +273,15 @@ def short_selling_data(from_date: str = None, to_date: str = None, period: str =
     logger.debug(f"Fetching data for short_selling_data")
     validate_date_param(from_date, to_date, period)
     from_date, to_date = derive_from_and_to_date(from_date=from_date, to_date=to_date, period=period)
-    nse_df = pd.DataFrame(columns=short_selling_data_columns)
     from_date = datetime.strptime(from_date, dd_mm_yyyy)
     to_date = datetime.strptime(to_date, dd_mm_yyyy)
-    load_days = (to_date - from_date).days
-    while load_days > 0:
-        if load_days > 365:
-            end_date = (from_date + dt.timedelta(364)).strftime(dd_mm_yyyy)
-            start_date = from_date.strftime(dd_mm_yyyy)
-        else:
-            end_date = to_date.strftime(dd_mm_yyyy)
-            start_date = from_date.strftime(dd_mm_yyyy)
-        data_df = get_short_selling_data(from_date=start_date, to_date=end_date)
-        from_date = from_date + dt.timedelta(365)
-        load_days = (to_date - from_date).days
-        if nse_df.empty:
-            nse_df = data_df
-        else:
-            nse_df = pd.concat([nse_df, data_df], ignore_index=True)
+    windows = date_windows(from_date, to_date)
+    frames = fetch_date_windows(get_short_selling_data, windows, max_workers=max_workers)
+    nse_df = concat_window_frames(frames, columns=short_selling_data_columns)
     return nse_df
 
 
+@traced
 def bhav_copy_with_delivery(trade_date: str):
     """
     get the NSE bhav copy with delivery data as per the traded date
@@ -362,17 +295,17 @@ def bhav_copy_with_delivery(trade_date: str):
     trade_date = datetime.strptime(trade_date, dd_mm_yyyy)
     use_date = trade_date.strftime(ddmmyyyy)
     url = f'https://nsearchives.nseindia.com/products/content/sec_bhavdata_full_{use_date}.csv'
-    request_bhav = nse_urlfetch(url)
+    request_bhav = archive_urlfetch(url, trade_date)
     if request_bhav.status_code == 200:
-        bhav_df = pd.read_csv(BytesIO(request_bhav.content))
+        # the values are padded with a space after every comma, skipinitialspace strips them while reading
+        bhav_df = read_csv_with_schema(BytesIO(request_bhav.content), sec_bhavdata_full_schema, skipinitialspace=True)
     else:
         raise FileNotFoundError(f' Data not found, change the trade_date...')
     bhav_df.columns = [name.replace(' ', '') for name in bhav_df.columns]
-    bhav_df['SERIES'] = bhav_df['SERIES'].str.replace(' ', '')
-    bhav_df['DATE1'] = bhav_df['DATE1'].str.replace(' ', '')
     return bhav_df
 
 
+@traced
 def bhav_copy_equities(trade_date: str):
     """
     get new CM-UDiFF Common Bhavcopy Final as per the traded date provided
@@ -386,20 +319,46 @@ def bhav_copy_equities(trade_date: str):
     trade_date = datetime.strptime(trade_date, dd_mm_yyyy)
     url = 'https://nsearchives.nseindia.com/content/cm/BhavCopy_NSE_CM_0_0_0_'
     payload = f"{str(trade_date.strftime('%Y%m%d'))}_F_0000.csv.zip"
-    request_bhav = nse_urlfetch(url + payload)
+    status_code, bhav_file = archive_download(url + payload, trade_date)
     bhav_df = pd.DataFrame()
-    if request_bhav.status_code == 200:
-        zip_bhav = zipfile.ZipFile(BytesIO(request_bhav.content), 'r')
-        for file_name in zip_bhav.filelist:
-            if file_name:
-                bhav_df = pd.read_csv(zip_bhav.open(file_name))
-    elif request_bhav.status_code == 403:
+    if status_code == 200:
+        bhav_df = read_zipped_csv(bhav_file, payload[:-len('.zip')], udiff_bhavcopy_schema)
+    elif status_code == 403:
         raise FileNotFoundError(f' Data not found, change the trade_date...')
     # bhav_df = bhav_df[['SYMBOL', 'SERIES', 'OPEN', 'HIGH', 'LOW', 'CLOSE', 'LAST', 'PREVCLOSE', 'TOTTRDQTY',
     #                    'TOTTRDVAL', 'TIMESTAMP', 'TOTALTRADES']]
     return bhav_df
 
 
+@traced
+def bhav_copy_equities_range(from_date: str = None, to_date: str = None, period: str = None,
+                             max_workers: int = None, checkpoint_dir: str = None, as_generator: bool = False):
+    """
+    get the CM-UDiFF Common Bhavcopy Final of every trading day in the date range, holidays are not requested
+    :param from_date: '17-03-2022' ('dd-mm-YYYY')
+    :param to_date: '17-06-2023' ('dd-mm-YYYY')
+    :param period: use one {'1D': last day data,'1W': for last 7 days data,
+                            '1M': from last month same date, '6M': last 6 month data, '1Y': from last year same date)
+    :param max_workers: number of days to download concurrently, default one after another
+    :param checkpoint_dir: directory to save every downloaded day, an interrupted call resumes from it
+    :param as_generator: True to get a generator of (trade_date, pandas.DataFrame) per day
+    :return: pandas.DataFrame
+    :raise ValueError if the parameter input is not proper
+        Example:
+            from nselib import capital_market
+            df = capital_market.bhav_copy_equities_range('01-01-2025', '31-03-2025', max_workers=4)
+    """
+    logger.debug(f"Fetching data for bhav_copy_equities_range")
+    validate_date_param(from_date, to_date, period)
+    from_date, to_date = derive_from_and_to_date(from_date=from_date, to_date=to_date, period=period)
+    days = trading_days_between(from_date, to_date)
+    day_frames = fetch_trading_days(bhav_copy_equities, days, max_workers=max_workers, checkpoint_dir=checkpoint_dir)
+    if as_generator:
+        return day_frames
+    return concat_window_frames([data_df for _, data_df in day_frames])
+
+
+@traced
 def bhav_copy_indices(trade_date: str):
     """
     get nse bhav copy as per the traded date provided
@@ -416,12 +375,13 @@ def bhav_copy_indices(trade_date: str):
     if file_chk.status_code != 200:
         raise FileNotFoundError(f" No data available for : {trade_date}")
     try:
-        bhav_df = pd.read_csv(BytesIO(file_chk.content))
+        bhav_df = read_archive_csv(BytesIO(file_chk.content))
     except Exception as e:
         raise FileNotFoundError(f' Bhav copy indices not found for : {trade_date} :: NSE error : {e}')
     return bhav_df
 
 
+@traced
 def bhav_copy_sme(trade_date: str):
     """
     get the NSE bhav copy for SME data as per the traded date
@@ -437,13 +397,14 @@ def bhav_copy_sme(trade_date: str):
     url = f'https://nsearchives.nseindia.com/archives/sme/bhavcopy/sme{use_date}.csv'
     request_bhav = nse_urlfetch(url)
     if request_bhav.status_code == 200:
-        bhav_df = pd.read_csv(BytesIO(request_bhav.content))
+        bhav_df = read_archive_csv(BytesIO(request_bhav.content))
     else:
         raise FileNotFoundError(f' Data not found, change the trade_date...')
     bhav_df.columns = [name.replace(' ', '') for name in bhav_df.columns]
     return bhav_df
 
 
+@traced
 def equity_list():
     """
     get list of all equity available to trade in NSE
@@ -459,13 +420,14 @@ def equity_list():
     if file_chk.status_code != 200:
         raise FileNotFoundError(f" No data equity list available")
     try:
-        data_df = pd.read_csv(BytesIO(file_chk.content))
+        data_df = read_archive_csv(BytesIO(file_chk.content))
     except Exception as e:
         raise FileNotFoundError(f' Equity List not found :: NSE error : {e}')
     data_df = data_df[['SYMBOL', 'NAME OF COMPANY', ' SERIES', ' DATE OF LISTING', ' FACE VALUE']]
     return data_df
 
 
+@traced
 def fno_equity_list():
     """
     get a dataframe of all listed derivative equity list with the recent lot size to trade
@@ -485,6 +447,7 @@ def fno_equity_list():
     return data_df
 
 
+@traced
 def fno_index_list():
     """
     get a dataframe of all listed derivative index list with the recent lot size to trade
@@ -504,6 +467,7 @@ def fno_index_list():
     return data_df
 
 
+@traced
 def nifty50_equity_list():
     """
     list of all equities under NIFTY 50 index
@@ -518,13 +482,14 @@ def nifty50_equity_list():
     if file_chk.status_code != 200:
         raise FileNotFoundError(f" No data equity list available")
     try:
-        data_df = pd.read_csv(BytesIO(file_chk.content))
+        data_df = read_archive_csv(BytesIO(file_chk.content))
     except Exception as e:
         raise FileNotFoundError(f' equities under NIFTY 50 index not found :: NSE error : {e}')
     data_df = data_df[['Company Name', 'Industry', 'Symbol']]
     return data_df
 
 
+@traced
 def niftynext50_equity_list():
     """
     list of all equities under NIFTY NEXT 50 index
@@ -534,14 +499,19 @@ def niftynext50_equity_list():
             df = capital_market.niftynext50_equity_list()
     """
     logger.debug(f"Fetching data for niftynext50_equity_list")
+    url = "https://archives.nseindia.com/content/indices/ind_niftynext50list.csv"
+    file_chk = nse_urlfetch(url)
+    if file_chk.status_code != 200:
+        raise FileNotFoundError(f" No data equity list available")
     try:
-        data_df = pd.read_csv("https://archives.nseindia.com/content/indices/ind_niftynext50list.csv")
+        data_df = read_archive_csv(BytesIO(file_chk.content))
     except Exception as e:
         raise FileNotFoundError(f' equities under NIFTY NEXT 50 index not found :: NSE error : {e}')
     data_df = data_df[['Company Name', 'Industry', 'Symbol']]
     return data_df
 
 
+@traced
 def niftymidcap150_equity_list():
     """
     list of all equities under NIFTY MIDCAP 150 index
@@ -551,14 +521,19 @@ def niftymidcap150_equity_list():
             df = capital_market.niftymidcap150_equity_list()
     """
     logger.debug(f"Fetching data for niftymidcap150_equity_list")
+    url = "https://archives.nseindia.com/content/indices/ind_niftymidcap150list.csv"
+    file_chk = nse_urlfetch(url)
+    if file_chk.status_code != 200:
+        raise FileNotFoundError(f" No data equity list available")
     try:
-        data_df = pd.read_csv("https://archives.nseindia.com/content/indices/ind_niftymidcap150list.csv")
+        data_df = read_archive_csv(BytesIO(file_chk.content))
     except Exception as e:
         raise FileNotFoundError(f' equities under NIFTY MIDCAP 150 index not found :: NSE error : {e}')
     data_df = data_df[['Company Name', 'Industry', 'Symbol']]
     return data_df
 
 
+@traced
 def niftysmallcap250_equity_list():
     """
     list of all equities under NIFTY SMALLCAP 250 index
@@ -568,14 +543,19 @@ def niftysmallcap250_equity_list():
             df = capital_market.niftysmallcap250_equity_list()
     """
     logger.debug(f"Fetching data for niftysmallcap250_equity_list")
+    url = "https://archives.nseindia.com/content/indices/ind_niftysmallcap250list.csv"
+    file_chk = nse_urlfetch(url)
+    if file_chk.status_code != 200:
+        raise FileNotFoundError(f" No data equity list available")
     try:
-        data_df = pd.read_csv("https://archives.nseindia.com/content/indices/ind_niftysmallcap250list.csv")
+        data_df = read_archive_csv(BytesIO(file_chk.content))
     except Exception as e:
         raise FileNotFoundError(f' equities under NIFTY SMALLCAP 250 index not found :: NSE error : {e}')
     data_df = data_df[['Company Name', 'Industry', 'Symbol']]
     return data_df
 
 
+@traced
 def market_watch_all_indices():
     """
     Market Watch - Indices of the day in data frame
@@ -595,6 +575,7 @@ def market_watch_all_indices():
                     'perChange365d', 'perChange30d', 'previousDay', 'oneWeekAgoVal', 'oneMonthAgoVal', 'oneYearAgoVal']]
 
 
+@traced
 def fii_dii_trading_activity():
     """
     FII and DII trading activity of the day in data frame
@@ -610,6 +591,7 @@ def fii_dii_trading_activity():
     return data_df
 
 
+@traced
 def daily_volatility(trade_date: str):
     """
     get CM daily volatility report as per the traded date provided
@@ -634,17 +616,13 @@ def daily_volatility(trade_date: str):
     last_status_code = None
     for url in report_urls:
         # NSE archive requests can fail behind stale local proxy settings, so fetch this report
-        # with a session that ignores environment proxies while preserving the usual cookie flow.
-        r_session = requests.session()
-        r_session.trust_env = False
-        nse_live = r_session.get(origin_url, headers=default_header)
-        cookies = nse_live.cookies
-        report = r_session.get(url, headers=header, cookies=cookies)
+        # with the client that ignores environment proxies while preserving the usual cookie flow.
+        report = nse_urlfetch(url, origin_url=origin_url, trust_env=False)
         last_status_code = report.status_code
         if report.status_code != 200:
             continue
         try:
-            data_df = pd.read_csv(BytesIO(report.content), skipinitialspace=True)
+            data_df = read_archive_csv(BytesIO(report.content), skipinitialspace=True)
         except Exception as exc:
             raise FileNotFoundError(
                 f" CM daily volatility data not found for : {trade_date.strftime(dd_mm_yyyy)} :: NSE error : {exc}"
@@ -657,6 +635,7 @@ def daily_volatility(trade_date: str):
     )
 
 
+@traced
 def category_turnover_cash(trade_date: str):
     """
     get NSE cash market category-wise turnover data as per the traded date provided
@@ -674,78 +653,53 @@ def category_turnover_cash(trade_date: str):
         raise FileNotFoundError(f" No data available for : {trade_date}")
 
     raw = pd.read_excel(BytesIO(file_chk.content), header=None, engine="xlrd")
-    blocks = []
-    row_count = len(raw.index)
-    row_number = 0
-    while row_number < row_count:
-        first = str(raw.iloc[row_number, 0]).strip() if raw.shape[1] > 0 else ""
-        second = str(raw.iloc[row_number, 1]).strip() if raw.shape[1] > 1 else ""
-        if first.lower() == "trade date" and second.lower() in {"category", "client categories"}:
-            headers = [str(value).strip() for value in raw.iloc[row_number, :4].tolist()]
-            start_row = row_number + 1
-            end_row = start_row
-            while end_row < row_count:
-                first_value = raw.iloc[end_row, 0] if raw.shape[1] > 0 else None
-                second_value = raw.iloc[end_row, 1] if raw.shape[1] > 1 else None
-                first_text = str(first_value).strip() if first_value is not None else ""
-                second_text = str(second_value).strip() if second_value is not None else ""
-                if (
-                    first_value is None
-                    or (isinstance(first_value, float) and pd.isna(first_value))
-                    or first_text.lower().startswith("note")
-                    or first_text.lower().startswith("notes")
-                    or first_text.lower() == "trade date"
-                    or second_text.lower() in {"category", "client categories"}
-                ):
-                    break
-                end_row += 1
-            block = raw.iloc[start_row:end_row, :4].copy()
-            block.columns = headers
-            blocks.append(block)
-            row_number = end_row
-            continue
-        row_number += 1
-
+    blocks = category_turnover_blocks(raw)
     if not blocks:
         raise FileNotFoundError(f" Category turnover cash data not found for : {trade_date}")
+    return category_turnover_frame(blocks)
 
-    data_df = pd.concat(blocks, ignore_index=True)
-    data_df = data_df.rename(
-        columns={
-            "Trade Date": "Trade Date",
-            "Category": "Category",
-            "Client Categories": "Category",
-            "Buy Value in Rs.": "Buy Value in Rs.Crores",
-            "Buy Value in Rs.Crores": "Buy Value in Rs.Crores",
-            "Sell Value in Rs.": "Sell Value in Rs.Crores",
-            "Sell Value in Rs.Crores": "Sell Value in Rs.Crores",
-        }
-    )
-    data_df = data_df[
-        [
-            column
-            for column in [
-                "Trade Date",
-                "Category",
-                "Buy Value in Rs.Crores",
-                "Sell Value in Rs.Crores",
-            ]
-            if column in data_df.columns
-        ]
-    ].copy()
-    data_df["Trade Date"] = pd.to_datetime(data_df["Trade Date"], errors="coerce")
-    data_df["Category"] = data_df["Category"].astype(str).str.strip()
-    data_df = data_df[data_df["Category"].ne("")].copy()
-    for column_name in ["Buy Value in Rs.Crores", "Sell Value in Rs.Crores"]:
-        data_df[column_name] = pd.to_numeric(data_df[column_name], errors="coerce")
-    data_df = data_df.dropna(subset=["Trade Date", "Category"]).reset_index(drop=True)
-    data_df["Net Value in Rs.Crores"] = (
-        data_df["Buy Value in Rs.Crores"] - data_df["Sell Value in Rs.Crores"]
-    )
-    data_df["Trade Date"] = data_df["Trade Date"].dt.strftime("%d-%b-%Y")
-    return data_df
+
+@traced
+def category_turnover_cash_range(from_date: str = None, to_date: str = None, period: str = None,
+                                 max_workers: int = None, checkpoint_dir: str = None, as_generator: bool = False):
+    """
+    get NSE cash market category-wise turnover data of every trading day in the date range, holidays are not
+    requested and days without a file are skipped
+    :param from_date: '17-03-2022' ('dd-mm-YYYY')
+    :param to_date: '17-06-2023' ('dd-mm-YYYY')
+    :param period: use one {'1D': last day data,'1W': for last 7 days data,
+                            '1M': from last month same date, '6M': last 6 month data, '1Y': from last year same date)
+    :param max_workers: number of days to download and parse concurrently, default one after another
+    :param checkpoint_dir: directory to save every downloaded day, an interrupted call resumes from it
+    :param as_generator: True to get a generator of (trade_date, pandas.DataFrame) per day
+    :return: pandas.DataFrame
+    :raise ValueError if the parameter input is not proper
+        Example:
+            from nselib import capital_market
+            df = capital_market.category_turnover_cash_range('01-01-2026', '31-03-2026', max_workers=4)
+    """
+    logger.debug(f"Fetching data for category_turnover_cash_range")
+    validate_date_param(from_date, to_date, period)
+    from_date, to_date = derive_from_and_to_date(from_date=from_date, to_date=to_date, period=period)
+    days = trading_days_between(from_date, to_date)
+    day_frames = fetch_trading_days(category_turnover_cash, days, max_workers=max_workers,
+                                    checkpoint_dir=checkpoint_dir)
+    if as_generator:
+        return day_frames
+    return concat_window_frames([data_df for _, data_df in day_frames])
+
+
+def _var_snapshot(trade_date: datetime, snapshot: str):
+    # the C_VAR1 file of one snapshot (see constants.var_snapshots) as published, with the var_columns names
+    use_date = trade_date.strftime(ddmmyyyy)
+    url = f'https://nsearchives.nseindia.com/archives/nsccl/var/C_VAR1_{use_date}_{var_snapshots[snapshot]}.DAT'
+    request_nse = archive_urlfetch(url, trade_date)
+    if request_nse.status_code != 200:
+        raise FileNotFoundError(f' Data not found, change the trade_date...')
+    return read_archive_csv(BytesIO(request_nse.content), skiprows=1, header=0, names=var_columns)
 
 
+@traced
 def var_begin_day(trade_date: str):
     """
     get the VaR Begin Day data as per the traded date
@@ -756,18 +710,10 @@ def var_begin_day(trade_date: str):
             df = capital_market.var_begin_day('17-03-2022')
     """
     logger.debug(f"Fetching data for var_begin_day")
-    trade_date = datetime.strptime(trade_date, dd_mm_yyyy)
-    use_date = trade_date.strftime(ddmmyyyy)
-    url = f'https://nsearchives.nseindia.com/archives/nsccl/var/C_VAR1_{use_date}_1.DAT'
-    request_nse = nse_urlfetch(url)
-    if request_nse.status_code == 200:
-        var_df = pd.read_csv(BytesIO(request_nse.content), skiprows=1)
-    else:
-        raise FileNotFoundError(f' Data not found, change the trade_date...')
-    var_df.columns = var_columns
-    return var_df
+    return _var_snapshot(datetime.strptime(trade_date, dd_mm_yyyy), 'begin_day')
 
 
+@traced
 def var_1st_intra_day(trade_date: str):
     """
     get the VaR 1st Intra Day data as per the traded date
@@ -778,18 +724,10 @@ def var_1st_intra_day(trade_date: str):
             df = capital_market.var_1st_intra_day('17-03-2022')
     """
     logger.debug(f"Fetching data for var_1st_intra_day")
-    trade_date = datetime.strptime(trade_date, dd_mm_yyyy)
-    use_date = trade_date.strftime(ddmmyyyy)
-    url = f'https://nsearchives.nseindia.com/archives/nsccl/var/C_VAR1_{use_date}_2.DAT'
-    request_nse = nse_urlfetch(url)
-    if request_nse.status_code == 200:
-        var_df = pd.read_csv(BytesIO(request_nse.content), skiprows=1)
-    else:
-        raise FileNotFoundError(f' Data not found, change the trade_date...')
-    var_df.columns = var_columns
-    return var_df
+    return _var_snapshot(datetime.strptime(trade_date, dd_mm_yyyy), '1st_intra_day')
 
 
+@traced
 def var_2nd_intra_day(trade_date: str):
     """
     get the VaR 2nd Intra Day data as per the traded date
@@ -800,18 +738,10 @@ def var_2nd_intra_day(trade_date: str):
             df = capital_market.var_2nd_intra_day('17-03-2022')
     """
     logger.debug(f"Fetching data for var_2nd_intra_day")
-    trade_date = datetime.strptime(trade_date, dd_mm_yyyy)
-    use_date = trade_date.strftime(ddmmyyyy)
-    url = f'https://nsearchives.nseindia.com/archives/nsccl/var/C_VAR1_{use_date}_3.DAT'
-    request_nse = nse_urlfetch(url)
-    if request_nse.status_code == 200:
-        var_df = pd.read_csv(BytesIO(request_nse.content), skiprows=1)
-    else:
-        raise FileNotFoundError(f' Data not found, change the trade_date...')
-    var_df.columns = var_columns
-    return var_df
+    return _var_snapshot(datetime.strptime(trade_date, dd_mm_yyyy), '2nd_intra_day')
 
 
+@traced
 def var_3rd_intra_day(trade_date: str):
     """
     get the VaR 3rd Intra Day data as per the traded date
@@ -822,18 +752,10 @@ def var_3rd_intra_day(trade_date: str):
             df = capital_market.var_3rd_intra_day('17-03-2022')
     """
     logger.debug(f"Fetching data for var_3rd_intra_day")
-    trade_date = datetime.strptime(trade_date, dd_mm_yyyy)
-    use_date = trade_date.strftime(ddmmyyyy)
-    url = f'https://nsearchives.nseindia.com/archives/nsccl/var/C_VAR1_{use_date}_4.DAT'
-    request_nse = nse_urlfetch(url)
-    if request_nse.status_code == 200:
-        var_df = pd.read_csv(BytesIO(request_nse.content), skiprows=1)
-    else:
-        raise FileNotFoundError(f' Data not found, change the trade_date...')
-    var_df.columns = var_columns
-    return var_df
+    return _var_snapshot(datetime.strptime(trade_date, dd_mm_yyyy), '3rd_intra_day')
 
 
+@traced
 def var_4th_intra_day(trade_date: str):
     """
     get the VaR 4th Intra Day data as per the traded date
@@ -844,18 +766,10 @@ def var_4th_intra_day(trade_date: str):
             df = capital_market.var_4th_intra_day('17-03-2022')
     """
     logger.debug(f"Fetching data for var_4th_intra_day")
-    trade_date = datetime.strptime(trade_date, dd_mm_yyyy)
-    use_date = trade_date.strftime(ddmmyyyy)
-    url = f'https://nsearchives.nseindia.com/archives/nsccl/var/C_VAR1_{use_date}_5.DAT'
-    request_nse = nse_urlfetch(url)
-    if request_nse.status_code == 200:
-        var_df = pd.read_csv(BytesIO(request_nse.content), skiprows=1)
-    else:
-        raise FileNotFoundError(f' Data not found, change the trade_date...')
-    var_df.columns = var_columns
-    return var_df
+    return _var_snapshot(datetime.strptime(trade_date, dd_mm_yyyy), '4th_intra_day')
 
 
+@traced
 def var_end_of_day(trade_date: str):
     """
     get the VaR End of Day data as per the traded date
@@ -866,18 +780,76 @@ def var_end_of_day(trade_date: str):
             df = capital_market.var_end_of_day('17-03-2022')
     """
     logger.debug(f"Fetching data for var_end_of_day")
+    return _var_snapshot(datetime.strptime(trade_date, dd_mm_yyyy), 'end_of_day')
+
+
+@traced
+def var_all_snapshots(trade_date: str, max_workers: int = len(var_snapshots)):
+    """
+    get the six VaR snapshots of the traded date (begin day, 1st to 4th intra day and end of day), downloaded
+    concurrently on the shared NSE session, in one long format data frame
+    :param trade_date: eg:'20-06-2023'
+    :param max_workers: number of files to download concurrently, default all six at once
+    :return: pandas data frame with the TradeDate and Snapshot ('begin_day' ... 'end_of_day', an ordered category)
+        columns before the VaR columns, numeric columns as float64. the snapshots not published yet are left out
+    :raise FileNotFoundError if no snapshot of the trade_date is available
+        Example:
+            from nselib import capital_market
+            df = capital_market.var_all_snapshots('17-03-2022')
+    """
+    logger.debug(f"Fetching data for var_all_snapshots")
     trade_date = datetime.strptime(trade_date, dd_mm_yyyy)
-    use_date = trade_date.strftime(ddmmyyyy)
-    url = f'https://nsearchives.nseindia.com/archives/nsccl/var/C_VAR1_{use_date}_6.DAT'
-    request_nse = nse_urlfetch(url)
-    if request_nse.status_code == 200:
-        var_df = pd.read_csv(BytesIO(request_nse.content), skiprows=1)
-    else:
+    snapshots = list(var_snapshots)
+
+    def fetch_snapshot(snapshot):
+        try:
+            return apply_schema(_var_snapshot(trade_date, snapshot), var_schema)
+        except FileNotFoundError:
+            logger.warning(f"VaR {snapshot} file of {trade_date.strftime(dd_mm_yyyy)} not found")
+            return None
+
+    frames = fetch_concurrently(fetch_snapshot, snapshots, max_workers=max_workers)
+    frames = [(snapshot, var_df) for snapshot, var_df in zip(snapshots, frames) if var_df is not None]
+    if not frames:
         raise FileNotFoundError(f' Data not found, change the trade_date...')
-    var_df.columns = var_columns
+    var_df = concat_window_frames([snapshot_df for _, snapshot_df in frames])
+    var_df.insert(0, 'Snapshot', pd.Categorical(
+        np.repeat([snapshot for snapshot, _ in frames], [len(snapshot_df) for _, snapshot_df in frames]),
+        categories=snapshots, ordered=True))
+    var_df.insert(0, 'TradeDate', pd.Timestamp(trade_date).as_unit('ns'))
     return var_df
 
 
+@traced
+def var_all_snapshots_range(from_date: str = None, to_date: str = None, period: str = None,
+                            max_workers: int = None, checkpoint_dir: str = None, as_generator: bool = False):
+    """
+    get the six VaR snapshots (see var_all_snapshots) of every trading day in the date range, holidays are not
+    requested
+    :param from_date: '17-03-2022' ('dd-mm-YYYY')
+    :param to_date: '17-06-2023' ('dd-mm-YYYY')
+    :param period: use one {'1D': last day data,'1W': for last 7 days data,
+                            '1M': from last month same date, '6M': last 6 month data, '1Y': from last year same date)
+    :param max_workers: number of days to download concurrently, default one after another
+    :param checkpoint_dir: directory to save every downloaded day, an interrupted call resumes from it
+    :param as_generator: True to get a generator of (trade_date, pandas.DataFrame) per day
+    :return: pandas.DataFrame
+    :raise ValueError if the parameter input is not proper
+        Example:
+            from nselib import capital_market
+            df = capital_market.var_all_snapshots_range('01-01-2025', '31-03-2025', max_workers=2)
+    """
+    logger.debug(f"Fetching data for var_all_snapshots_range")
+    validate_date_param(from_date, to_date, period)
+    from_date, to_date = derive_from_and_to_date(from_date=from_date, to_date=to_date, period=period)
+    days = trading_days_between(from_date, to_date)
+    day_frames = fetch_trading_days(var_all_snapshots, days, max_workers=max_workers, checkpoint_dir=checkpoint_dir)
+    if as_generator:
+        return day_frames
+    return concat_window_frames([data_df for _, data_df in day_frames])
+
+
+@traced
 def sme_bhav_copy(trade_date: str):
     """
     get the SME bhav copy data as per the traded date
@@ -893,13 +865,14 @@ def sme_bhav_copy(trade_date: str):
     url = f'https://nsearchives.nseindia.com/archives/sme/bhavcopy/sme{use_date}.csv'
     request_bhav = nse_urlfetch(url)
     if request_bhav.status_code == 200:
-        bhav_df = pd.read_csv(BytesIO(request_bhav.content))
+        bhav_df = read_archive_csv(BytesIO(request_bhav.content))
     else:
         raise FileNotFoundError(f' Data not found, change the trade_date...')
     bhav_df.columns = [name.replace(' ', '') for name in bhav_df.columns]
     return bhav_df
 
 
+@traced
 def sme_band_complete(trade_date: str):
     """
     get the SME Band Complete data as per the traded date
@@ -915,13 +888,14 @@ def sme_band_complete(trade_date: str):
     url = f'https://nsearchives.nseindia.com/sme/content/price_band/archieves/sme_bands_complete_{use_date}.csv'
     request_sme = nse_urlfetch(url)
     if request_sme.status_code == 200:
-        sme_df = pd.read_csv(BytesIO(request_sme.content))
+        sme_df = read_archive_csv(BytesIO(request_sme.content))
     else:
         raise FileNotFoundError(f' Data not found, change the trade_date...')
     sme_df.columns = [name.replace(' ', '') for name in sme_df.columns]
     return sme_df
 
 
+@traced
 def week_52_high_low_report(trade_date: str):
     """
     get the 52-Week High Low Report data as per the traded date
@@ -935,20 +909,22 @@ def week_52_high_low_report(trade_date: str):
     trade_date = datetime.strptime(trade_date, dd_mm_yyyy)
     use_date = trade_date.strftime(ddmmyyyy)
     url = f'https://nsearchives.nseindia.com/content/CM_52_wk_High_low_{use_date}.csv'
-    request_nse = nse_urlfetch(url)
+    request_nse = archive_urlfetch(url, trade_date)
     if request_nse.status_code == 200:
-        high_low_df = pd.read_csv(BytesIO(request_nse.content), skiprows=2)
+        high_low_df = read_archive_csv(BytesIO(request_nse.content), skiprows=2)
     else:
         raise FileNotFoundError(f' Data not found, change the trade_date...')
     high_low_df.columns = [name.replace(' ', '') for name in high_low_df.columns]
     return high_low_df
 
 
+@traced
 def financial_results_for_equity(from_date: str = None,
                                  to_date: str = None,
                                  period: str = None,
                                  fo_sec: bool = False,
-                                 fin_period: str = 'Quarterly'):
+                                 fin_period: str = 'Quarterly',
+                                 max_workers: int = None):
 
     """
     get audited and un-auditable financial results for equities. as per
@@ -962,43 +938,49 @@ def financial_results_for_equity(from_date: str = None,
                             '1M': from last month same date,
                             '6M': last 6 month data,
                             '1Y': from last year same date)
-    :return: pandas.DataFrame
+    :param max_workers: number of XBRL filings to download concurrently, default one after another
+    :return: pandas.DataFrame, one row per filing with its xbrl url, a filing which could not be downloaded or
+        parsed has only its error filled. filings already in the XBRL cache (xbrl_cache.configure_xbrl_cache) are
+        not downloaded again
     :raise ValueError if the parameter input is not proper
+        Example:
+            from nselib import capital_market
+            df = capital_market.financial_results_for_equity(period='1W', max_workers=8)
     """
     master_data_df, headers, ns, keys_to_extract = get_financial_results_master(from_date, to_date, period,
                                                                                 fo_sec, fin_period)
-    fin_df, df = pd.DataFrame(), pd.DataFrame()
-    for row in master_data_df.itertuples(index=False):
-        try:
-            # Fetch the XML content
-            response_ = requests.get(row.xbrl, headers=headers)
-            response_.raise_for_status()  # Check for HTTP errors
-
-            # Parse the XML content
-            root = ET.fromstring(response_.content)
-
-            # Extract values
-            extracted_data = {}
-            for key in keys_to_extract:
-                elem_ = root.find(f".//in-bse-fin:{key}", ns)
-                extracted_data[key] = elem_.text if elem_ is not None else None
-
-            # Convert to Pandas DataFrame
-            df = pd.DataFrame([extracted_data])
-        except requests.exceptions.RequestException as e:
-            raise requests.exceptions.RequestException(f"Request failed: {e}") from e
-        except ET.ParseError as e:
-            raise ET.ParseError(f"XML parsing failed: {e}") from e
-        except Exception as e:
-            raise RuntimeError(f"An error occurred: {e}") from e
-
-        if fin_df.empty:
-            fin_df = df
+    keys_to_extract = list(dict.fromkeys(keys_to_extract))
+    columns = keys_to_extract + ['xbrl', 'error']
+    if master_data_df.empty:
+        return pd.DataFrame(columns=columns)
+    xbrl_urls = master_data_df['xbrl'].tolist()
+    # filings never change once filed, only the ones missing from the XBRL cache are downloaded
+    cache = get_xbrl_cache() if archive_cache.cache_mode() != 'bypass' else None
+    cached = {}
+    if cache is not None and archive_cache.cache_mode() == 'use':
+        cached = cache.get_many(xbrl_urls, keys_to_extract)
+        logger.debug(f"{len(cached)} of {len(xbrl_urls)} financial results served from the XBRL cache")
+
+    def fetch_filing(xbrl_url):
+        if xbrl_url in cached:
+            nse_trace.emit('fetch', url=xbrl_url, status_code=200, cached=True)
+            record, error = {key: cached[xbrl_url][key] for key in keys_to_extract}, None
         else:
-            fin_df = pd.concat([fin_df, df], ignore_index=True)
-    return fin_df
+            try:
+                record, error = get_xbrl_financial_result(xbrl_url, ns, keys_to_extract), None
+            except (requests.exceptions.RequestException, ET.ParseError, NSEdataNotFound) as e:
+                logger.warning(f"Financial result {xbrl_url} failed. Error: {e}")
+                record, error = dict.fromkeys(keys_to_extract), repr(e)
+            else:
+                if cache is not None:
+                    cache.set(xbrl_url, record)
+        return {**record, 'xbrl': xbrl_url, 'error': error}
 
+    records = fetch_concurrently(fetch_filing, xbrl_urls, max_workers=max_workers)
+    return pd.DataFrame(records, columns=columns)
 
+
+@traced
 def corporate_bond_trade_report(trade_date: str):
     """
     get the NSE corporate bond trade report as per the traded date
@@ -1012,9 +994,9 @@ def corporate_bond_trade_report(trade_date: str):
     trade_date = datetime.strptime(trade_date, dd_mm_yyyy)
     use_date = trade_date.strftime(ddmmyy)
     url = f'https://nsearchives.nseindia.com/archives/equities/corpbond/corpbond{use_date}.csv'
-    request_bhav = nse_urlfetch(url)
+    request_bhav = archive_urlfetch(url, trade_date)
     if request_bhav.status_code == 200:
-        bond_df = pd.read_csv(BytesIO(request_bhav.content))
+        bond_df = read_archive_csv(BytesIO(request_bhav.content))
     else:
         raise FileNotFoundError(f' Data not found, change the trade_date...')
     bond_df.columns = [name.replace(' ', '') for name in bond_df.columns]
@@ -1022,6 +1004,7 @@ def corporate_bond_trade_report(trade_date: str):
     return bond_df
 
 
+@traced
 def pe_ratio(trade_date: str):
     """
     get the NSE pe ratio for all NSE equities data as per the traded date
@@ -1035,15 +1018,16 @@ def pe_ratio(trade_date: str):
     trade_date = datetime.strptime(trade_date, dd_mm_yyyy)
     use_date = trade_date.strftime(ddmmyy)
     url = f'https://nsearchives.nseindia.com/content/equities/peDetail/PE_{use_date}.csv'
-    request_bhav = nse_urlfetch(url)
+    request_bhav = archive_urlfetch(url, trade_date)
     if request_bhav.status_code == 200:
-        pe_df = pd.read_csv(BytesIO(request_bhav.content))
+        pe_df = read_archive_csv(BytesIO(request_bhav.content))
     else:
         raise FileNotFoundError(f' Data not found, change the trade_date...')
     pe_df.columns = [name.replace(' ', '') for name in pe_df.columns]
     return pe_df
 
 
+@traced
 def corporate_actions_for_equity(from_date: str = None,
                                  to_date: str = None,
                                  period: str = None,
@@ -1081,6 +1065,7 @@ def corporate_actions_for_equity(from_date: str = None,
     return master_data_df
 
 
+@traced
 def event_calendar_for_equity(from_date: str = None,
                               to_date: str = None,
                               period: str = None,
@@ -1118,6 +1103,7 @@ def event_calendar_for_equity(from_date: str = None,
     return master_data_df
 
 
+@traced
 def top_gainers_or_losers(to_get: str = 'gainers'):
     """
     get top gainers or losers on live market, after market hour it will get as per last traded value
@@ -1144,6 +1130,7 @@ def top_gainers_or_losers(to_get: str = 'gainers'):
     return gainers_losers_df
 
 
+@traced
 def most_active_equities(fetch_by: str = 'value'):
     """
     to get most active equities fetched by value/volume in live market, after market hour it will get as per last traded value
@@ -1167,6 +1154,7 @@ def most_active_equities(fetch_by: str = 'value'):
     return data_df
 
 
+@traced
 def total_traded_stocks():
     """
     to get all total traded stocks detail in live market, after market hour it will get as per last traded value
@@ -1249,6 +1237,7 @@ def _business_growth_cm_segment_dataframe(data_json):
     return data_df
 
 
+@traced
 def business_growth_cm_segment(data_type: str = "yearly",
                                from_year: str = None,
                                to_year: str = None,
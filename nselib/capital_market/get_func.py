@@ -1,17 +1,15 @@
 import json
 import logging
+import xml.etree.ElementTree as ET
 from io import BytesIO, StringIO
 
 import pandas as pd
-import requests
 
 from nselib.constants import india_vix_data_column, index_data_columns
 from nselib.errors import NSEdataNotFound
 from nselib.libutil import (
     cleaning_column_name,
-    default_header,
     derive_from_and_to_date,
-    header,
     nse_urlfetch,
     validate_date_param,
 )
@@ -290,11 +288,7 @@ def _get_business_growth_cm_segment_data(api_path: str) -> dict:
     origin_url = "https://www.nseindia.com/market-data/business-growth-cm-segment"
     url = f"https://www.nseindia.com{api_path}"
     try:
-        r_session = requests.session()
-        r_session.trust_env = False
-        nse_live = r_session.get(origin_url, headers=default_header)
-        cookies = nse_live.cookies
-        data_json = r_session.get(url, headers=header, cookies=cookies).json()
+        data_json = nse_urlfetch(url, origin_url=origin_url, trust_env=False).json()
     except Exception as e:
         logger.error(f"Failed to fetch data: {e}", exc_info=e)
         raise NSEdataNotFound(f" Resource not available MSG: {e}")
@@ -360,6 +354,9 @@ def get_business_growth_cm_segment_daily(month: str, year: str) -> dict:
     )
 
 
+financial_results_origin_url = "https://www.nseindia.com/companies-listing/corporate-filings-financial-results"
+
+
 def get_financial_results_master(
     from_date: str = None,
     to_date: str = None,
@@ -391,9 +388,6 @@ def get_financial_results_master(
     from_date, to_date = derive_from_and_to_date(
         from_date=from_date, to_date=to_date, period=period
     )
-    origin_url = (
-        "https://www.nseindia.com/companies-listing/corporate-filings-financial-results"
-    )
     url_ = "https://www.nseindia.com/api/corporates-financial-results?index=equities&"
     if fo_sec:
         payload = (
@@ -401,7 +395,7 @@ def get_financial_results_master(
         )
     else:
         payload = f"from_date={from_date}&to_date={to_date}&period={fin_period}"
-    data_text = nse_urlfetch(url_ + payload, origin_url=origin_url)
+    data_text = nse_urlfetch(url_ + payload, origin_url=financial_results_origin_url)
     if data_text.status_code != 200:
         raise NSEdataNotFound(
             f" Resource not available for financial data with these parameters"
@@ -494,6 +488,68 @@ def get_financial_results_master(
     return master_data_df, headers, ns, keys_to_extract
 
 
+def parse_xbrl_financial_result(content: bytes, ns: dict, keys_to_extract: list) -> dict:
+    """
+    Extract the values of keys_to_extract from an XBRL financial result filing, in one streaming pass over the
+    document: the elements are dropped as soon as they are read and the pass stops once every key is found.
+
+    Args:
+        content (bytes): The XBRL instance document.
+        ns (dict): The XML namespaces, from get_financial_results_master.
+        keys_to_extract (list): The in-bse-fin element names, from get_financial_results_master.
+
+    Returns:
+        dict: key -> text of its first element, None for the keys missing from the filing.
+
+    Raises:
+        xml.etree.ElementTree.ParseError: If content is not valid XML.
+    """
+    namespace = ns["in-bse-fin"]
+    wanted = {f"{{{namespace}}}{key}": key for key in keys_to_extract}
+    extracted_data = dict.fromkeys(keys_to_extract)
+    found = set()
+    root, depth = None, 0
+    for event, elem in ET.iterparse(BytesIO(content), events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+            depth += 1
+            continue
+        depth -= 1
+        key = wanted.get(elem.tag)
+        if key is not None and key not in found:
+            extracted_data[key] = elem.text
+            found.add(key)
+            if len(found) == len(wanted):
+                break
+        if depth == 1:
+            # a top level fact (or context, unit, ...) is complete, nothing of it is needed anymore
+            root.clear()
+    return extracted_data
+
+
+def get_xbrl_financial_result(xbrl_url: str, ns: dict, keys_to_extract: list) -> dict:
+    """
+    Fetch one XBRL financial result filing with the pooled NSE client and extract the values of keys_to_extract.
+
+    Args:
+        xbrl_url (str): The xbrl URL of a row of the financial results master.
+        ns (dict): The XML namespaces, from get_financial_results_master.
+        keys_to_extract (list): The in-bse-fin element names, from get_financial_results_master.
+
+    Returns:
+        dict: key -> text of its element, None for the keys missing from the filing.
+
+    Raises:
+        NSEdataNotFound: If the filing can not be downloaded.
+        xml.etree.ElementTree.ParseError: If the filing is not valid XML.
+    """
+    response = nse_urlfetch(xbrl_url, origin_url=financial_results_origin_url)
+    if response.status_code != 200:
+        raise NSEdataNotFound(f" XBRL filing not available, status code {response.status_code}")
+    return parse_xbrl_financial_result(response.content, ns, keys_to_extract)
+
+
 def get_top_gainers_or_losers(to_get: str) -> dict:
     """
     Fetch top gainers or losers for a given index.
@@ -41,6 +41,24 @@ future_price_volume_data_column = ['TIMESTAMP', 'INSTRUMENT', 'SYMBOL', 'EXPIRY_
                                    'LAST_TRADED_PRICE', 'PREV_CLS', 'SETTLE_PRICE', 'TOT_TRADED_QTY', 'TOT_TRADED_VAL',
                                    'OPEN_INT', 'CHANGE_IN_OI', 'MARKET_LOT', 'UNDERLYING_VALUE']
 
+# ---------- dtype schemas -----------------
+# category: low cardinality text columns, dates: parsed with date_format, int32: counts which always fit in it.
+# Prices and values stay float64, float32 would round them to about 7 digits.
+
+udiff_bhavcopy_schema = {
+    'category': ['Sgmt', 'Src', 'FinInstrmTp', 'TckrSymb', 'SctySrs', 'OptnTp', 'SsnId'],
+    'dates': ['TradDt', 'BizDt', 'XpryDt', 'FininstrmActlXpryDt'],
+    'date_format': '%Y-%m-%d',
+    'int32': ['FinInstrmId', 'TtlNbOfTxsExctd', 'NewBrdLotQty'],
+}
+
+sec_bhavdata_full_schema = {
+    'category': ['SYMBOL', 'SERIES'],
+    'dates': ['DATE1'],
+    'date_format': '%d-%b-%Y',
+    'int32': ['NO_OF_TRADES'],
+}
+
 india_vix_data_column = ['TIMESTAMP', 'INDEX_NAME', 'OPEN_INDEX_VAL', 'CLOSE_INDEX_VAL', 'HIGH_INDEX_VAL',
                          'LOW_INDEX_VAL', 'PREV_CLOSE', 'VIX_PTS_CHG', 'VIX_PERC_CHG']
 
@@ -49,3 +67,13 @@ index_data_columns = ['INDEX_NAME', 'OPEN_INDEX_VAL', 'HIGH_INDEX_VAL', 'CLOSE_I
 
 var_columns = ['RecordType', 'Symbol', 'Series', 'Isin', 'SecurityVaR', 'IndexVaR', 'VaRMargin',
                'ExtremeLossRate', 'AdhocMargin', 'ApplicableMarginRate']
+
+# VaR snapshot name -> number of its C_VAR1_{ddmmyyyy}_{n}.DAT file, in publishing order
+var_snapshots = {'begin_day': 1, '1st_intra_day': 2, '2nd_intra_day': 3, '3rd_intra_day': 4, '4th_intra_day': 5,
+                 'end_of_day': 6}
+
+var_schema = {
+    'category': ['Symbol', 'Series'],
+    'float64': ['SecurityVaR', 'IndexVaR', 'VaRMargin', 'ExtremeLossRate', 'AdhocMargin', 'ApplicableMarginRate'],
+    'int32': ['RecordType'],
+}
@@ -0,0 +1,128 @@
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COOKIE_TTL = 300
+
+
+class CookieCache:
+    """
+    Cookies harvested from NSE origin pages, keyed by origin_url.
+
+    Entries live in memory for ttl seconds (or until the earliest cookie expiry, whichever comes first) and,
+    when a path is given, are also written to that JSON file so other processes can reuse them.
+
+    Example:
+            from nselib import cookie_cache
+            cookie_cache.configure_cookie_cache(ttl=600, path='/tmp/nselib_cookies.json')
+    """
+
+    def __init__(self, ttl: float = DEFAULT_COOKIE_TTL, path: str = None):
+        self.ttl = ttl
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries = {}
+        if path:
+            self._entries = self._load()
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as fh:
+                return json.load(fh)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable cookie cache {self.path}: {e}")
+            return {}
+
+    def _dump(self):
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as fh:
+                json.dump(self._entries, fh)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.debug(f"Could not write cookie cache {self.path}: {e}")
+
+    def get(self, origin_url: str):
+        """
+        Get the cached cookies of origin_url as a list of dicts, None when missing or stale.
+        """
+        with self._lock:
+            entry = self._entries.get(origin_url)
+            if entry is None and self.path:
+                # another process may have refreshed the file since we loaded it
+                self._entries.update(self._load())
+                entry = self._entries.get(origin_url)
+            if entry is None:
+                return None
+            if time.time() >= entry["expires_at"]:
+                self._entries.pop(origin_url, None)
+                return None
+            return entry["cookies"]
+
+    def set(self, origin_url: str, cookie_jar):
+        """
+        Store the cookies of the origin_url response.
+        """
+        cookies = [
+            {
+                "name": cookie.name,
+                "value": cookie.value,
+                "domain": cookie.domain,
+                "path": cookie.path,
+                "expires": cookie.expires,
+                "secure": cookie.secure,
+            }
+            for cookie in cookie_jar
+        ]
+        now = time.time()
+        expires_at = now + self.ttl
+        cookie_expiry = [cookie["expires"] for cookie in cookies if cookie["expires"]]
+        if cookie_expiry:
+            expires_at = min(expires_at, min(cookie_expiry))
+        with self._lock:
+            self._entries[origin_url] = {"fetched_at": now, "expires_at": expires_at, "cookies": cookies}
+            self._dump()
+
+    def invalidate(self, origin_url: str):
+        with self._lock:
+            if self._entries.pop(origin_url, None) is not None:
+                self._dump()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._dump()
+
+
+_cookie_cache = CookieCache()
+
+
+def get_cookie_cache() -> CookieCache:
+    """
+    Get the process wide cookie cache used by the NSE client.
+    """
+    return _cookie_cache
+
+
+def configure_cookie_cache(ttl: float = DEFAULT_COOKIE_TTL, path: str = None) -> CookieCache:
+    """
+    Replace the process wide cookie cache.
+
+    Args:
+        ttl (float, optional): Seconds a harvested cookie set is reused. Defaults to 300.
+        path (str, optional): JSON file to persist the cookies between processes. Defaults to in-memory only.
+
+    Returns:
+        CookieCache: The new cache.
+    """
+    global _cookie_cache
+    _cookie_cache = CookieCache(ttl=ttl, path=path)
+    return _cookie_cache
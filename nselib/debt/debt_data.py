@@ -5,10 +5,12 @@ from io import BytesIO
 import pandas as pd
 
 from nselib.libutil import nse_urlfetch
+from nselib.trace import traced
 
 logger = logging.getLogger(__name__)
 
 
+@traced
 def securities_available_for_trading(trade_date: str) -> pd.DataFrame:
     """
     Get securities available for trading.
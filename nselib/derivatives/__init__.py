@@ -1,5 +1,6 @@
-from .derivative_data import future_price_volume_data, option_price_volume_data, fno_bhav_copy, \
+from .derivative_data import future_price_volume_data, option_price_volume_data, fno_bhav_copy, fno_bhav_copy_range, \
     participant_wise_open_interest, participant_wise_trading_volume, expiry_dates_future, expiry_dates_option_index,\
     nse_live_option_chain, fii_derivatives_statistics, fno_security_in_ban_period, live_most_active_underlying, \
-    daily_volatility, category_turnover_fo, \
+    daily_volatility, category_turnover_fo, category_turnover_fo_range, \
     business_growth_fo_segment
+from .option_chain_stream import OptionChainStream
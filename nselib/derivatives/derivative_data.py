@@ -1,19 +1,21 @@
-from nselib.libutil import header
-from nselib.libutil import default_header
 import logging
 import numpy as np
 import pandas as pd
-import zipfile
-import requests
 from datetime import datetime, timedelta
 from io import BytesIO
 from typing import Optional
 
-from nselib.constants import ddmmyy
+from nselib.constants import ddmmyy, udiff_bhavcopy_schema
 from nselib.derivatives.get_func import (
+    archive_download,
+    archive_urlfetch,
+    category_turnover_blocks,
+    category_turnover_frame,
     cleaning_nse_symbol,
+    concat_window_frames,
     dd_mm_yyyy,
     derive_from_and_to_date,
+    fetch_trading_days,
     future_price_volume_data_column,
     get_business_growth_fo_segment_daily,
     get_business_growth_fo_segment_monthly,
@@ -23,6 +25,9 @@ from nselib.derivatives.get_func import (
     get_option_price_volume_data,
     indices_list,
     nse_urlfetch,
+    read_archive_csv,
+    read_zipped_csv,
+    trading_days_between,
     validate_date_param,
     validate_param_from_list,
 )
@@ -31,10 +36,12 @@ from nselib.errors import (
     NSEdataNotFound,
     NSEApiError,
 )
+from nselib.trace import traced
 
 logger = logging.getLogger(__name__)
 
 
+@traced
 def future_price_volume_data(
     symbol: str,
     instrument: str,
@@ -76,7 +83,7 @@ def future_price_volume_data(
     from_date, to_date = derive_from_and_to_date(
         from_date=from_date, to_date=to_date, period=period
     )
-    nse_df = pd.DataFrame(columns=future_price_volume_data_column)
+    frames = []
     from_date = datetime.strptime(from_date, dd_mm_yyyy)
     to_date = datetime.strptime(to_date, dd_mm_yyyy)
     load_days = (to_date - from_date).days
@@ -92,14 +99,13 @@ def future_price_volume_data(
         )
         from_date = from_date + timedelta(91)
         load_days = (to_date - from_date).days
-        if nse_df.empty:
-            nse_df = data_df
-        else:
-            nse_df = pd.concat([nse_df, data_df], ignore_index=True)
+        frames.append(data_df)
+    nse_df = concat_window_frames(frames, columns=future_price_volume_data_column)
     logger.debug(f"Aggregated {len(nse_df)} records for {symbol} futures.")
     return nse_df
 
 
+@traced
 def option_price_volume_data(
     symbol: str,
     instrument: str,
@@ -150,7 +156,7 @@ def option_price_volume_data(
     from_date, to_date = derive_from_and_to_date(
         from_date=from_date, to_date=to_date, period=period
     )
-    nse_df = pd.DataFrame(columns=future_price_volume_data_column)
+    frames = []
     from_date = datetime.strptime(from_date, dd_mm_yyyy)
     to_date = datetime.strptime(to_date, dd_mm_yyyy)
     load_days = (to_date - from_date).days
@@ -169,17 +175,16 @@ def option_price_volume_data(
                 from_date=start_date,
                 to_date=end_date,
             )
-            if nse_df.empty:
-                nse_df = data_df
-            else:
-                nse_df = pd.concat([nse_df, data_df], ignore_index=True)
+            frames.append(data_df)
         from_date = from_date + timedelta(91)
         load_days = (to_date - from_date).days
+    nse_df = concat_window_frames(frames, columns=future_price_volume_data_column)
 
     logger.debug(f"Aggregated {len(nse_df)} records for {symbol} options.")
     return nse_df
 
 
+@traced
 def fno_bhav_copy(trade_date: str) -> pd.DataFrame:
     """
     Fetch the new CM-UDiFF Common NSE future and options bhav copy.
@@ -204,27 +209,22 @@ def fno_bhav_copy(trade_date: str) -> pd.DataFrame:
     )
     url = "https://nsearchives.nseindia.com/content/fo/BhavCopy_NSE_FO_0_0_0_"
     payload = f"{str(trade_date.strftime('%Y%m%d'))}_F_0000.csv.zip"
-    request_bhav = nse_urlfetch(url + payload)
+    csv_name = payload[: -len(".zip")]
+    status_code, bhav_file = archive_download(url + payload, trade_date)
     bhav_df = pd.DataFrame()
-    if request_bhav.status_code == 200:
-        zip_bhav = zipfile.ZipFile(BytesIO(request_bhav.content), "r")
-        for file_name in zip_bhav.filelist:
-            if file_name:
-                bhav_df = pd.read_csv(zip_bhav.open(file_name))
-    elif request_bhav.status_code == 403:
+    if status_code == 200:
+        bhav_df = read_zipped_csv(bhav_file, csv_name, udiff_bhavcopy_schema)
+    elif status_code == 403:
         url2 = (
             "https://www.nseindia.com/api/reports?archives="
             "%5B%7B%22name%22%3A%22F%26O%20-%20Bhavcopy(csv)%22%2C%22type%22%3A%22archives%22%2C%22category%22"
             f"%3A%22derivatives%22%2C%22section%22%3A%22equity%22%7D%5D&date={str(trade_date.strftime('%d-%b-%Y'))}"
             f"&type=equity&mode=single"
         )
-        request_bhav = nse_urlfetch(url2)
-        if request_bhav.status_code == 200:
-            zip_bhav = zipfile.ZipFile(BytesIO(request_bhav.content), "r")
-            for file_name in zip_bhav.filelist:
-                if file_name:
-                    bhav_df = pd.read_csv(zip_bhav.open(file_name))
-        elif request_bhav.status_code == 403:
+        status_code, bhav_file = archive_download(url2, trade_date)
+        if status_code == 200:
+            bhav_df = read_zipped_csv(bhav_file, csv_name, udiff_bhavcopy_schema)
+        elif status_code == 403:
             logger.error(
                 f"F&O Bhavcopy data not found for {trade_date.strftime('%d-%m-%Y')}"
             )
@@ -235,6 +235,49 @@ def fno_bhav_copy(trade_date: str) -> pd.DataFrame:
     return bhav_df
 
 
+@traced
+def fno_bhav_copy_range(
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    period: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    checkpoint_dir: Optional[str] = None,
+    as_generator: bool = False,
+):
+    """
+    Fetch the F&O bhav copy of every trading day in a date range.
+
+    Holidays and weekends are taken from the NSE calendar and never requested, days without a bhav copy are skipped.
+
+    Args:
+        from_date (str, optional): The start date in 'dd-mm-YYYY' format.
+        to_date (str, optional): The end date in 'dd-mm-YYYY' format.
+        period (str, optional): A predefined period (e.g., '1D', '1W', '1M', '6M', '1Y').
+        max_workers (int, optional): Number of days downloaded at the same time. Defaults to one at a time.
+        checkpoint_dir (str, optional): Directory where every downloaded day is saved, an interrupted backfill
+            resumes from it when called again with the same directory. Defaults to no checkpoint.
+        as_generator (bool, optional): True to get a generator of (trade_date, DataFrame) per day instead of one
+            DataFrame. Defaults to False.
+
+    Returns:
+        pd.DataFrame: The bhav copies of all the days, in date order (a generator when as_generator is True).
+
+    Example:
+            from nselib import derivatives
+            df = derivatives.fno_bhav_copy_range(from_date='01-01-2025', to_date='31-03-2025', max_workers=4,
+                                                 checkpoint_dir='fo_bhav_checkpoint')
+    """
+    validate_date_param(from_date, to_date, period)
+    from_date, to_date = derive_from_and_to_date(from_date=from_date, to_date=to_date, period=period)
+    days = trading_days_between(from_date, to_date)
+    logger.debug(f"Fetching F&O Bhavcopy for {len(days)} trading days from {from_date} to {to_date}")
+    day_frames = fetch_trading_days(fno_bhav_copy, days, max_workers=max_workers, checkpoint_dir=checkpoint_dir)
+    if as_generator:
+        return day_frames
+    return concat_window_frames([data_df for _, data_df in day_frames])
+
+
+@traced
 def participant_wise_open_interest(trade_date: str) -> pd.DataFrame:
     """
     Fetch FII, DII, Pro, and Client-wise participant Open Interest (OI) data for a given trade date.
@@ -258,10 +301,10 @@ def participant_wise_open_interest(trade_date: str) -> pd.DataFrame:
     )
     url = f"https://nsearchives.nseindia.com/content/nsccl/fao_participant_oi_{str(trade_date.strftime('%d%m%Y'))}.csv"
     # payload = f"{str(for_date.strftime('%d%m%Y'))}.csv"
-    file_chk = nse_urlfetch(url)
+    file_chk = archive_urlfetch(url, trade_date)
     if file_chk.status_code == 404:
         url = f"https://archives.nseindia.com/content/nsccl/fao_participant_oi_{str(trade_date.strftime('%d%m%Y'))}.csv"
-        file_chk = nse_urlfetch(url)
+        file_chk = archive_urlfetch(url, trade_date)
     if file_chk.status_code != 200:
         logger.error(
             f"Participant-wise open interest data not found for {trade_date.strftime('%d-%m-%Y')}"
@@ -269,7 +312,7 @@ def participant_wise_open_interest(trade_date: str) -> pd.DataFrame:
         raise NSEdataNotFound(f"No data available for : {trade_date}")
     try:
         # data_df = pd.read_csv(url, engine='python', sep=',', quotechar='"', on_bad_lines='skip', skiprows=1)
-        data_df = pd.read_csv(
+        data_df = read_archive_csv(
             BytesIO(file_chk.content), on_bad_lines="skip", skiprows=1
         )
     except Exception as e:
@@ -277,7 +320,7 @@ def participant_wise_open_interest(trade_date: str) -> pd.DataFrame:
             f"Error while fetching participant wise open interest data: {e}",
             exc_info=e,
         )
-        data_df = pd.read_csv(
+        data_df = read_archive_csv(
             BytesIO(file_chk.content), on_bad_lines="skip", skiprows=1
         )
         data_df.drop(data_df.tail(1).index, inplace=True)
@@ -285,6 +328,7 @@ def participant_wise_open_interest(trade_date: str) -> pd.DataFrame:
     return data_df
 
 
+@traced
 def participant_wise_trading_volume(trade_date: str) -> pd.DataFrame:
     """
     Fetch FII, DII, Pro, and Client-wise participant trading volume data for a given trade date.
@@ -315,7 +359,7 @@ def participant_wise_trading_volume(trade_date: str) -> pd.DataFrame:
         )
         raise NSEdataNotFound(f"No data available for : {trade_date}")
     try:
-        data_df = pd.read_csv(
+        data_df = read_archive_csv(
             BytesIO(file_chk.content), on_bad_lines="skip", skiprows=1
         )
     except Exception as e:
@@ -323,7 +367,7 @@ def participant_wise_trading_volume(trade_date: str) -> pd.DataFrame:
             f"Error while fetching participant wise trading volume data: {e}",
             exc_info=e,
         )
-        data_df = pd.read_csv(
+        data_df = read_archive_csv(
             BytesIO(file_chk.content),
             engine="c",
             sep=",",
@@ -336,6 +380,7 @@ def participant_wise_trading_volume(trade_date: str) -> pd.DataFrame:
     return data_df
 
 
+@traced
 def daily_volatility(trade_date: str):
     """
     get F&O daily volatility report as per the traded date provided
@@ -356,17 +401,13 @@ def daily_volatility(trade_date: str):
     last_status_code = None
     for url in report_urls:
         # NSE archive requests can fail behind stale local proxy settings, so fetch this report
-        # with a session that ignores environment proxies while preserving the usual cookie flow.
-        r_session = requests.session()
-        r_session.trust_env = False
-        nse_live = r_session.get(origin_url, headers=default_header)
-        cookies = nse_live.cookies
-        report = r_session.get(url, headers=header, cookies=cookies)
+        # with the client that ignores environment proxies while preserving the usual cookie flow.
+        report = nse_urlfetch(url, origin_url=origin_url, trust_env=False)
         last_status_code = report.status_code
         if report.status_code != 200:
             continue
         try:
-            data_df = pd.read_csv(BytesIO(report.content), skipinitialspace=True)
+            data_df = read_archive_csv(BytesIO(report.content), skipinitialspace=True)
         except Exception as exc:
             raise FileNotFoundError(
                 f" Daily volatility data not found for : {trade_date.strftime(dd_mm_yyyy)} :: NSE error : {exc}"
@@ -379,6 +420,7 @@ def daily_volatility(trade_date: str):
     )
 
 
+@traced
 def category_turnover_fo(trade_date: str) -> pd.DataFrame:
     """
     Fetch NSE derivatives category-wise turnover data for a given trade date.
@@ -409,76 +451,61 @@ def category_turnover_fo(trade_date: str) -> pd.DataFrame:
         raise NSEdataNotFound(f"No data available for : {trade_date}")
 
     raw = pd.read_excel(BytesIO(file_chk.content), header=None, engine="xlrd")
-    header_row = None
-    for index in range(min(len(raw), 16)):
-        first = str(raw.iloc[index, 0]).strip()
-        second = str(raw.iloc[index, 1]).strip() if raw.shape[1] > 1 else ""
-        if first.lower() == "trade date" and second.lower() in {
-            "category",
-            "client categories",
-        }:
-            header_row = index
-            break
-    if header_row is None:
+    blocks = category_turnover_blocks(raw)
+    if not blocks:
         logger.error(
             f"Could not locate header row in category turnover data for {trade_date.strftime('%d-%m-%Y')}"
         )
         raise NSEdataNotFound(f"Category turnover FO data not found for : {trade_date}")
+    # the derivatives sheet has one table
+    return category_turnover_frame(blocks[:1])
 
-    headers = [str(value).strip() for value in raw.iloc[header_row, :4].tolist()]
-    end_row = header_row + 1
-    while end_row < len(raw.index):
-        first_value = raw.iloc[end_row, 0] if raw.shape[1] > 0 else None
-        second_value = raw.iloc[end_row, 1] if raw.shape[1] > 1 else None
-        first_text = str(first_value).strip() if first_value is not None else ""
-        second_text = str(second_value).strip() if second_value is not None else ""
-        if (
-            first_value is None
-            or (isinstance(first_value, float) and pd.isna(first_value))
-            or first_text.lower().startswith("note")
-            or first_text.lower().startswith("notes")
-            or first_text.lower() == "trade date"
-            or second_text.lower() in {"category", "client categories"}
-        ):
-            break
-        end_row += 1
-
-    data_df = raw.iloc[header_row + 1 : end_row, :4].copy()
-    data_df.columns = headers
-    data_df = data_df.rename(
-        columns={
-            "Trade Date": "Trade Date",
-            "Category": "Category",
-            "Client Categories": "Category",
-            "Buy Value in Rs.Crores": "Buy Value in Rs.Crores",
-            "Sell Value in Rs.Crores": "Sell Value in Rs.Crores",
-        }
-    )
-    data_df = data_df[
-        [
-            column
-            for column in [
-                "Trade Date",
-                "Category",
-                "Buy Value in Rs.Crores",
-                "Sell Value in Rs.Crores",
-            ]
-            if column in data_df.columns
-        ]
-    ].copy()
-    data_df["Trade Date"] = pd.to_datetime(data_df["Trade Date"], errors="coerce")
-    data_df["Category"] = data_df["Category"].astype(str).str.strip()
-    data_df = data_df[data_df["Category"].ne("")].copy()
-    for column_name in ["Buy Value in Rs.Crores", "Sell Value in Rs.Crores"]:
-        data_df[column_name] = pd.to_numeric(data_df[column_name], errors="coerce")
-    data_df = data_df.dropna(subset=["Trade Date", "Category"]).reset_index(drop=True)
-    data_df["Net Value in Rs.Crores"] = (
-        data_df["Buy Value in Rs.Crores"] - data_df["Sell Value in Rs.Crores"]
-    )
-    data_df["Trade Date"] = data_df["Trade Date"].dt.strftime("%d-%b-%Y")
-    return data_df
 
+@traced
+def category_turnover_fo_range(
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    period: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    checkpoint_dir: Optional[str] = None,
+    as_generator: bool = False,
+):
+    """
+    Fetch the derivatives category-wise turnover of every trading day in a date range.
+
+    Holidays and weekends are taken from the NSE calendar and never requested, days without a file are skipped.
 
+    Args:
+        from_date (str, optional): The start date in 'dd-mm-YYYY' format.
+        to_date (str, optional): The end date in 'dd-mm-YYYY' format.
+        period (str, optional): A predefined period (e.g., '1D', '1W', '1M', '6M', '1Y').
+        max_workers (int, optional): Number of days downloaded and parsed at the same time. Defaults to one at a
+            time.
+        checkpoint_dir (str, optional): Directory where every downloaded day is saved, an interrupted backfill
+            resumes from it when called again with the same directory. Defaults to no checkpoint.
+        as_generator (bool, optional): True to get a generator of (trade_date, DataFrame) per day instead of one
+            DataFrame. Defaults to False.
+
+    Returns:
+        pd.DataFrame: The category-wise turnover of all the days, in date order (a generator when as_generator is
+            True).
+
+    Example:
+            from nselib import derivatives
+            df = derivatives.category_turnover_fo_range(from_date='01-01-2026', to_date='31-03-2026', max_workers=4)
+    """
+    validate_date_param(from_date, to_date, period)
+    from_date, to_date = derive_from_and_to_date(from_date=from_date, to_date=to_date, period=period)
+    days = trading_days_between(from_date, to_date)
+    logger.debug(f"Fetching category-wise turnover for {len(days)} trading days from {from_date} to {to_date}")
+    day_frames = fetch_trading_days(category_turnover_fo, days, max_workers=max_workers,
+                                    checkpoint_dir=checkpoint_dir)
+    if as_generator:
+        return day_frames
+    return concat_window_frames([data_df for _, data_df in day_frames])
+
+
+@traced
 def fii_derivatives_statistics(trade_date: str) -> pd.DataFrame:
     """
     Fetch specific FII derivatives statistics for a given trade date.
@@ -528,6 +555,7 @@ def fii_derivatives_statistics(trade_date: str) -> pd.DataFrame:
     return bhav_df
 
 
+@traced
 def expiry_dates_future() -> list:
     """
     Fetch the list of valid expiry dates for futures contracts.
@@ -548,6 +576,7 @@ def expiry_dates_future() -> list:
     return payload["expiryDates"]
 
 
+@traced
 def expiry_dates_option_index() -> dict:
     """
     Fetch the valid future and option expiry dates mapped to their underlying stock or index.
@@ -572,6 +601,104 @@ def expiry_dates_option_index() -> dict:
     return data_dict
 
 
+_option_chain_columns = [
+    "Fetch_Time",
+    "Symbol",
+    "Expiry_Date",
+    "CALLS_OI",
+    "CALLS_Chng_in_OI",
+    "CALLS_Volume",
+    "CALLS_IV",
+    "CALLS_LTP",
+    "CALLS_Net_Chng",
+    "CALLS_Bid_Qty",
+    "CALLS_Bid_Price",
+    "CALLS_Ask_Price",
+    "CALLS_Ask_Qty",
+    "Strike_Price",
+    "PUTS_OI",
+    "PUTS_Chng_in_OI",
+    "PUTS_Volume",
+    "PUTS_IV",
+    "PUTS_LTP",
+    "PUTS_Net_Chng",
+    "PUTS_Bid_Qty",
+    "PUTS_Bid_Price",
+    "PUTS_Ask_Price",
+    "PUTS_Ask_Qty",
+]
+
+# (column suffix, NSE key) of one option leg, the compact mode uses the first six
+_option_chain_leg_fields = [
+    ("OI", "openInterest"),
+    ("Chng_in_OI", "changeinOpenInterest"),
+    ("Volume", "totalTradedVolume"),
+    ("IV", "impliedVolatility"),
+    ("LTP", "lastPrice"),
+    ("Net_Chng", "change"),
+    ("Bid_Qty", "buyQuantity1"),
+    ("Bid_Price", "buyPrice1"),
+    ("Ask_Price", "sellPrice1"),
+    ("Ask_Qty", "sellQuantity1"),
+]
+
+
+def _option_chain_leg(records: list, leg: str, fields: list) -> dict:
+    """
+    Build the columns of one option leg ('CE' or 'PE') for all the strikes in a single pass.
+
+    A leg which is missing, or misses any of the requested fields, is reported as zeros. The bid/ask
+    columns not requested (compact mode) are zeros as well.
+
+    Args:
+        records (list): The option chain rows of records.data.
+        leg (str): 'CE' or 'PE'.
+        fields (list): The (column suffix, NSE key) pairs to read.
+
+    Returns:
+        dict: column suffix -> list of values, one per record.
+    """
+    keys = [key for _, key in fields]
+    legs = [
+        row[leg] if isinstance(row.get(leg), dict) and all(key in row[leg] for key in keys) else None
+        for row in records
+    ]
+    return {
+        name: [0 if data is None else data[key] for data in legs] if (name, key) in fields else [0] * len(legs)
+        for name, key in _option_chain_leg_fields
+    }
+
+
+def _option_chain_frame(records: list, symbol: str, fetch_time: str, oi_mode: str = "full") -> pd.DataFrame:
+    """
+    Build the nse_live_option_chain frame of the given option chain rows.
+
+    Args:
+        records (list): The option chain rows of records.data, at least one.
+        symbol (str): The symbol reported in the Symbol column.
+        fetch_time (str): The records.timestamp of the payload.
+        oi_mode (str, optional): 'full' or 'compact'. Defaults to 'full'.
+
+    Returns:
+        pd.DataFrame: One row per record.
+    """
+    leg_fields = _option_chain_leg_fields if oi_mode == "full" else _option_chain_leg_fields[:6]
+    calls = _option_chain_leg(records, "CE", leg_fields)
+    puts = _option_chain_leg(records, "PE", leg_fields)
+    return pd.DataFrame(
+        {
+            "Fetch_Time": fetch_time,
+            "Symbol": symbol,
+            "Expiry_Date": [row["expiryDates"] for row in records],
+            **{f"CALLS_{name}": values for name, values in calls.items()},
+            "Strike_Price": [row["strikePrice"] for row in records],
+            **{f"PUTS_{name}": values for name, values in puts.items()},
+        },
+        columns=_option_chain_columns,
+    )
+
+
+@traced
 def nse_live_option_chain(
     symbol: str, expiry_date: str = None, oi_mode: str = "full"
 ) -> pd.DataFrame:
@@ -645,143 +772,17 @@ def nse_live_option_chain(
             "PUTS_OI",
         ]
 
-    oi_data = pd.DataFrame(columns=col_names)
-
-    oi_row = {
-        "Fetch_Time": None,
-        "Symbol": None,
-        "Expiry_Date": None,
-        "CALLS_OI": 0,
-        "CALLS_Chng_in_OI": 0,
-        "CALLS_Volume": 0,
-        "CALLS_IV": 0,
-        "CALLS_LTP": 0,
-        "CALLS_Net_Chng": 0,
-        "CALLS_Bid_Qty": 0,
-        "CALLS_Bid_Price": 0,
-        "CALLS_Ask_Price": 0,
-        "CALLS_Ask_Qty": 0,
-        "Strike_Price": 0,
-        "PUTS_OI": 0,
-        "PUTS_Chng_in_OI": 0,
-        "PUTS_Volume": 0,
-        "PUTS_IV": 0,
-        "PUTS_LTP": 0,
-        "PUTS_Net_Chng": 0,
-        "PUTS_Bid_Qty": 0,
-        "PUTS_Bid_Price": 0,
-        "PUTS_Ask_Price": 0,
-        "PUTS_Ask_Qty": 0,
-    }
+    records = [
+        row for row in payload["records"]["data"]
+        if not expiry_date or row["expiryDates"] == expiry_date
+    ]
+    if not records:
+        return pd.DataFrame(columns=col_names)
 
-    # print(expiry_date)
-    for m in range(len(payload["records"]["data"])):
-        if not expiry_date or (
-            payload["records"]["data"][m]["expiryDates"] == expiry_date
-        ):
-            try:
-                oi_row["Expiry_Date"] = payload["records"]["data"][m]["expiryDates"]
-                oi_row["CALLS_OI"] = payload["records"]["data"][m]["CE"]["openInterest"]
-                oi_row["CALLS_Chng_in_OI"] = payload["records"]["data"][m]["CE"][
-                    "changeinOpenInterest"
-                ]
-                oi_row["CALLS_Volume"] = payload["records"]["data"][m]["CE"][
-                    "totalTradedVolume"
-                ]
-                oi_row["CALLS_IV"] = payload["records"]["data"][m]["CE"][
-                    "impliedVolatility"
-                ]
-                oi_row["CALLS_LTP"] = payload["records"]["data"][m]["CE"]["lastPrice"]
-                oi_row["CALLS_Net_Chng"] = payload["records"]["data"][m]["CE"]["change"]
-                if oi_mode == "full":
-                    oi_row["CALLS_Bid_Qty"] = payload["records"]["data"][m]["CE"][
-                        "buyQuantity1"
-                    ]
-                    oi_row["CALLS_Bid_Price"] = payload["records"]["data"][m]["CE"][
-                        "buyPrice1"
-                    ]
-                    oi_row["CALLS_Ask_Price"] = payload["records"]["data"][m]["CE"][
-                        "sellPrice1"
-                    ]
-                    oi_row["CALLS_Ask_Qty"] = payload["records"]["data"][m]["CE"][
-                        "sellQuantity1"
-                    ]
-            except KeyError:
-                (
-                    oi_row["CALLS_OI"],
-                    oi_row["CALLS_Chng_in_OI"],
-                    oi_row["CALLS_Volume"],
-                    oi_row["CALLS_IV"],
-                    oi_row["CALLS_LTP"],
-                    oi_row["CALLS_Net_Chng"],
-                ) = 0, 0, 0, 0, 0, 0
-                if oi_mode == "full":
-                    (
-                        oi_row["CALLS_Bid_Qty"],
-                        oi_row["CALLS_Bid_Price"],
-                        oi_row["CALLS_Ask_Price"],
-                        oi_row["CALLS_Ask_Qty"],
-                    ) = 0, 0, 0, 0
-                pass
-
-            oi_row["Strike_Price"] = payload["records"]["data"][m]["strikePrice"]
-
-            try:
-                oi_row["PUTS_OI"] = payload["records"]["data"][m]["PE"]["openInterest"]
-                oi_row["PUTS_Chng_in_OI"] = payload["records"]["data"][m]["PE"][
-                    "changeinOpenInterest"
-                ]
-                oi_row["PUTS_Volume"] = payload["records"]["data"][m]["PE"][
-                    "totalTradedVolume"
-                ]
-                oi_row["PUTS_IV"] = payload["records"]["data"][m]["PE"][
-                    "impliedVolatility"
-                ]
-                oi_row["PUTS_LTP"] = payload["records"]["data"][m]["PE"]["lastPrice"]
-                oi_row["PUTS_Net_Chng"] = payload["records"]["data"][m]["PE"]["change"]
-                if oi_mode == "full":
-                    oi_row["PUTS_Bid_Qty"] = payload["records"]["data"][m]["PE"][
-                        "buyQuantity1"
-                    ]
-                    oi_row["PUTS_Bid_Price"] = payload["records"]["data"][m]["PE"][
-                        "buyPrice1"
-                    ]
-                    oi_row["PUTS_Ask_Price"] = payload["records"]["data"][m]["PE"][
-                        "sellPrice1"
-                    ]
-                    oi_row["PUTS_Ask_Qty"] = payload["records"]["data"][m]["PE"][
-                        "sellQuantity1"
-                    ]
-            except KeyError:
-                (
-                    oi_row["PUTS_OI"],
-                    oi_row["PUTS_Chng_in_OI"],
-                    oi_row["PUTS_Volume"],
-                    oi_row["PUTS_IV"],
-                    oi_row["PUTS_LTP"],
-                    oi_row["PUTS_Net_Chng"],
-                ) = 0, 0, 0, 0, 0, 0
-                if oi_mode == "full":
-                    (
-                        oi_row["PUTS_Bid_Qty"],
-                        oi_row["PUTS_Bid_Price"],
-                        oi_row["PUTS_Ask_Price"],
-                        oi_row["PUTS_Ask_Qty"],
-                    ) = 0, 0, 0, 0
-
-            # if oi_mode == 'full':
-            #     oi_row['CALLS_Chart'], oi_row['PUTS_Chart'] = 0, 0
-            if oi_data.empty:
-                oi_data = pd.DataFrame([oi_row]).copy()
-            else:
-                oi_data = pd.concat(
-                    [oi_data, pd.DataFrame([oi_row])], ignore_index=True
-                )
-            oi_data["Symbol"] = symbol
-            oi_data["Fetch_Time"] = payload["records"]["timestamp"]
-    return oi_data
+    return _option_chain_frame(records, symbol, payload["records"]["timestamp"], oi_mode)
 
 
+@traced
 def fno_security_in_ban_period(trade_date: str) -> list:
     """
     Fetch the list of securities which are banned from the F&O segment for a given trade date.
@@ -827,6 +828,7 @@ def fno_security_in_ban_period(trade_date: str) -> list:
     return securities
 
 
+@traced
 def live_most_active_underlying() -> pd.DataFrame:
     """
     Fetch the most active underlyings in the live market.
@@ -931,6 +933,7 @@ def _business_growth_fo_segment_dataframe(data_json):
     return data_df
 
 
+@traced
 def business_growth_fo_segment(
     data_type: str = "yearly",
     from_year: str = None,
@@ -1,5 +1,3 @@
-import requests
-
 from nselib.constants import indices_list
 from nselib.errors import NSEdataNotFound
 from nselib.libutil import *
@@ -145,8 +143,8 @@ def _get_business_growth_fo_segment_data(api_path: str) -> dict:
     """
     Internal helper to fetch business growth data for the F&O segment from NSE.
 
-    Establishes a fresh session with the NSE origin page to obtain cookies,
-    then makes the actual API request.
+    Uses the shared NSE client which ignores environment proxies, the origin page cookies
+    are reused across calls.
 
     Args:
         api_path (str): The relative API path to query (e.g., '/api/historicalOR/fo/tbg/yearly').
@@ -161,11 +159,7 @@ def _get_business_growth_fo_segment_data(api_path: str) -> dict:
     origin_url = "https://www.nseindia.com/market-data/business-growth-fo-segment"
     url = f"https://www.nseindia.com{api_path}"
     try:
-        r_session = requests.session()
-        r_session.trust_env = False
-        nse_live = r_session.get(origin_url, headers=default_header)
-        cookies = nse_live.cookies
-        data_json = r_session.get(url, headers=header, cookies=cookies).json()
+        data_json = nse_urlfetch(url, origin_url=origin_url, trust_env=False).json()
     except Exception as e:
         logger.error(
             f"Failed to fetch business growth F&O data. Error: {e}", exc_info=e
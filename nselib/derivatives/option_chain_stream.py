@@ -0,0 +1,94 @@
+import logging
+import threading
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from nselib.derivatives.derivative_data import _option_chain_columns, _option_chain_frame
+from nselib.derivatives.get_func import dd_mm_yyyy, get_nse_option_chain
+
+logger = logging.getLogger(__name__)
+
+# fields compared between two polls to decide if a strike changed
+_watched_fields = ("openInterest", "lastPrice", "impliedVolatility")
+
+
+def _strike_snapshot(row: dict) -> tuple:
+    return tuple(
+        (row.get(leg) or {}).get(field) for leg in ("CE", "PE") for field in _watched_fields
+    )
+
+
+class OptionChainStream:
+    """
+    Poll the live NSE option chain and yield only the strikes whose OI, LTP or IV changed since the previous poll.
+
+    The first poll yields the whole chain, each later one the changed strikes only, in the nse_live_option_chain
+    columns with Fetch_Time set to records.timestamp of the poll. All polls go through the shared NSE session, the
+    origin cookies are fetched once and reused.
+
+    Example:
+            from nselib import derivatives
+            stream = derivatives.OptionChainStream(symbol='NIFTY', expiry_date='27-03-2026', interval=3)
+            for changed_df in stream:
+                print(stream.timestamp, len(changed_df))
+    """
+
+    def __init__(self, symbol: str, expiry_date: str = None, interval: float = 5, oi_mode: str = "compact"):
+        """
+        Args:
+            symbol (str): The NSE symbol (e.g., 'NIFTY' or 'BANKNIFTY').
+            expiry_date (str, optional): The expiry to follow, in 'dd-mm-YYYY' format. Defaults to all expiries.
+            interval (float, optional): Seconds between two polls. Defaults to 5.
+            oi_mode (str, optional): 'full' or 'compact', as in nse_live_option_chain. Defaults to 'compact'.
+        """
+        self.symbol = symbol
+        self.expiry_date = datetime.strptime(expiry_date, dd_mm_yyyy).strftime("%d-%b-%Y") if expiry_date else None
+        self.interval = interval
+        self.oi_mode = oi_mode
+        self.timestamp = None
+        self._snapshots = {}
+        self._stopped = threading.Event()
+
+    def poll(self) -> pd.DataFrame:
+        """
+        Fetch the option chain once.
+
+        Returns:
+            pd.DataFrame: The strikes which changed since the previous poll, empty when nothing changed.
+        """
+        payload = get_nse_option_chain(self.symbol, self.expiry_date).json()
+        snapshots, changed = {}, []
+        for row in payload["records"]["data"]:
+            if self.expiry_date and row["expiryDates"] != self.expiry_date:
+                continue
+            key = (row["expiryDates"], row["strikePrice"])
+            snapshots[key] = _strike_snapshot(row)
+            if self._snapshots.get(key) != snapshots[key]:
+                changed.append(row)
+        self._snapshots = snapshots
+        self.timestamp = payload["records"]["timestamp"]
+        logger.debug(f"{self.symbol} option chain at {self.timestamp}: {len(changed)} of {len(snapshots)} strikes changed")
+        if not changed:
+            return pd.DataFrame(columns=_option_chain_columns)
+        return _option_chain_frame(changed, self.symbol, self.timestamp, self.oi_mode)
+
+    def stop(self):
+        """
+        Stop the iteration after the current poll, safe to call from another thread.
+        """
+        self._stopped.set()
+
+    def __iter__(self):
+        self._stopped.clear()
+        while not self._stopped.is_set():
+            started = time.monotonic()
+            try:
+                changed_df = self.poll()
+            except Exception as e:
+                logger.warning(f"Option chain poll for {self.symbol} failed, retrying next interval. Error: {e}")
+            else:
+                if not changed_df.empty:
+                    yield changed_df
+            self._stopped.wait(max(0.0, self.interval - (time.monotonic() - started)))
@@ -11,6 +11,7 @@ class ErrorCodeEnum(Enum):
     INVALID_INDEX_CATEGORY = "INVALID_INDEX_CATEGORY"
     INVALID_INDEX = "INVALID_INDEX"
     DERIVATIVE_INSTRUMENT_NOT_FOUND = "DERIVATIVE_INSTRUMENT_NOT_FOUND"
+    FIXTURE_NOT_FOUND = "FIXTURE_NOT_FOUND"
 
 
 class NSEException(Exception):
@@ -81,3 +82,10 @@ class IndexDataNotFound(NSEException):
 
     def __init__(self, message):
         super(IndexDataNotFound, self).__init__(message, ErrorCodeEnum.DATA_NOT_FOUND)
+
+
+class FixtureNotFound(NSEException):
+    """Exception raised when a replay transport has no recorded response for a url"""
+
+    def __init__(self, message):
+        super(FixtureNotFound, self).__init__(message, ErrorCodeEnum.FIXTURE_NOT_FOUND)
@@ -1,6 +1,7 @@
 from io import BytesIO
 from nselib.indices import nse_config as conf
 from nselib.libutil import nse_urlfetch
+from nselib.trace import traced
 import pandas as pd
 from nselib.errors import (
     InvalidIndexCategoryError,
@@ -119,6 +120,7 @@ def validate_index_name(
     return True
 
 
+@traced
 def constituent_stock_list(
     index_category: str = "BroadMarketIndices", index_name: str = "Nifty 50"
 ) -> pd.DataFrame:
@@ -166,6 +168,7 @@ def constituent_stock_list(
     return stocks_df
 
 
+@traced
 def live_index_performances() -> pd.DataFrame:
     """
     Fetch the live or last traded performance data for all NSE indices.
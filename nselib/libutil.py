@@ -1,12 +1,28 @@
+import contextlib
+import contextvars
+import importlib.util
 import os
+import tempfile
+import threading
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, date
+from urllib.parse import urlsplit
 import requests
+from requests.adapters import HTTPAdapter
 import numpy as np
 import pandas as pd
 import logging
 from nselib.constants import equity_periods, dd_mm_yyyy
-import pandas_market_calendars as mcal
-from nselib.errors import CalenderNotFound
+from nselib.errors import CalenderNotFound, NSEdataNotFound
+from nselib.cookie_cache import CookieCache, get_cookie_cache
+from nselib import archive_cache
+from nselib.rate_limit import RateLimiter, get_rate_limiter
+from nselib.retry import RetryPolicy, get_retry_policy
+from nselib import transport as nse_transport
+from nselib import trace as nse_trace
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +44,28 @@ header = {
     "Accept-Language": "en-US,en;q=0.9,hi;q=0.8",
 }
 
-nse_calendar = mcal.get_calendar("NSE")
+_nse_calendar = None
+_nse_calendar_lock = threading.Lock()
+
+
+def get_nse_calendar():
+    """
+    Get the pandas_market_calendars NSE calendar, imported and built on first use as it is slow to load.
+    """
+    global _nse_calendar
+    with _nse_calendar_lock:
+        if _nse_calendar is None:
+            import pandas_market_calendars as mcal
+
+            _nse_calendar = mcal.get_calendar("NSE")
+        return _nse_calendar
+
+
+def __getattr__(name):
+    # libutil.nse_calendar is kept for the existing callers, loaded lazily
+    if name == "nse_calendar":
+        return get_nse_calendar()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def validate_param_from_list(value: str, static_options_list: list):
@@ -135,17 +172,431 @@ def derive_from_and_to_date(
     f_date = np.select(conditions, value, default=(today - timedelta(days=1)))
     f_date = pd.to_datetime(str(f_date))
     logger.debug(f"Derived initial f_date: {f_date} for period: {period}")
-    while True:
-        date_chk = nse_calendar.schedule(start_date=f_date, end_date=f_date)
-        if not date_chk.empty:  # If market was open on this day
-            break  # Stop the loop
-        f_date -= timedelta(days=1)
+    # move back to the last day the market was open
+    f_date = previous_trading_day(f_date, inclusive=True)
     from_date = f_date.strftime(dd_mm_yyyy)
     today_str = today.strftime(dd_mm_yyyy)
     logger.debug(f"Final derived from_date: {from_date}, to_date: {today_str}")
     return from_date, today_str
 
 
+def date_windows(from_date: datetime, to_date: datetime, window_days: int = 365) -> list:
+    """
+    Split a date range into consecutive windows accepted by the NSE historical APIs.
+
+    Args:
+        from_date (datetime): Start of the range.
+        to_date (datetime): End of the range.
+        window_days (int, optional): Maximum days in one window. Defaults to 365.
+
+    Returns:
+        list: (start_date, end_date) tuples in 'dd-mm-YYYY' format, in date order.
+    """
+    windows = []
+    load_days = (to_date - from_date).days
+    while load_days > 0:
+        if load_days > window_days:
+            end_date = (from_date + timedelta(window_days - 1)).strftime(dd_mm_yyyy)
+        else:
+            end_date = to_date.strftime(dd_mm_yyyy)
+        windows.append((from_date.strftime(dd_mm_yyyy), end_date))
+        from_date = from_date + timedelta(window_days)
+        load_days = (to_date - from_date).days
+    return windows
+
+
+def fetch_date_windows(fetch_func, windows: list, max_workers: int = None) -> list:
+    """
+    Call fetch_func(from_date=..., to_date=...) for every window, concurrently when max_workers > 1.
+
+    Args:
+        fetch_func (callable): Function fetching one window.
+        windows (list): (start_date, end_date) tuples from date_windows.
+        max_workers (int, optional): Number of windows downloaded at the same time. Defaults to one at a time.
+
+    Returns:
+        list: The fetch_func results in the same (date) order as windows.
+    """
+    def fetch(window):
+        return fetch_func(from_date=window[0], to_date=window[1])
+
+    return fetch_concurrently(fetch, windows, max_workers=max_workers)
+
+
+def fetch_concurrently(fetch_func, items: list, max_workers: int = None) -> list:
+    """
+    Call fetch_func(item) for every item, on max_workers threads sharing the pooled NSE client when max_workers > 1.
+
+    Args:
+        fetch_func (callable): Function fetching one item, eg: one report URL.
+        items (list): The items.
+        max_workers (int, optional): Number of items downloaded at the same time. Defaults to one at a time.
+
+    Returns:
+        list: The fetch_func results in the same order as items.
+    """
+    if not max_workers or max_workers <= 1 or len(items) <= 1:
+        return [fetch_func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        # every item runs in a copy of the caller context, to keep the trace tags of the public function
+        contexts = [contextvars.copy_context() for _ in items]
+        return list(executor.map(lambda context, item: context.run(fetch_func, item), contexts, items))
+
+
+CSV_ENGINES = ("auto", "pyarrow", "c")
+# read_csv arguments the pyarrow engine handles like the C engine, a read using any other one stays on the C engine
+_pyarrow_csv_options = {"dtype", "usecols", "header", "names", "na_values", "keep_default_na"}
+_csv_engine = "auto"
+_pyarrow_available = None
+
+
+def _has_pyarrow() -> bool:
+    global _pyarrow_available
+    if _pyarrow_available is None:
+        _pyarrow_available = importlib.util.find_spec("pyarrow") is not None
+    return _pyarrow_available
+
+
+def set_csv_engine(engine: str = "auto"):
+    """
+    Choose the pandas engine of the archive csv readers with a dtype schema (bhav copies, see read_csv_with_schema).
+    The readers without a schema always use the C parser, pyarrow would change the dtypes they return (eg: ISO dates
+    as datetime.date instead of str).
+
+    Args:
+        engine (str, optional): 'pyarrow' for the multithreaded pyarrow parser, 'c' for the pandas C parser or
+            'auto' for pyarrow when it is installed, else c. Defaults to 'auto'.
+
+    Raises:
+        ValueError: If the engine is not one of CSV_ENGINES.
+        ImportError: If engine is 'pyarrow' and pyarrow is not installed.
+
+    Example:
+            from nselib import libutil
+            libutil.set_csv_engine('c')
+    """
+    global _csv_engine
+    if engine not in CSV_ENGINES:
+        raise ValueError(f"{engine} is not a valid csv engine, use one of {CSV_ENGINES}")
+    if engine == "pyarrow" and not _has_pyarrow():
+        raise ImportError("The pyarrow csv engine needs pyarrow, install it with: pip install pyarrow")
+    _csv_engine = engine
+
+
+def get_csv_engine() -> str:
+    """
+    The engine used by read_csv_with_schema, 'pyarrow' or 'c'.
+    """
+    if _csv_engine == "auto":
+        return "pyarrow" if _has_pyarrow() else "c"
+    return _csv_engine
+
+
+def read_archive_csv(source, engine: str = "c", **kwargs) -> pd.DataFrame:
+    """
+    pandas.read_csv of an archive report. The C parser is used unless engine is 'pyarrow', which only the readers
+    normalizing the result with a schema ask for (read_csv_with_schema). Reads needing an option the pyarrow engine
+    does not support (skiprows, skipinitialspace, on_bad_lines, ...) use the C engine.
+
+    Args:
+        source: Path or file like object of the csv.
+        engine (str, optional): 'c' or 'pyarrow'. Defaults to 'c'.
+        **kwargs: Other pandas.read_csv arguments.
+
+    Returns:
+        pandas.DataFrame: The csv content.
+    """
+    if engine == "pyarrow" and not set(kwargs) <= _pyarrow_csv_options:
+        engine = "c"
+    return pd.read_csv(source, engine=engine, **kwargs)
+
+
+def apply_schema(data_df: pd.DataFrame, schema: dict) -> pd.DataFrame:
+    """
+    Convert the columns of data_df to the dtypes of a report schema (see nselib.constants), the columns missing
+    from the report are ignored.
+
+    Args:
+        data_df (pandas.DataFrame): The report as read.
+        schema (dict): 'category', 'dates' (with 'date_format'), 'float64' and 'int32' column lists.
+
+    Returns:
+        pandas.DataFrame: data_df, converted in place.
+    """
+    for column in schema.get("category", []):
+        if column in data_df.columns and not isinstance(data_df[column].dtype, pd.CategoricalDtype):
+            data_df[column] = data_df[column].astype("category")
+    for column in schema.get("dates", []):
+        if column in data_df.columns:
+            # pyarrow already parses the ISO dates, with another resolution than pandas, use the same one for both
+            data_df[column] = pd.to_datetime(data_df[column], format=schema.get("date_format"),
+                                             errors="coerce").astype("datetime64[ns]")
+    for column in schema.get("float64", []):
+        # a value NSE left blank or filled with text becomes NaN
+        if column in data_df.columns and data_df[column].dtype != np.float64:
+            data_df[column] = pd.to_numeric(data_df[column], errors="coerce").astype(np.float64)
+    int32 = np.iinfo(np.int32)
+    for column in schema.get("int32", []):
+        # only when the whole column is integral and in range, otherwise it keeps the dtype it was read with
+        if column not in data_df.columns or not pd.api.types.is_integer_dtype(data_df[column].dtype):
+            continue
+        values = data_df[column]
+        if values.empty or (int32.min <= values.min() and values.max() <= int32.max):
+            data_df[column] = values.astype(np.int32)
+    return data_df
+
+
+def read_csv_with_schema(source, schema: dict, **kwargs) -> pd.DataFrame:
+    """
+    Read a report csv with the dtypes of its schema and the configured csv engine, the categorical columns are
+    built while reading.
+
+    Args:
+        source: Path or file like object of the csv.
+        schema (dict): The report schema, see apply_schema.
+        **kwargs: Other pandas.read_csv arguments.
+
+    Returns:
+        pandas.DataFrame: The report.
+    """
+    dtype = {column: "category" for column in schema.get("category", [])}
+    return apply_schema(read_archive_csv(source, engine=get_csv_engine(), dtype=dtype, **kwargs), schema)
+
+
+def _union_categories(frames: list) -> list:
+    # pd.concat turns categoricals with different categories back into strings, give them all the same categories
+    columns = set.intersection(*(
+        {name for name, dtype in frame.dtypes.items() if isinstance(dtype, pd.CategoricalDtype)} for frame in frames
+    ))
+    if not columns:
+        return frames
+    categories = {
+        name: pd.api.types.union_categoricals([frame[name] for frame in frames], ignore_order=True).categories
+        for name in columns
+    }
+    return [
+        frame.assign(**{name: frame[name].cat.set_categories(categories[name]) for name in columns})
+        for frame in frames
+    ]
+
+
+def concat_window_frames(frames: list, columns: list = None) -> pd.DataFrame:
+    """
+    Concatenate the per window data frames once, skipping the empty windows.
+
+    Args:
+        frames (list): Data frames in date order.
+        columns (list, optional): Columns of the empty frame returned when there are no windows.
+
+    Returns:
+        pandas.DataFrame: The combined data frame.
+    """
+    non_empty = [frame for frame in frames if not frame.empty]
+    if not non_empty:
+        return frames[-1] if frames else pd.DataFrame(columns=columns)
+    if len(non_empty) == 1:
+        return non_empty[0]
+    return pd.concat(_union_categories(non_empty), ignore_index=True)
+
+
+class TradingSessionIndex:
+    """
+    Sorted numpy array of the NSE trading sessions, loaded from the NSE calendar once and extended a calendar year
+    at a time when a date outside the loaded years is asked for. Lookups are binary searches.
+
+    Example:
+            from nselib import libutil
+            libutil.previous_trading_day('27-01-2024')
+    """
+
+    first_year = 1990
+
+    def __init__(self, calendar=None):
+        self._calendar = calendar
+        self._sessions = np.array([], dtype="datetime64[D]")
+        self._first_year = None
+        self._last_year = None
+        self._lock = threading.Lock()
+
+    def _load_years(self, first_year: int, last_year: int) -> np.ndarray:
+        calendar = self._calendar if self._calendar is not None else get_nse_calendar()
+        logger.debug(f"Loading NSE trading sessions of {first_year} to {last_year}")
+        sessions = calendar.valid_days(start_date=f"{first_year}-01-01", end_date=f"{last_year}-12-31")
+        return sessions.tz_localize(None).values.astype("datetime64[D]")
+
+    def _ensure_years(self, first_year: int, last_year: int):
+        with self._lock:
+            if self._first_year is None:
+                first_year = min(first_year, date.today().year - 1)
+                last_year = max(last_year, date.today().year + 1)
+                self._sessions = self._load_years(first_year, last_year)
+                self._first_year, self._last_year = first_year, last_year
+                return
+            if first_year < self._first_year:
+                self._sessions = np.concatenate([self._load_years(first_year, self._first_year - 1), self._sessions])
+                self._first_year = first_year
+            if last_year > self._last_year:
+                self._sessions = np.concatenate([self._sessions, self._load_years(self._last_year + 1, last_year)])
+                self._last_year = last_year
+
+    def _covered(self, day: np.datetime64) -> bool:
+        year = day.astype(object).year
+        return self._first_year is not None and self._first_year <= year <= self._last_year
+
+    def sessions(self, from_day: np.datetime64, to_day: np.datetime64) -> np.ndarray:
+        self._ensure_years(from_day.astype(object).year, to_day.astype(object).year)
+        sessions = self._sessions
+        start, end = np.searchsorted(sessions, from_day, side="left"), np.searchsorted(sessions, to_day, side="right")
+        return sessions[start:end]
+
+    def previous(self, day: np.datetime64, inclusive: bool = False) -> np.datetime64:
+        if not self._covered(day):
+            self._ensure_years(day.astype(object).year, day.astype(object).year)
+        while True:
+            sessions = self._sessions
+            position = np.searchsorted(sessions, day, side="right" if inclusive else "left") - 1
+            if position >= 0:
+                return sessions[position]
+            if self._first_year <= self.first_year:
+                raise ValueError(f"No NSE trading day before {day}")
+            self._ensure_years(self._first_year - 1, self._first_year - 1)
+
+    def next(self, day: np.datetime64, inclusive: bool = False) -> np.datetime64:
+        if not self._covered(day):
+            self._ensure_years(day.astype(object).year, day.astype(object).year)
+        while True:
+            sessions = self._sessions
+            position = np.searchsorted(sessions, day, side="left" if inclusive else "right")
+            if position < len(sessions):
+                return sessions[position]
+            self._ensure_years(self._last_year + 1, self._last_year + 1)
+
+
+trading_session_index = TradingSessionIndex()
+
+
+def _as_day(day) -> np.datetime64:
+    if isinstance(day, str):
+        day = datetime.strptime(day, dd_mm_yyyy)
+    return np.datetime64(day.strftime("%Y-%m-%d"), "D")
+
+
+def _as_datetime(day: np.datetime64) -> datetime:
+    day = day.astype(object)
+    return datetime(day.year, day.month, day.day)
+
+
+def previous_trading_day(day, inclusive: bool = False) -> datetime:
+    """
+    The NSE trading day before day.
+
+    Args:
+        day (date | datetime | str): The reference day, a str in 'dd-mm-YYYY' format.
+        inclusive (bool, optional): True to return day itself when it is a trading day. Defaults to False.
+
+    Returns:
+        datetime: The trading day.
+
+    Example:
+            from nselib import libutil
+            libutil.previous_trading_day('26-01-2024')  # datetime(2024, 1, 25), 26th is Republic Day
+    """
+    return _as_datetime(trading_session_index.previous(_as_day(day), inclusive=inclusive))
+
+
+def next_trading_day(day, inclusive: bool = False) -> datetime:
+    """
+    The NSE trading day after day.
+
+    Args:
+        day (date | datetime | str): The reference day, a str in 'dd-mm-YYYY' format.
+        inclusive (bool, optional): True to return day itself when it is a trading day. Defaults to False.
+
+    Returns:
+        datetime: The trading day.
+    """
+    return _as_datetime(trading_session_index.next(_as_day(day), inclusive=inclusive))
+
+
+def trading_days_between(from_date, to_date) -> list:
+    """
+    NSE trading days between from_date and to_date (both included), weekends and holidays left out.
+
+    Args:
+        from_date (date | datetime | str): Start of the range, a str in 'dd-mm-YYYY' format.
+        to_date (date | datetime | str): End of the range, a str in 'dd-mm-YYYY' format.
+
+    Returns:
+        list: datetime of every trading day, in date order.
+    """
+    sessions = trading_session_index.sessions(_as_day(from_date), _as_day(to_date))
+    return [_as_datetime(day) for day in sessions]
+
+
+def fetch_trading_days(fetch_func, days: list, max_workers: int = None, checkpoint_dir: str = None):
+    """
+    Call fetch_func(trade_date) for every day, concurrently when max_workers > 1, and yield the results in date order.
+
+    Days without a report (fetch_func raises NSEdataNotFound/FileNotFoundError or returns an empty frame) are logged
+    and skipped. With checkpoint_dir every downloaded day is saved there as a pickle, so an interrupted backfill
+    resumes where it stopped when called again with the same directory.
+
+    Args:
+        fetch_func (callable): Function fetching one trade date in 'dd-mm-YYYY' format, eg: fno_bhav_copy.
+        days (list): datetime of the trade dates, from trading_days_between.
+        max_workers (int, optional): Number of days downloaded at the same time. Defaults to one at a time.
+        checkpoint_dir (str, optional): Directory of the downloaded days. Defaults to no checkpoint.
+
+    Yields:
+        tuple: (trade_date in 'dd-mm-YYYY' format, pandas.DataFrame)
+    """
+    if checkpoint_dir:
+        os.makedirs(checkpoint_dir, exist_ok=True)
+
+    def checkpoint_path(day):
+        return os.path.join(checkpoint_dir, f"{fetch_func.__name__}_{day.strftime('%Y%m%d')}.pkl")
+
+    def fetch(day):
+        trade_date = day.strftime(dd_mm_yyyy)
+        if checkpoint_dir and os.path.exists(checkpoint_path(day)):
+            return trade_date, pd.read_pickle(checkpoint_path(day))
+        try:
+            data_df = fetch_func(trade_date)
+        except (NSEdataNotFound, FileNotFoundError) as e:
+            logger.warning(f"Skipping {trade_date}, {fetch_func.__name__} data not found: {e}")
+            return trade_date, None
+        if data_df is None or data_df.empty:
+            logger.warning(f"Skipping {trade_date}, {fetch_func.__name__} returned no data")
+            return trade_date, None
+        if checkpoint_dir:
+            tmp_path = f"{checkpoint_path(day)}.{os.getpid()}.tmp"
+            data_df.to_pickle(tmp_path)
+            os.replace(tmp_path, checkpoint_path(day))
+        return trade_date, data_df
+
+    if not max_workers or max_workers <= 1 or len(days) <= 1:
+        for day in days:
+            trade_date, data_df = fetch(day)
+            if data_df is not None:
+                yield trade_date, data_df
+        return
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(days))) as executor:
+        # keep a bounded number of days in flight so a generator consumer does not buffer the whole range
+        pending = deque()
+        days = iter(days)
+        for day in days:
+            pending.append(executor.submit(contextvars.copy_context().run, fetch, day))
+            if len(pending) >= 2 * max_workers:
+                break
+        while pending:
+            trade_date, data_df = pending.popleft().result()
+            next_day = next(days, None)
+            if next_day is not None:
+                pending.append(executor.submit(contextvars.copy_context().run, fetch, next_day))
+            if data_df is not None:
+                yield trade_date, data_df
+
+
 def cleaning_column_name(col: list):
     unwanted_str_list = ["FH_", "EOD_", "HIT_"]
     new_col = col
@@ -159,13 +610,217 @@ def cleaning_nse_symbol(symbol):
     return symbol.upper()
 
 
-def nse_urlfetch(url, origin_url="http://nseindia.com"):
+class NSEClient:
+    """
+    Long-lived, thread-safe HTTP client shared by all NSE data functions.
+
+    A single requests.Session keeps the TCP/TLS connections alive (connection pooling) and holds the cookie jar.
+    Cookies harvested from an origin page are kept in the cookie cache, so the origin page is only visited when
+    its cookies are missing or stale, or when the NSE site answers with 401/403 (not the archives, where it only
+    means the file is not published). Concurrent 401/403 answers visit the origin page once. Every request waits for the per host limit
+    of the rate limiter, has the timeout of the retry policy and is retried on transient failures. The transport
+    sends it live, records it or replays a recorded response (see nselib.transport).
+
+    Example:
+            from nselib import libutil
+            client = libutil.get_nse_client()
+            response = client.get('https://www.nseindia.com/api/holiday-master?type=trading')
+    """
+
+    refresh_status_codes = (401, 403)
+    # a 401/403 of the archive hosts means the file is not published or has another URL, new cookies do not help
+    archive_hosts = ("nsearchives.nseindia.com", "archives.nseindia.com")
+
+    def __init__(self, trust_env: bool = True, pool_maxsize: int = 16, cookie_cache: CookieCache = None,
+                 rate_limiter: RateLimiter = None, retry_policy: RetryPolicy = None, transport=None):
+        self.session = requests.Session()
+        self.session.trust_env = trust_env
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._cookie_cache = cookie_cache
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy
+        self._transport = transport
+        self._lock = threading.Lock()
+        # origin_url -> cookie list from the cache which is already loaded in the session jar
+        self._loaded_cookies = {}
+
+    @property
+    def cookie_cache(self) -> CookieCache:
+        return self._cookie_cache if self._cookie_cache is not None else get_cookie_cache()
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        return self._rate_limiter if self._rate_limiter is not None else get_rate_limiter()
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        return self._retry_policy if self._retry_policy is not None else get_retry_policy()
+
+    @property
+    def transport(self):
+        return self._transport if self._transport is not None else nse_transport.get_transport()
+
+    def _send(self, url: str, headers: dict, phase: str = "fetch", **kwargs) -> requests.Response:
+        if not nse_trace.enabled():
+            return self._transport_send(url, headers, **kwargs)
+        start = time.perf_counter()
+        try:
+            response = self._transport_send(url, headers, **kwargs)
+        except Exception as e:
+            nse_trace.emit(phase, url=url, duration=time.perf_counter() - start, error=repr(e))
+            raise
+        if kwargs.get("stream"):
+            # the body is not downloaded yet, count what NSE announced
+            length = response.headers.get("Content-Length")
+            received = int(length) if length and length.isdigit() else None
+        else:
+            received = len(response.content)
+        nse_trace.emit(phase, url=url, status_code=response.status_code, bytes=received,
+                       duration=time.perf_counter() - start)
+        return response
+
+    def _transport_send(self, url: str, headers: dict, **kwargs) -> requests.Response:
+        transport = self.transport
+        if transport.offline:
+            return transport.send(self.session, url, headers, **kwargs)
+        kwargs.setdefault("timeout", self.retry_policy.timeout)
+        if not kwargs.get("stream"):
+            with self.rate_limiter.request(url):
+                return transport.send(self.session, url, headers, **kwargs)
+        # the body of a streamed response is downloaded after send returns, it keeps the concurrency slot of the
+        # host until the response is closed
+        slot = contextlib.ExitStack()
+        with slot:
+            slot.enter_context(self.rate_limiter.request(url))
+            response = transport.send(self.session, url, headers, **kwargs)
+            slot = slot.pop_all()
+        close = response.close
+
+        def close_and_release():
+            try:
+                close()
+            finally:
+                slot.close()
+
+        response.close = close_and_release
+        return response
+
+    def fetch_cookies(self, origin_url: str, force: bool = False, stale: list = None):
+        """
+        Make sure the session has fresh cookies of the origin page, from the cookie cache or by visiting it.
+
+        force visits the origin page even when the cache has its cookies. With stale, the cookies a rejected request
+        was sent with, it only does so when no other request has loaded newer cookies in the meantime.
+        """
+        if self.transport.offline:
+            return
+        cache = self.cookie_cache
+        with self._lock:
+            if force and stale is not None and self._loaded_cookies.get(origin_url) is not stale:
+                # another request already refreshed the cookies since these were rejected
+                force = False
+            cookies = None if force else cache.get(origin_url)
+            if cookies is not None:
+                if self._loaded_cookies.get(origin_url) is not cookies:
+                    for cookie in cookies:
+                        self.session.cookies.set(
+                            cookie["name"],
+                            cookie["value"],
+                            domain=cookie["domain"],
+                            path=cookie["path"],
+                            expires=cookie["expires"],
+                            secure=cookie["secure"],
+                        )
+                    self._loaded_cookies[origin_url] = cookies
+                return
+            if force:
+                cache.invalidate(origin_url)
+            logger.debug(f"Fetching cookies from origin_url: {origin_url}")
+            nse_live = self._send(origin_url, default_header, phase="cookie_fetch")
+            cache.set(origin_url, nse_live.cookies)
+            self._loaded_cookies[origin_url] = cache.get(origin_url)
+
+    def get(self, url: str, origin_url: str = "http://nseindia.com", **kwargs) -> requests.Response:
+        """
+        Fetch the url with the browser like headers, refreshing the origin cookies once on 401/403.
+
+        Connection errors, timeouts and the retry_status_codes of the retry policy are retried with backoff, the
+        last response is returned (or the last error raised) once the attempts are used up.
+        """
+        policy = self.retry_policy
+        for attempt in range(1, policy.max_attempts + 1):
+            try:
+                response = self._get_once(url, origin_url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt >= policy.max_attempts:
+                    raise
+                logger.warning(f"Attempt {attempt} for url: {url} failed, retrying. Error: {e}")
+                policy.wait(attempt)
+                continue
+            if response.status_code not in policy.retry_status_codes or attempt >= policy.max_attempts:
+                return response
+            logger.warning(f"Attempt {attempt} for url: {url} got {response.status_code}, retrying")
+            # give the connection of a streamed response back to the pool
+            response.close()
+            policy.wait(attempt, response)
+
+    def _get_once(self, url: str, origin_url: str, **kwargs) -> requests.Response:
+        self.fetch_cookies(origin_url)
+        used = self._loaded_cookies.get(origin_url)
+        logger.debug(f"Fetching data from url: {url}")
+        response = self._send(url, header, **kwargs)
+        if response.status_code in self.refresh_status_codes and urlsplit(url).hostname not in self.archive_hosts:
+            logger.debug(f"Got {response.status_code} for url: {url}, refreshing cookies")
+            response.close()
+            self.fetch_cookies(origin_url, force=True, stale=used)
+            response = self._send(url, header, **kwargs)
+        return response
+
+    def reset(self):
+        """
+        Drop the cookies of this session, they are reloaded from the cookie cache on the next request.
+        """
+        with self._lock:
+            self.session.cookies.clear()
+            self._loaded_cookies.clear()
+
+    def close(self):
+        self.reset()
+        self.session.close()
+
+
+_nse_clients = {}
+_nse_clients_lock = threading.Lock()
+
+
+def get_nse_client(trust_env: bool = True) -> NSEClient:
     """
-    Fetch data from an NSE URL using a session that mimics a real browser.
+    Get the process wide NSEClient, created on first use.
+
+    Args:
+        trust_env (bool, optional): False to get the client which ignores the environment proxy settings.
+
+    Returns:
+        NSEClient: The shared client.
+    """
+    with _nse_clients_lock:
+        if trust_env not in _nse_clients:
+            _nse_clients[trust_env] = NSEClient(trust_env=trust_env)
+        return _nse_clients[trust_env]
+
+
+def nse_urlfetch(url, origin_url="http://nseindia.com", trust_env=True, stream=False):
+    """
+    Fetch data from an NSE URL using the shared session that mimics a real browser.
 
     Args:
         url (str): The target NSE API URL.
         origin_url (str, optional): The origin URL to fetch cookies from initially. Defaults to "http://nseindia.com".
+        trust_env (bool, optional): False to ignore the environment proxy settings. Defaults to True.
+        stream (bool, optional): True to only download the body when it is read (iter_content), the response then
+            holds a concurrency slot of the host rate limit until it is closed. Defaults to False.
 
     Returns:
         requests.Response: The HTTP response object.
@@ -174,12 +829,215 @@ def nse_urlfetch(url, origin_url="http://nseindia.com"):
             from nselib import libutil
             response = libutil.nse_urlfetch('https://www.nseindia.com/api/holiday-master?type=trading')
     """
-    logger.debug(f"Fetching cookies from origin_url: {origin_url}")
-    r_session = requests.session()
-    nse_live = r_session.get(origin_url, headers=default_header)
-    cookies = nse_live.cookies
-    logger.debug(f"Fetching data from url: {url}")
-    return r_session.get(url, headers=header, cookies=cookies)
+    if stream:
+        return get_nse_client(trust_env=trust_env).get(url, origin_url=origin_url, stream=True)
+    return get_nse_client(trust_env=trust_env).get(url, origin_url=origin_url)
+
+
+def _archive_cache_for(trade_date):
+    # the archive cache, when it is configured, not bypassed and the report of trade_date is final
+    cache = archive_cache.get_archive_cache()
+    trade_day = trade_date.date() if isinstance(trade_date, datetime) else trade_date
+    if cache is None or archive_cache.cache_mode() == "bypass" or trade_day >= date.today():
+        return None
+    return cache
+
+
+def archive_urlfetch(url, trade_date, origin_url="http://nseindia.com", trust_env=True):
+    """
+    Fetch an NSE archive file of trade_date, served from the archive cache when it is configured and the trade date
+    is in the past.
+
+    Args:
+        url (str): The archive file URL.
+        trade_date (datetime): The trade date of the report.
+        origin_url (str, optional): The origin URL to fetch cookies from initially. Defaults to "http://nseindia.com".
+        trust_env (bool, optional): False to ignore the environment proxy settings. Defaults to True.
+
+    Returns:
+        requests.Response: The HTTP response object, a 200 response with the cached bytes on a cache hit.
+
+    Example:
+            from nselib import archive_cache, libutil
+            archive_cache.configure_archive_cache()
+            response = libutil.archive_urlfetch(
+                'https://nsearchives.nseindia.com/content/equities/peDetail/PE_170322.csv', datetime(2022, 3, 17))
+    """
+    cache = _archive_cache_for(trade_date)
+    if cache is None:
+        return nse_urlfetch(url, origin_url=origin_url, trust_env=trust_env)
+    if archive_cache.cache_mode() != "refresh":
+        start = time.perf_counter()
+        content = cache.get(url)
+        if content is not None:
+            nse_trace.emit("fetch", url=url, status_code=200, bytes=len(content), duration=time.perf_counter() - start,
+                           cached=True)
+            response = requests.Response()
+            response.status_code = 200
+            response.url = url
+            response._content = content
+            response._content_consumed = True
+            return response
+    response = nse_urlfetch(url, origin_url=origin_url, trust_env=trust_env)
+    if response.status_code == 200:
+        cache.set(url, response.content)
+    return response
+
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# downloads up to this size stay in memory, bigger ones roll over to a temporary file on disk
+DOWNLOAD_SPOOL_SIZE = 16 * 1024 * 1024
+
+
+def archive_download(url, trade_date, origin_url="http://nseindia.com", trust_env=True):
+    """
+    Download an NSE archive file of trade_date chunk by chunk into a spooled temporary file, instead of holding the
+    whole response body in memory. Past trade dates are served from (and stored in) the archive cache like
+    archive_urlfetch.
+
+    Args:
+        url (str): The archive file URL.
+        trade_date (datetime): The trade date of the report.
+        origin_url (str, optional): The origin URL to fetch cookies from initially. Defaults to "http://nseindia.com".
+        trust_env (bool, optional): False to ignore the environment proxy settings. Defaults to True.
+
+    Returns:
+        tuple: (status_code, file), file is a binary file object at its start when status_code is 200, else None.
+            The caller closes the file.
+
+    Example:
+            from nselib import libutil
+            status_code, bhav_file = libutil.archive_download(
+                'https://nsearchives.nseindia.com/content/cm/BhavCopy_NSE_CM_0_0_0_20250217_F_0000.csv.zip',
+                datetime(2025, 2, 17))
+    """
+    cache = _archive_cache_for(trade_date)
+    if cache is not None and archive_cache.cache_mode() != "refresh":
+        start = time.perf_counter()
+        cached_file = cache.open(url)
+        if cached_file is not None:
+            nse_trace.emit("fetch", url=url, status_code=200, bytes=os.fstat(cached_file.fileno()).st_size,
+                           duration=time.perf_counter() - start, cached=True)
+            return 200, cached_file
+    response = nse_urlfetch(url, origin_url=origin_url, trust_env=trust_env, stream=True)
+    with contextlib.closing(response):
+        if response.status_code != 200:
+            return response.status_code, None
+        spool = tempfile.SpooledTemporaryFile(max_size=DOWNLOAD_SPOOL_SIZE)
+        try:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                spool.write(chunk)
+        except Exception:
+            spool.close()
+            raise
+    if cache is not None:
+        spool.seek(0)
+        cache.set_file(url, spool)
+    spool.seek(0)
+    return 200, spool
+
+
+def _zip_csv_member(zip_file: zipfile.ZipFile, name: str):
+    # name when the archive has it, else its first csv (NSE sometimes names the member differently from the archive)
+    names = zip_file.namelist()
+    if name in names:
+        return name
+    return next((member for member in names if member.lower().endswith(".csv")), None)
+
+
+def read_zipped_csv(zip_source, name: str, schema: dict) -> pd.DataFrame:
+    """
+    Read the csv member name of a zip archive with the dtypes of schema. Only that member is opened, and it is
+    decompressed into the csv parser a block at a time, the other members and the whole csv are never held in
+    memory. zip_source is closed.
+
+    Args:
+        zip_source: Binary file object of the zip archive, eg: from archive_download.
+        name (str): The csv member, the first csv of the archive is read when there is no such member.
+        schema (dict): The report schema, see apply_schema.
+
+    Returns:
+        pandas.DataFrame: The csv content, empty when the archive has no csv.
+    """
+    with zip_source, zipfile.ZipFile(zip_source) as zip_file:
+        member = _zip_csv_member(zip_file, name)
+        if member is None:
+            logger.warning(f"No csv file in the zip archive, expected {name}")
+            return pd.DataFrame()
+        with zip_file.open(member) as csv_file:
+            return read_csv_with_schema(csv_file, schema)
+
+
+_category_turnover_headers = {"category", "client categories"}
+_category_turnover_columns = {
+    "Client Categories": "Category",
+    "Buy Value in Rs.": "Buy Value in Rs.Crores",
+    "Sell Value in Rs.": "Sell Value in Rs.Crores",
+}
+
+
+def category_turnover_blocks(raw: pd.DataFrame) -> list:
+    """
+    Find the Trade Date/Category tables of a category wise turnover sheet, with one mask over its first two columns
+    instead of a scan of every cell. A table ends at the first blank row, note or header after its header.
+
+    Args:
+        raw (pandas.DataFrame): The sheet read with header=None.
+
+    Returns:
+        list: A data frame per table in sheet order, its first 4 columns with the header names (Client Categories,
+            Buy/Sell Value in Rs. named Category, Buy/Sell Value in Rs.Crores).
+    """
+    if raw.shape[1] < 2 or raw.empty:
+        return []
+    first = raw.iloc[:, 0].astype("string").str.strip().str.lower()
+    second = raw.iloc[:, 1].astype("string").str.strip().str.lower()
+    is_header = (first.eq("trade date") & second.isin(_category_turnover_headers)).fillna(False).to_numpy()
+    ends_table = (
+        raw.iloc[:, 0].isna()
+        | first.str.startswith("note").fillna(False)
+        | first.eq("trade date").fillna(False)
+        | second.isin(_category_turnover_headers).fillna(False)
+    ).to_numpy()
+    header_rows = np.flatnonzero(is_header)
+    end_rows = np.flatnonzero(ends_table)
+    # the table of a header runs up to the next row ending a table, or the end of the sheet
+    next_end = np.searchsorted(end_rows, header_rows, side="right")
+    table_ends = np.append(end_rows, len(raw))[next_end]
+    blocks = []
+    for header_row, end_row in zip(header_rows, table_ends):
+        block = raw.iloc[header_row + 1:end_row, :4].copy()
+        # renamed per table, the tables of one sheet do not all use the same headers
+        block.columns = [str(value).strip() for value in raw.iloc[header_row, :4].tolist()]
+        blocks.append(block.rename(columns=_category_turnover_columns))
+    return blocks
+
+
+def category_turnover_frame(blocks: list) -> pd.DataFrame:
+    """
+    Combine the tables of category_turnover_blocks into the category wise turnover: typed values, the rows without
+    a trade date or category dropped and the net value added.
+
+    Args:
+        blocks (list): Data frames from category_turnover_blocks.
+
+    Returns:
+        pandas.DataFrame: Trade Date ('dd-Mon-YYYY'), Category, Buy/Sell/Net Value in Rs.Crores columns.
+    """
+    columns = ["Trade Date", "Category", "Buy Value in Rs.Crores", "Sell Value in Rs.Crores"]
+    data_df = pd.concat(blocks, ignore_index=True)
+    data_df = data_df[[column for column in columns if column in data_df.columns]].copy()
+    data_df["Trade Date"] = pd.to_datetime(data_df["Trade Date"], errors="coerce")
+    data_df["Category"] = data_df["Category"].astype(str).str.strip()
+    data_df = data_df[data_df["Category"].ne("")].copy()
+    for column_name in ["Buy Value in Rs.Crores", "Sell Value in Rs.Crores"]:
+        data_df[column_name] = pd.to_numeric(data_df[column_name], errors="coerce")
+    data_df = data_df.dropna(subset=["Trade Date", "Category"]).reset_index(drop=True)
+    data_df["Net Value in Rs.Crores"] = (
+        data_df["Buy Value in Rs.Crores"] - data_df["Sell Value in Rs.Crores"]
+    )
+    data_df["Trade Date"] = data_df["Trade Date"].dt.strftime("%d-%b-%Y")
+    return data_df
 
 
 def get_nselib_path():
@@ -0,0 +1,141 @@
+import contextlib
+import logging
+import math
+import threading
+import time
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# host -> (requests per second, max concurrent requests), the hosts of one site share their limit
+DEFAULT_HOST_LIMITS = {
+    ("www.nseindia.com", "nseindia.com"): (3, 4),
+    ("nsearchives.nseindia.com",): (8, 8),
+    ("archives.nseindia.com",): (8, 8),
+    ("www.niftyindices.com", "niftyindices.com"): (2, 2),
+}
+
+
+class HostLimit:
+    """
+    Token bucket of requests_per_second (bursts of up to burst requests) plus a cap of max_concurrency requests in
+    flight. None turns the respective limit off.
+    """
+
+    def __init__(self, requests_per_second: float = None, max_concurrency: int = None, burst: int = None):
+        self.requests_per_second = requests_per_second
+        self.max_concurrency = max_concurrency
+        self.burst = burst or (max(1, math.ceil(requests_per_second)) if requests_per_second else 1)
+        self.in_flight = 0
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+
+    def _take_token(self):
+        if not self.requests_per_second:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.requests_per_second)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.requests_per_second
+            time.sleep(wait)
+
+    @contextlib.contextmanager
+    def request(self):
+        """
+        Block until a request may start, and hold a concurrency slot while the block runs.
+        """
+        if self._slots is not None:
+            self._slots.acquire()
+        try:
+            self._take_token()
+            with self._lock:
+                self.in_flight += 1
+            try:
+                yield
+            finally:
+                with self._lock:
+                    self.in_flight -= 1
+        finally:
+            if self._slots is not None:
+                self._slots.release()
+
+
+class RateLimiter:
+    """
+    Per host request limits applied by the NSE client to every request, including the origin page visits.
+
+    Example:
+            from nselib import rate_limit
+            rate_limit.configure_rate_limit('www.nseindia.com', requests_per_second=5, max_concurrency=6)
+    """
+
+    def __init__(self, host_limits: dict = None):
+        self._limits = {}
+        self._lock = threading.Lock()
+        for hosts, (requests_per_second, max_concurrency) in (host_limits or {}).items():
+            self.configure(hosts, requests_per_second=requests_per_second, max_concurrency=max_concurrency)
+
+    def configure(self, hosts, requests_per_second: float = None, max_concurrency: int = None) -> HostLimit:
+        """
+        Set the limit shared by hosts (one host name or a tuple of them), None to not limit that dimension.
+        """
+        hosts = (hosts,) if isinstance(hosts, str) else tuple(hosts)
+        limit = HostLimit(requests_per_second=requests_per_second, max_concurrency=max_concurrency)
+        with self._lock:
+            for host in hosts:
+                self._limits[host.lower()] = limit
+        return limit
+
+    def get(self, host: str):
+        """
+        Get the HostLimit of host, None when the host is not limited.
+        """
+        return self._limits.get((host or "").lower())
+
+    def request(self, url: str):
+        """
+        Context manager which waits for the limit of the url host before the request is sent.
+        """
+        limit = self.get(urlsplit(url).hostname)
+        if limit is None:
+            return contextlib.nullcontext()
+        return limit.request()
+
+    def in_flight(self, host: str) -> int:
+        """
+        Number of requests currently running against host.
+        """
+        limit = self.get(host)
+        return limit.in_flight if limit is not None else 0
+
+
+_rate_limiter = RateLimiter(DEFAULT_HOST_LIMITS)
+
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Get the process wide rate limiter used by the NSE client.
+    """
+    return _rate_limiter
+
+
+def configure_rate_limit(hosts, requests_per_second: float = None, max_concurrency: int = None) -> HostLimit:
+    """
+    Change the process wide limit of an NSE host.
+
+    Args:
+        hosts (str | tuple): Host name(s) sharing the limit, eg: 'nsearchives.nseindia.com'.
+        requests_per_second (float, optional): Sustained request rate. Defaults to no rate limit.
+        max_concurrency (int, optional): Maximum requests in flight at the same time. Defaults to no limit.
+
+    Returns:
+        HostLimit: The new limit.
+    """
+    return _rate_limiter.configure(hosts, requests_per_second=requests_per_second, max_concurrency=max_concurrency)
@@ -0,0 +1,72 @@
+import logging
+import random
+import time
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RetryPolicy:
+    """
+    How the NSE client retries a request that failed for a transient reason.
+
+    A request is sent at most max_attempts times. It is retried on a connection error, a timeout or one of the
+    retry_status_codes, after backoff * 2 ** (attempt - 1) seconds (capped at max_backoff) plus up to jitter times
+    that delay at random, or after the Retry-After seconds sent by NSE. timeout is the requests (connect, read)
+    timeout of every attempt.
+
+    Example:
+            from nselib import retry
+            retry.configure_retry_policy(max_attempts=5, backoff=1, timeout=(5, 120))
+    """
+
+    max_attempts: int = 3
+    backoff: float = 0.5
+    max_backoff: float = 10.0
+    jitter: float = 0.5
+    retry_status_codes: tuple = (429, 500, 502, 503, 504)
+    timeout: tuple = (10, 60)
+
+    def delay(self, attempt: int, response=None) -> float:
+        """
+        Seconds to wait after the failed attempt (1 for the first one).
+        """
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and str(retry_after).isdigit():
+            return min(self.max_backoff, float(retry_after))
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        return delay + random.uniform(0, delay * self.jitter)
+
+    def wait(self, attempt: int, response=None):
+        time.sleep(self.delay(attempt, response))
+
+
+_retry_policy = RetryPolicy()
+
+
+def get_retry_policy() -> RetryPolicy:
+    """
+    Get the process wide retry policy used by the NSE client.
+    """
+    return _retry_policy
+
+
+def configure_retry_policy(**kwargs) -> RetryPolicy:
+    """
+    Replace the process wide retry policy, the keyword arguments are the RetryPolicy fields.
+
+    Args:
+        max_attempts (int, optional): Attempts of one request, 1 to not retry. Defaults to 3.
+        backoff (float, optional): Wait before the first retry, doubled for each next one. Defaults to 0.5.
+        max_backoff (float, optional): Longest wait between two attempts. Defaults to 10.
+        jitter (float, optional): Random extra wait as a fraction of the backoff. Defaults to 0.5.
+        retry_status_codes (tuple, optional): HTTP status codes retried. Defaults to 429 and 5xx gateway errors.
+        timeout (tuple, optional): (connect, read) timeout of every attempt in seconds. Defaults to (10, 60).
+
+    Returns:
+        RetryPolicy: The new policy.
+    """
+    global _retry_policy
+    _retry_policy = RetryPolicy(**kwargs)
+    return _retry_policy
@@ -0,0 +1,211 @@
+import importlib
+import logging
+import os
+import shutil
+import threading
+from datetime import date, datetime
+
+import pandas as pd
+
+from nselib.constants import dd_mm_yyyy, sec_bhavdata_full_schema, udiff_bhavcopy_schema
+from nselib.libutil import (
+    derive_from_and_to_date,
+    fetch_trading_days,
+    trading_days_between,
+    validate_date_param,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "nselib", "store")
+
+_udiff_text_columns = ("ISIN", "FinInstrmNm", "Rmks", "Rsvd1", "Rsvd2", "Rsvd3", "Rsvd4")
+
+# report -> (module of its fetch function, symbol column, dtype schema, text columns)
+STORE_REPORTS = {
+    "fno_bhav_copy": ("nselib.derivatives", "TckrSymb", udiff_bhavcopy_schema, _udiff_text_columns),
+    "bhav_copy_equities": ("nselib.capital_market", "TckrSymb", udiff_bhavcopy_schema, _udiff_text_columns),
+    "bhav_copy_with_delivery": ("nselib.capital_market", "SYMBOL", sec_bhavdata_full_schema, ()),
+}
+
+_partition_prefix = "trade_date="
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.dataset
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("The bhav copy store needs pyarrow, install it with: pip install pyarrow") from None
+    return pyarrow
+
+
+def _as_date(day) -> date:
+    if isinstance(day, str):
+        day = datetime.strptime(day, dd_mm_yyyy)
+    return day.date() if isinstance(day, datetime) else day
+
+
+class BhavCopyStore:
+    """
+    Local Parquet dataset of the daily bhav copies of one report, partitioned by trade date
+    (directory/report/trade_date=YYYY-MM-DD/part-0.parquet). update() downloads only the trading days the store does
+    not have yet, read() filters on the trade date partitions and the symbol column inside pyarrow, so a query over
+    years of history only opens the files of the days asked for.
+
+    Every day is stored with the same column types, whatever dtypes pandas read it with: the categorical, date and
+    int32 columns of the report schema, the text columns as strings and the others as float64 (a '-' becomes NaN).
+
+    Needs pyarrow (pip install pyarrow).
+
+    Example:
+            from nselib.store import BhavCopyStore
+            store = BhavCopyStore('fno_bhav_copy', directory='/data/nse_store')
+            store.update(from_date='01-01-2024', to_date='31-03-2025', max_workers=4)
+            df = store.read(symbols=['NIFTY', 'BANKNIFTY'], from_date='01-01-2025', to_date='31-03-2025')
+    """
+
+    def __init__(self, report: str = "fno_bhav_copy", directory: str = DEFAULT_STORE_DIR):
+        if report not in STORE_REPORTS:
+            raise ValueError(f"{report} is not a valid report, use one of {list(STORE_REPORTS)}")
+        _pyarrow()
+        self.report = report
+        self.directory = os.path.join(directory, report)
+        self.symbol_column, self.schema, self.text_columns = STORE_REPORTS[report][1:]
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _partition_dir(self, day: date) -> str:
+        return os.path.join(self.directory, f"{_partition_prefix}{day.isoformat()}")
+
+    def _arrow_type(self, column: str):
+        pa = _pyarrow()
+        if column in self.schema.get("category", []):
+            return pa.dictionary(pa.int32(), pa.string())
+        if column in self.schema.get("dates", []):
+            return pa.timestamp("ns")
+        if column in self.schema.get("int32", []):
+            return pa.int32()
+        if column in self.text_columns:
+            return pa.string()
+        return pa.float64()
+
+    def dates(self) -> list:
+        """
+        The trade dates in the store, as datetime.date in date order.
+        """
+        days = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.is_dir() and entry.name.startswith(_partition_prefix):
+                    days.append(date.fromisoformat(entry.name[len(_partition_prefix):]))
+        return sorted(days)
+
+    def missing_dates(self, from_date, to_date) -> list:
+        """
+        The trading days between from_date and to_date (both included) the store does not have, as datetime.
+        """
+        stored = set(self.dates())
+        return [day for day in trading_days_between(from_date, to_date) if day.date() not in stored]
+
+    def write(self, trade_date, data_df: pd.DataFrame):
+        """
+        Store the bhav copy of trade_date, replacing the one stored before.
+
+        Args:
+            trade_date (date | datetime | str): The trade date, a str in 'dd-mm-YYYY' format.
+            data_df (pandas.DataFrame): The bhav copy of the day.
+        """
+        pa = _pyarrow()
+        day = _as_date(trade_date)
+        if self.symbol_column in data_df.columns:
+            # rows of a symbol together, the row group statistics then skip most of the file on a symbol filter
+            data_df = data_df.sort_values(self.symbol_column, kind="stable")
+        arrow_types = {column: self._arrow_type(column) for column in data_df.columns}
+        numeric = [column for column, arrow_type in arrow_types.items()
+                   if arrow_type == pa.float64() and not pd.api.types.is_numeric_dtype(data_df[column].dtype)]
+        if numeric:
+            data_df = data_df.assign(**{column: pd.to_numeric(data_df[column], errors="coerce") for column in numeric})
+        table = pa.Table.from_pandas(data_df, preserve_index=False)
+        # pandas reads a column of a day as int32, int64 or float64 depending on its values (and a dictionary index
+        # as wide as the day's distinct values), the files of every day get the same types
+        table = table.cast(pa.schema([field.with_type(arrow_types[field.name]) for field in table.schema],
+                                     metadata=table.schema.metadata))
+        partition_dir = self._partition_dir(day)
+        # a leading dot keeps the file being written out of the dataset until it is complete
+        tmp_path = os.path.join(partition_dir, f".part-0.{os.getpid()}.{threading.get_ident()}.tmp")
+        with self._lock:
+            os.makedirs(partition_dir, exist_ok=True)
+            pa.parquet.write_table(table, tmp_path)
+            os.replace(tmp_path, os.path.join(partition_dir, "part-0.parquet"))
+
+    def update(self, from_date: str = None, to_date: str = None, period: str = None, max_workers: int = None) -> list:
+        """
+        Download the bhav copies of the trading days of the date range missing from the store and add them. Days
+        written before an interruption are kept, calling update again downloads only the rest.
+
+        Args:
+            from_date (str, optional): Start of the range in 'dd-mm-YYYY' format.
+            to_date (str, optional): End of the range in 'dd-mm-YYYY' format.
+            period (str, optional): One of '1D', '1W', '1M', '6M', '1Y' instead of the dates.
+            max_workers (int, optional): Number of days downloaded at the same time. Defaults to one at a time.
+
+        Returns:
+            list: datetime.date of the days added, days without a report on NSE are logged and left out.
+        """
+        validate_date_param(from_date, to_date, period)
+        from_date, to_date = derive_from_and_to_date(from_date=from_date, to_date=to_date, period=period)
+        fetch_func = getattr(importlib.import_module(STORE_REPORTS[self.report][0]), self.report)
+        days = self.missing_dates(from_date, to_date)
+        logger.debug(f"Adding {len(days)} days to the {self.report} store")
+        added = []
+        # the downloads run without the store lock, write only takes it to put the file of a day in place
+        for trade_date, data_df in fetch_trading_days(fetch_func, days, max_workers=max_workers):
+            self.write(trade_date, data_df)
+            added.append(_as_date(trade_date))
+        return added
+
+    def read(self, symbols: list = None, from_date=None, to_date=None, columns: list = None) -> pd.DataFrame:
+        """
+        Read the stored bhav copies, filtered by symbol and trade date before the data is loaded.
+
+        Args:
+            symbols (list | str, optional): Symbols to keep, eg: ['NIFTY', 'SBIN']. Defaults to every symbol.
+            from_date (date | datetime | str, optional): First trade date, a str in 'dd-mm-YYYY' format.
+                Defaults to the first stored day.
+            to_date (date | datetime | str, optional): Last trade date, a str in 'dd-mm-YYYY' format.
+                Defaults to the last stored day.
+            columns (list, optional): Columns to load. Defaults to every column.
+
+        Returns:
+            pandas.DataFrame: The rows of the stored days in date order, empty when none matches.
+        """
+        pa = _pyarrow()
+        ds = pa.dataset
+        partitioning = ds.partitioning(pa.schema([("trade_date", pa.date32())]), flavor="hive")
+        dataset = ds.dataset(self.directory, format="parquet", partitioning=partitioning)
+        if not dataset.files:
+            return pd.DataFrame()
+        conditions = []
+        if from_date is not None:
+            conditions.append(ds.field("trade_date") >= _as_date(from_date))
+        if to_date is not None:
+            conditions.append(ds.field("trade_date") <= _as_date(to_date))
+        if symbols is not None:
+            symbols = [symbols] if isinstance(symbols, str) else list(symbols)
+            conditions.append(ds.field(self.symbol_column).isin(symbols))
+        row_filter = None
+        for condition in conditions:
+            row_filter = condition if row_filter is None else row_filter & condition
+        if columns is not None:
+            columns = list(dict.fromkeys([*columns, "trade_date"]))
+        table = dataset.to_table(columns=columns, filter=row_filter)
+        table = table.sort_by([("trade_date", "ascending")]).drop_columns(["trade_date"])
+        return table.to_pandas(coerce_temporal_nanoseconds=True)
+
+    def delete(self, trade_date):
+        """
+        Remove the bhav copy of trade_date from the store, it is downloaded again by the next update.
+        """
+        shutil.rmtree(self._partition_dir(_as_date(trade_date)), ignore_errors=True)
@@ -0,0 +1,219 @@
+import contextlib
+import contextvars
+import functools
+import inspect
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TraceEvent:
+    """
+    One phase of an nselib call, as passed to the trace hooks.
+
+    phase is 'cookie_fetch' (a visit of the origin page for its cookies), 'fetch' (one request of the data, cached is
+    True when it was served by the archive cache) or 'parse' (emitted when the public function returns, duration is
+    the time it spent outside the requests, elapsed the time of the whole call and rows the length of the result).
+    A function returning a generator is traced until the generator is exhausted or closed, elapsed is then the time
+    spent producing its items and rows the number of items.
+    function is the public function the event belongs to, eg: 'capital_market.index_data', None outside of one.
+    """
+
+    phase: str
+    function: str = None
+    url: str = None
+    status_code: int = None
+    bytes: int = None
+    duration: float = 0.0
+    elapsed: float = None
+    rows: int = None
+    cached: bool = False
+    error: str = None
+    timestamp: float = field(default_factory=time.time)
+
+
+class _Span:
+    """the public function call in progress and the time its requests took so far"""
+
+    def __init__(self, function: str):
+        self.function = function
+        self.network = 0.0
+        self._lock = threading.Lock()
+
+    def add_network(self, seconds: float):
+        # the windows of a range function are fetched from several threads
+        with self._lock:
+            self.network += seconds
+
+
+_current_span = contextvars.ContextVar("nselib_trace_span", default=None)
+_hooks = ()
+_hooks_lock = threading.Lock()
+
+
+def add_hook(callback):
+    """
+    Call callback(event) with every TraceEvent from now on, in the thread doing the work.
+
+    Example:
+            from nselib import trace
+            trace.add_hook(lambda event: print(event.function, event.phase, event.duration))
+    """
+    global _hooks
+    with _hooks_lock:
+        _hooks = _hooks + (callback,)
+
+
+def remove_hook(callback):
+    global _hooks
+    with _hooks_lock:
+        _hooks = tuple(hook for hook in _hooks if hook is not callback)
+
+
+@contextlib.contextmanager
+def hook(callback):
+    """
+    Call callback(event) with every TraceEvent emitted while the block runs.
+    """
+    add_hook(callback)
+    try:
+        yield callback
+    finally:
+        remove_hook(callback)
+
+
+@contextlib.contextmanager
+def collect():
+    """
+    Collect the TraceEvents emitted while the block runs into a list.
+
+    Example:
+            from nselib import trace, capital_market
+            with trace.collect() as events:
+                capital_market.index_data('NIFTY 50', period='1Y')
+            for event in events:
+                print(event.phase, event.url, event.status_code, event.bytes, round(event.duration, 3))
+    """
+    events = []
+    with hook(events.append):
+        yield events
+
+
+def enabled() -> bool:
+    """
+    True when at least one hook is installed, nothing is measured otherwise.
+    """
+    return bool(_hooks)
+
+
+def current_function():
+    span = _current_span.get()
+    return span.function if span is not None else None
+
+
+def _dispatch(event: TraceEvent):
+    for callback in _hooks:
+        try:
+            callback(event)
+        except Exception as e:
+            logger.warning(f"Trace hook {callback!r} failed on {event.phase} event. Error: {e}")
+
+
+def emit(phase: str, **fields):
+    """
+    Send an event of phase to the hooks, tagged with the public function being called.
+    """
+    if not _hooks:
+        return
+    span = _current_span.get()
+    event = TraceEvent(phase, function=span.function if span is not None else None, **fields)
+    if span is not None:
+        span.add_network(event.duration)
+    _dispatch(event)
+
+
+def _function_name(func) -> str:
+    # nselib.capital_market.capital_market_data.index_data -> capital_market.index_data
+    parts = func.__module__.split(".")
+    return f"{parts[1] if len(parts) > 2 else parts[-1]}.{func.__name__}"
+
+
+def _rows(result):
+    shape = getattr(result, "shape", None)
+    if shape:
+        return shape[0]
+    if isinstance(result, (list, dict)):
+        return len(result)
+    return None
+
+
+def _finish(span: _Span, elapsed: float, rows, error):
+    parent = _current_span.get()
+    if parent is not None:
+        parent.add_network(span.network)
+    # with concurrent downloads the request times overlap, the parse time is then a lower bound
+    _dispatch(TraceEvent("parse", function=span.function, duration=max(0.0, elapsed - span.network), elapsed=elapsed,
+                         rows=rows, error=error))
+
+
+def _traced_generator(generator, span: _Span, elapsed: float):
+    # the span is current only while the generator runs, the time the consumer spends on an item is not counted
+    rows, error = 0, None
+    try:
+        while True:
+            token = _current_span.set(span)
+            start = time.perf_counter()
+            try:
+                item = next(generator)
+            except StopIteration:
+                return
+            finally:
+                elapsed += time.perf_counter() - start
+                _current_span.reset(token)
+            rows += 1
+            yield item
+    except Exception as e:
+        error = repr(e)
+        raise
+    finally:
+        token = _current_span.set(span)
+        try:
+            generator.close()
+        finally:
+            _current_span.reset(token)
+            _finish(span, elapsed, rows, error)
+
+
+def traced(func):
+    """
+    Decorator of the public data functions, the requests made during the call are tagged with its name and a
+    'parse' event is emitted when it returns, or when the generator it returns is exhausted or closed.
+    """
+    name = _function_name(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _hooks:
+            return func(*args, **kwargs)
+        span = _Span(name)
+        token = _current_span.set(span)
+        start = time.perf_counter()
+        result, error = None, None
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            error = repr(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            if not inspect.isgenerator(result):
+                _finish(span, time.perf_counter() - start, _rows(result), error)
+        if inspect.isgenerator(result):
+            return _traced_generator(result, span, time.perf_counter() - start)
+        return result
+
+    return wrapper
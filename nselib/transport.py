@@ -0,0 +1,122 @@
+import hashlib
+import json
+import logging
+import os
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from nselib.errors import FixtureNotFound
+
+logger = logging.getLogger(__name__)
+
+
+class LiveTransport:
+    """
+    Send the requests to NSE over the client session, the default transport.
+    """
+
+    offline = False
+
+    def send(self, session: requests.Session, url: str, headers: dict, **kwargs) -> requests.Response:
+        return session.get(url, headers=headers, **kwargs)
+
+
+def _fixture_key(url: str) -> str:
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+class RecordTransport(LiveTransport):
+    """
+    Send the requests to NSE and write every response (status, headers, body) to directory, to be served later by
+    ReplayTransport. A fixture is the <key>.json metadata file plus the raw <key>.body, key being the sha256 of the
+    url.
+
+    Example:
+            from nselib import transport, capital_market
+            transport.set_transport(transport.RecordTransport('tests/fixtures/nse'))
+            df = capital_market.pe_ratio('17-03-2022')
+    """
+
+    def __init__(self, directory: str, transport: LiveTransport = None):
+        self.directory = directory
+        self.transport = transport or LiveTransport()
+        os.makedirs(directory, exist_ok=True)
+
+    def send(self, session: requests.Session, url: str, headers: dict, **kwargs) -> requests.Response:
+        response = self.transport.send(session, url, headers, **kwargs)
+        key = _fixture_key(url)
+        meta = {
+            "url": url,
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+            "encoding": response.encoding,
+        }
+        with open(os.path.join(self.directory, f"{key}.body"), "wb") as fh:
+            fh.write(response.content)
+        with open(os.path.join(self.directory, f"{key}.json"), "w", encoding="utf-8") as fh:
+            json.dump(meta, fh, indent=1)
+        logger.debug(f"Recorded {response.status_code} response of url: {url}")
+        return response
+
+
+class ReplayTransport:
+    """
+    Serve the responses recorded by RecordTransport without any network access.
+
+    The client skips the origin cookie handshake and the rate limits in replay, a url which was not recorded raises
+    FixtureNotFound.
+
+    Example:
+            from nselib import transport, capital_market
+            transport.set_transport(transport.ReplayTransport('tests/fixtures/nse'))
+            df = capital_market.pe_ratio('17-03-2022')
+    """
+
+    offline = True
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def send(self, session: requests.Session, url: str, headers: dict, **kwargs) -> requests.Response:
+        key = _fixture_key(url)
+        try:
+            with open(os.path.join(self.directory, f"{key}.json"), encoding="utf-8") as fh:
+                meta = json.load(fh)
+            with open(os.path.join(self.directory, f"{key}.body"), "rb") as fh:
+                content = fh.read()
+        except FileNotFoundError:
+            raise FixtureNotFound(f"No recorded response for url: {url} in {self.directory}")
+        response = requests.Response()
+        response.url = meta["url"]
+        response.status_code = meta["status_code"]
+        response.headers = CaseInsensitiveDict(meta["headers"])
+        response.encoding = meta["encoding"]
+        response._content = content
+        response._content_consumed = True
+        return response
+
+
+_transport = LiveTransport()
+
+
+def get_transport():
+    """
+    Get the process wide transport used by the NSE client.
+    """
+    return _transport
+
+
+def set_transport(transport=None):
+    """
+    Replace the process wide transport, None goes back to the live one.
+
+    Args:
+        transport (LiveTransport | RecordTransport | ReplayTransport, optional): The new transport.
+
+    Returns:
+        The transport in use.
+    """
+    global _transport
+    _transport = transport if transport is not None else LiveTransport()
+    return _transport
@@ -0,0 +1,136 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_XBRL_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "nselib", "xbrl.sqlite3")
+
+# SQLite limit of the parameters of one statement is 999 on older builds
+_query_batch_size = 500
+
+
+class XBRLCache:
+    """
+    SQLite file of the values extracted from XBRL financial result filings, keyed by the xbrl URL.
+
+    A filing never changes once filed, so financial_results_for_equity only downloads and parses the filings of
+    a date range which are not in the cache yet. The file can be shared by several processes.
+
+    Example:
+            from nselib import xbrl_cache
+            xbrl_cache.configure_xbrl_cache(path='/data/nse_xbrl.sqlite3')
+    """
+
+    def __init__(self, path: str = DEFAULT_XBRL_CACHE_PATH):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS filings (url TEXT PRIMARY KEY, record TEXT NOT NULL, stored_at REAL NOT NULL)"
+            )
+
+    def get_many(self, urls: list, keys: list = None) -> dict:
+        """
+        Get the cached records of urls in one pass over the file.
+
+        Args:
+            urls (list): The xbrl URLs.
+            keys (list, optional): The keys the records must have, a record extracted with fewer keys is left out
+                so the filing is parsed again. Defaults to any record.
+
+        Returns:
+            dict: url -> record (key -> value) of the cached urls.
+        """
+        urls = list(dict.fromkeys(urls))
+        records = {}
+        with self._lock:
+            for start in range(0, len(urls), _query_batch_size):
+                batch = urls[start:start + _query_batch_size]
+                rows = self._connection.execute(
+                    f"SELECT url, record FROM filings WHERE url IN ({','.join('?' * len(batch))})", batch
+                ).fetchall()
+                for url, record in rows:
+                    records[url] = json.loads(record)
+        if keys is not None:
+            records = {url: record for url, record in records.items() if all(key in record for key in keys)}
+        return records
+
+    def get(self, url: str, keys: list = None):
+        """
+        Get the cached record of url, None when not cached.
+        """
+        return self.get_many([url], keys).get(url)
+
+    def set(self, url: str, record: dict):
+        """
+        Store the record extracted from the filing of url.
+        """
+        try:
+            with self._lock, self._connection:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO filings (url, record, stored_at) VALUES (?, ?, ?)",
+                    (url, json.dumps(record), time.time()),
+                )
+        except sqlite3.Error as e:
+            logger.debug(f"Could not write {url} to the XBRL cache {self.path}: {e}")
+
+    def invalidate(self, url: str):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM filings WHERE url = ?", (url,))
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM filings")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM filings").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+_xbrl_cache = None
+
+
+def get_xbrl_cache():
+    """
+    Get the process wide XBRL cache, None while it is not configured (the default).
+    """
+    return _xbrl_cache
+
+
+def configure_xbrl_cache(path: str = DEFAULT_XBRL_CACHE_PATH) -> XBRLCache:
+    """
+    Turn on the cache of the XBRL financial result filings.
+
+    Args:
+        path (str, optional): The SQLite file. Defaults to ~/.cache/nselib/xbrl.sqlite3.
+
+    Returns:
+        XBRLCache: The new cache.
+    """
+    global _xbrl_cache
+    disable_xbrl_cache()
+    _xbrl_cache = XBRLCache(path=path)
+    return _xbrl_cache
+
+
+def disable_xbrl_cache():
+    """
+    Turn off the XBRL cache, the records already stored are kept in the file.
+    """
+    global _xbrl_cache
+    if _xbrl_cache is not None:
+        _xbrl_cache.close()
+    _xbrl_cache = None
@@ -5,7 +5,7 @@ with open("README.md", "r", encoding="utf-8") as fh:
 
 setuptools.setup(
     name='nselib',
-    packages=setuptools.find_packages(),
+    packages=setuptools.find_packages(exclude=["benchmarks", "benchmarks.*", "tests", "tests.*"]),
     version='2.5.1',
     include_package_data=True,
     description='library to get NSE India data',
@@ -0,0 +1,274 @@
+"""
+Deterministic synthetic payloads, shaped and sized like the files NSE, NSDL and AMFI publish, for the tests and the
+parser benchmarks. Every builder takes the number of rows so the suite can be scaled up to check how a parser grows.
+"""
+import io
+import json
+import zipfile
+from datetime import datetime, timedelta
+
+import numpy as np
+
+# columns of the CM-UDiFF bhav copies, the F&O and the cash market files share them
+UDIFF_COLUMNS = [
+    "TradDt", "BizDt", "Sgmt", "Src", "FinInstrmTp", "FinInstrmId", "ISIN", "TckrSymb", "SctySrs", "XpryDt",
+    "FininstrmActlXpryDt", "StrkPric", "OptnTp", "FinInstrmNm", "OpnPric", "HghPric", "LwPric", "ClsPric",
+    "LastPric", "PrvsClsgPric", "UndrlygPric", "SttlmPric", "OpnIntrst", "ChngInOpnIntrst", "TtlTradgVol",
+    "TtlTrfVal", "TtlNbOfTxsExctd", "SsnId", "NewBrdLotQty", "Rmks", "Rsvd1", "Rsvd2", "Rsvd3", "Rsvd4",
+]
+PARTICIPANT_OI_COLUMNS = [
+    "Client Type", "Future Index Long", "Future Index Short", "Future Stock Long", "Future Stock Short",
+    "Option Index Call Long", "Option Index Put Long", "Option Index Call Short", "Option Index Put Short",
+    "Option Stock Call Long", "Option Stock Put Long", "Option Stock Call Short", "Option Stock Put Short",
+    "Total Long Contracts", "Total Short Contracts",
+]
+CATEGORIES = ["BANKS", "DII", "FII/FPI", "INSURANCE", "MUTUAL FUNDS", "NRI", "OTHERS", "PROPRIETARY", "RETAIL"]
+DERIVATIVE_PRODUCTS = ["Index Futures", "Index Options", "Stock Futures", "Stock Options", "Interest Rate Futures"]
+
+
+def _symbols(count: int) -> list:
+    return [f"SYM{index:04d}" for index in range(count)]
+
+
+def option_chain_json(strikes: int = 250, expiries: int = 4, timestamp: str = "17-Feb-2025 15:30:00") -> bytes:
+    """
+    NSE option chain api payload with strikes rows for each of expiries expiry dates.
+    """
+    rng = np.random.default_rng(7)
+    expiry_dates = [(datetime(2025, 2, 20) + timedelta(7 * week)).strftime("%d-%b-%Y") for week in range(expiries)]
+    data = []
+    for expiry in expiry_dates:
+        for strike in range(18000, 18000 + 50 * strikes, 50):
+            row = {"strikePrice": strike, "expiryDates": expiry}
+            for leg in ("CE", "PE"):
+                row[leg] = {
+                    "strikePrice": strike, "expiryDate": expiry, "underlying": "NIFTY",
+                    "openInterest": int(rng.integers(0, 200000)),
+                    "changeinOpenInterest": int(rng.integers(-5000, 5000)),
+                    "totalTradedVolume": int(rng.integers(0, 10 ** 6)),
+                    "impliedVolatility": round(rng.uniform(5, 60), 2),
+                    "lastPrice": round(rng.uniform(0.05, 2000), 2), "change": round(rng.uniform(-100, 100), 2),
+                    "buyQuantity1": int(rng.integers(0, 5000)), "buyPrice1": round(rng.uniform(0.05, 2000), 2),
+                    "sellPrice1": round(rng.uniform(0.05, 2000), 2), "sellQuantity1": int(rng.integers(0, 5000)),
+                }
+            data.append(row)
+    payload = {"records": {"timestamp": timestamp, "expiryDates": expiry_dates, "data": data}}
+    return json.dumps(payload).encode("utf-8")
+
+
+def udiff_bhav_copy_zip(rows: int, segment: str = "FO", trade_date: str = "2025-02-17") -> bytes:
+    """
+    Zipped CM-UDiFF bhav copy csv of rows instruments, 'FO' for the F&O one or 'CM' for the equities one.
+    """
+    rng = np.random.default_rng(11)
+    symbols = _symbols(max(1, rows // 100) if segment == "FO" else rows)
+    lines = [",".join(UDIFF_COLUMNS)]
+    for index in range(rows):
+        symbol = symbols[index % len(symbols)]
+        close = round(float(rng.uniform(10, 5000)), 2)
+        if segment == "FO":
+            instrument = ("IDO", "STO", "IDF", "STF")[index % 4]
+            option_type = ("CE", "PE", "")[index % 3] if instrument in ("IDO", "STO") else ""
+            strike = f"{100 * (index % 400):.1f}" if option_type else ""
+            expiry = ("2025-02-27", "2025-03-27", "2025-04-24")[index % 3]
+            series, open_interest = "", int(rng.integers(0, 10 ** 6))
+        else:
+            instrument, option_type, strike, expiry = "STK", "", "", ""
+            series, open_interest = ("EQ", "BE", "SM")[index % 3], ""
+        values = [
+            trade_date, trade_date, segment, "NSE", instrument, str(100000 + index), f"INE{index:09d}", symbol, series,
+            expiry, expiry, strike, option_type, f"{symbol}{expiry}{strike}{option_type}", close, close * 1.02,
+            close * 0.98, close, close, close * 0.99, close, close, open_interest,
+            int(rng.integers(-1000, 1000)) if segment == "FO" else "", int(rng.integers(0, 10 ** 6)),
+            round(float(rng.uniform(0, 10 ** 8)), 2), int(rng.integers(0, 10 ** 4)), "F1", 1 if segment == "CM" else 75,
+            "", "", "", "", "",
+        ]
+        lines.append(",".join(str(value) for value in values))
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        zip_file.writestr(f"BhavCopy_NSE_{segment}_0_0_0_{trade_date.replace('-', '')}_F_0000.csv",
+                          "\n".join(lines) + "\n")
+    return buffer.getvalue()
+
+
+def participant_oi_csv(trade_date: str = "17-Feb-2025") -> bytes:
+    """
+    Participant wise open interest csv, a title line over the Client/DII/FII/Pro/TOTAL table.
+    """
+    rng = np.random.default_rng(3)
+    lines = [f'"Participant wise Open Interest (no. of contracts) in Equity Derivatives as on {trade_date}"',
+             ",".join(PARTICIPANT_OI_COLUMNS)]
+    for client_type in ("Client", "DII", "FII", "Pro", "TOTAL"):
+        values = rng.integers(0, 5 * 10 ** 6, len(PARTICIPANT_OI_COLUMNS) - 1)
+        lines.append(",".join([client_type, *map(str, values)]))
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _xls_bytes(sheets: dict) -> bytes:
+    # xlwt only writes the legacy .xls format NSE still publishes these reports in
+    import xlwt
+
+    book = xlwt.Workbook()
+    for sheet_name, rows in sheets.items():
+        sheet = book.add_sheet(sheet_name)
+        for row_index, row in enumerate(rows):
+            for column_index, value in enumerate(row):
+                if value is not None:
+                    sheet.write(row_index, column_index, value)
+    buffer = io.BytesIO()
+    book.save(buffer)
+    return buffer.getvalue()
+
+
+def category_turnover_xls(blocks: int = 3, days: int = 1, category_header: str = "Category",
+                          trade_date: str = "17-Feb-2025") -> bytes:
+    """
+    Category wise turnover .xls, a title over blocks tables of Trade Date/Category/Buy/Sell rows, each table
+    followed by a blank row and a note.
+    """
+    rng = np.random.default_rng(5)
+    rows = [["Category-wise Turnover", None, None, None], [None] * 4]
+    for _ in range(blocks):
+        rows.append(["Trade Date", category_header, "Buy Value in Rs.Crores", "Sell Value in Rs.Crores"])
+        for day in range(days):
+            for category in CATEGORIES:
+                rows.append([trade_date if day == 0 else f"{day:02d}-Feb-2025", category,
+                             round(float(rng.uniform(0, 10 ** 5)), 2), round(float(rng.uniform(0, 10 ** 5)), 2)])
+        rows.extend([[None] * 4, ["Note: values are provisional", None, None, None], [None] * 4])
+    return _xls_bytes({"Sheet1": rows})
+
+
+def nsdl_fpi_html(days: int = 22) -> str:
+    """
+    NSDL FPI monthly report page with the investment and derivative tables of days reporting dates.
+    """
+    rng = np.random.default_rng(13)
+    start = datetime(2025, 2, 1)
+    investment_rows, derivative_rows = [], []
+    for day in range(days):
+        report_date = (start + timedelta(day)).strftime("%d-%b-%Y")
+        for asset_class in ("Equity", "Debt-General Limit", "Debt-VRR", "Hybrid"):
+            for route in ("Stock Exchange", "Primary market & others"):
+                values = "".join(f"<td>{value:,.2f}</td>" for value in rng.uniform(-10 ** 4, 10 ** 4, 4))
+                investment_rows.append(f"<tr><td>{report_date}</td><td>{asset_class}</td><td>{route}</td>"
+                                       f"{values}<td>86.9</td></tr>")
+        for product in DERIVATIVE_PRODUCTS:
+            values = "".join(f"<td>{value:,.2f}</td>" for value in rng.uniform(0, 10 ** 6, 6))
+            derivative_rows.append(f"<tr><td>{report_date}</td><td>{product}</td>{values}</tr>")
+    return (
+        "<html><body>"
+        "<table><thead><tr><th>Reporting Date</th><th>Debt/Equity/Hybrid</th><th>Investment Route</th>"
+        "<th>Gross Purchases(Rs Crore)</th><th>Gross Sales(Rs Crore)</th><th>Net Investment (Rs Crore)</th>"
+        "<th>Net Investment US($) million</th><th>Conversion(1 USD TO INR)</th></tr></thead>"
+        f"<tbody>{''.join(investment_rows)}</tbody></table>"
+        "<table><thead><tr><th>Reporting Date</th><th>Derivative Products</th><th>Buy No. of Contracts</th>"
+        "<th>Buy Amount in Crore</th><th>Sell No. of Contracts</th><th>Sell Amount in Crore</th>"
+        "<th>Open Interest No. of Contracts</th><th>Open Interest Amount in Crore</th></tr></thead>"
+        f"<tbody>{''.join(derivative_rows)}</tbody></table>"
+        "</body></html>"
+    )
+
+
+XBRL_NAMESPACES = {
+    "xbrli": "http://www.xbrl.org/2003/instance",
+    "in-bse-fin": "http://www.bseindia.com/xbrl/fin/2020-03-31/in-bse-fin",
+}
+
+
+def xbrl_financial_result(keys: list, segments: int = 200) -> bytes:
+    """
+    XBRL financial result filing: the contexts, every key reported for the quarter and the year, then the segment
+    facts (revenue, results, assets, liabilities) of segments business segments, which make most of a real filing.
+    """
+    rng = np.random.default_rng(17)
+    contexts = ["OneD", "FourD"] + [f"OneD_Segment{index}" for index in range(segments)]
+    parts = [f'<xbrli:xbrl xmlns:xbrli="{XBRL_NAMESPACES["xbrli"]}" '
+             f'xmlns:in-bse-fin="{XBRL_NAMESPACES["in-bse-fin"]}">']
+    for context in contexts:
+        parts.append(f'<xbrli:context id="{context}"><xbrli:entity><xbrli:identifier scheme="http://www.bseindia.com">'
+                     f'500112</xbrli:identifier></xbrli:entity><xbrli:period><xbrli:startDate>2024-10-01'
+                     f'</xbrli:startDate><xbrli:endDate>2024-12-31</xbrli:endDate></xbrli:period></xbrli:context>')
+    for context in ("OneD", "FourD"):
+        for key in keys:
+            parts.append(f'<in-bse-fin:{key} contextRef="{context}" unitRef="INR" decimals="-5">'
+                         f'{rng.integers(10 ** 5, 10 ** 9)}</in-bse-fin:{key}>')
+    for context in contexts[2:]:
+        for fact in ("SegmentRevenue", "SegmentResult", "SegmentAssets", "SegmentLiabilities"):
+            parts.append(f'<in-bse-fin:{fact} contextRef="{context}" unitRef="INR" decimals="-5">'
+                         f'{rng.integers(10 ** 5, 10 ** 9)}</in-bse-fin:{fact}>')
+    parts.append("</xbrli:xbrl>")
+    return "".join(parts).encode()
+
+
+def _amfi_rows(schemes: int) -> list:
+    rng = np.random.default_rng(17)
+    rows = [["Sr", "Scheme Name", "No. of Schemes", "No. of Folios", "Funds Mobilized", "Repurchase",
+             "Net Inflow", "Net AUM", "Average AUM"]]
+    for index in range(schemes):
+        amounts = [round(float(value), 2) for value in rng.uniform(0, 10 ** 5, 5)]
+        rows.append([index + 1, f"Scheme category {index}", int(rng.integers(1, 50)),
+                     int(rng.integers(10 ** 3, 10 ** 7)), *amounts])
+    return rows
+
+
+def amfi_report_xls(schemes: int = 400) -> bytes:
+    """
+    AMFI monthly report as a legacy .xls workbook of schemes rows.
+    """
+    return _xls_bytes({"Sheet1": _amfi_rows(schemes)})
+
+
+def amfi_report_xlsx(schemes: int = 400) -> bytes:
+    """
+    AMFI monthly report as an .xlsx workbook of schemes rows.
+    """
+    import openpyxl
+
+    book = openpyxl.Workbook()
+    for row in _amfi_rows(schemes):
+        book.active.append(row)
+    buffer = io.BytesIO()
+    book.save(buffer)
+    return buffer.getvalue()
+
+
+def amfi_report_html(schemes: int = 400) -> bytes:
+    """
+    AMFI monthly report as an html table of schemes rows.
+    """
+    rows = "".join("<tr>" + "".join(f"<td>{value}</td>" for value in row) + "</tr>" for row in _amfi_rows(schemes))
+    return f"<html><body><table>{rows}</table></body></html>".encode("utf-8")
+
+
+def amfi_report_pdf(schemes: int = 400, lines_per_page: int = 50) -> bytes:
+    """
+    AMFI monthly report as a text pdf, one scheme per line.
+    """
+    lines = ["  ".join(str(value) for value in row) for row in _amfi_rows(schemes)]
+    pages = [lines[start:start + lines_per_page] for start in range(0, len(lines), lines_per_page)]
+    # objects: 1 catalog, 2 pages, 3 font, then a page and its content stream per page
+    objects = {1: "<< /Type /Catalog /Pages 2 0 R >>",
+               3: "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"}
+    kids = []
+    for page_number, page_lines in enumerate(pages):
+        page_id, content_id = 4 + 2 * page_number, 5 + 2 * page_number
+        text = "".join(f"({line.replace('(', '[').replace(')', ']')}) Tj T* " for line in page_lines)
+        stream = f"BT /F1 8 Tf 10 TL 20 800 Td {text}ET"
+        objects[page_id] = (f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>")
+        objects[content_id] = f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream"
+        kids.append(f"{page_id} 0 R")
+    objects[2] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    pdf = io.BytesIO()
+    pdf.write(b"%PDF-1.4\n")
+    offsets = {}
+    for object_id in sorted(objects):
+        offsets[object_id] = pdf.tell()
+        pdf.write(f"{object_id} 0 obj\n{objects[object_id]}\nendobj\n".encode("latin-1"))
+    xref = pdf.tell()
+    pdf.write(f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1"))
+    for object_id in sorted(objects):
+        pdf.write(f"{offsets[object_id]:010d} 00000 n \n".encode("latin-1"))
+    pdf.write(f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1"))
+    return pdf.getvalue()
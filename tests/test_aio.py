@@ -0,0 +1,69 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from nselib import aio
+from nselib.constants import index_data_columns
+
+
+class TestAsyncApi(unittest.TestCase):
+    def tearDown(self):
+        aio.set_max_concurrency()
+
+    def test_async_function_returns_the_sync_result(self):
+        response = Mock()
+        response.json.return_value = {
+            "data": [
+                {
+                    "CH_INDEX_NAME": "NIFTY 50",
+                    "OPEN": 25000.0,
+                    "HIGH": 25100.0,
+                    "CLOSE": 25075.0,
+                    "LOW": 24950.0,
+                    "TURNOVER": 12345.0,
+                    "VOLUME": 67890,
+                    "TIMESTAMP": "06-May-2026",
+                }
+            ]
+        }
+
+        async def fetch_all():
+            return await asyncio.gather(
+                aio.capital_market.index_data("NIFTY 50", "30-04-2026", "06-05-2026"),
+                aio.capital_market.index_data("NIFTY BANK", "30-04-2026", "06-05-2026"),
+            )
+
+        with patch("nselib.capital_market.get_func.nse_urlfetch", return_value=response):
+            frames = asyncio.run(fetch_all())
+
+        self.assertEqual(len(frames), 2)
+        self.assertEqual(list(frames[0].columns), index_data_columns)
+
+    def test_concurrency_is_bounded(self):
+        aio.set_max_concurrency(2)
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        def blocking_call():
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.02)
+            with lock:
+                state["running"] -= 1
+
+        async def fan_out():
+            await asyncio.gather(*[aio.run_sync(blocking_call) for _ in range(6)])
+
+        asyncio.run(fan_out())
+        self.assertEqual(state["peak"], 2)
+
+    def test_invalid_concurrency(self):
+        with self.assertRaises(ValueError):
+            aio.set_max_concurrency(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import os
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+
+from nselib import archive_cache, capital_market
+from nselib.archive_cache import ArchiveCache
+
+PE_CSV = b"SYMBOL,SERIES,P/E\nSBIN,EQ,9.5\nTCS,EQ,30.1\n"
+
+
+def _response(status_code=200, content=PE_CSV):
+    return Mock(status_code=status_code, content=content)
+
+
+class TestArchiveCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.addCleanup(archive_cache.disable_archive_cache)
+
+    def test_least_recently_used_files_are_evicted(self):
+        cache = ArchiveCache(self.tmp_dir.name, max_bytes=25)
+        cache.set("https://nsearchives.nseindia.com/a.csv", b"a" * 10)
+        cache.set("https://nsearchives.nseindia.com/b.csv", b"b" * 10)
+        past = time.time() - 60
+        os.utime(cache._path("https://nsearchives.nseindia.com/b.csv"), (past, past))
+        os.utime(cache._path("https://nsearchives.nseindia.com/a.csv"), (past - 60, past - 60))
+        cache.get("https://nsearchives.nseindia.com/a.csv")
+        cache.set("https://nsearchives.nseindia.com/c.csv", b"c" * 10)
+
+        self.assertIsNone(cache.get("https://nsearchives.nseindia.com/b.csv"))
+        self.assertEqual(cache.get("https://nsearchives.nseindia.com/a.csv"), b"a" * 10)
+        self.assertEqual(cache.size(), 20)
+
+    def test_directory_is_only_scanned_on_first_use_and_over_the_limit(self):
+        cache = ArchiveCache(self.tmp_dir.name, max_bytes=25)
+        with patch("nselib.archive_cache.os.scandir", side_effect=os.scandir) as scandir:
+            cache.set("https://nsearchives.nseindia.com/a.csv", b"a" * 10)
+            cache.set("https://nsearchives.nseindia.com/a.csv", b"a" * 5)
+            cache.set("https://nsearchives.nseindia.com/b.csv", b"b" * 10)
+            cache.invalidate("https://nsearchives.nseindia.com/b.csv")
+            cache.set("https://nsearchives.nseindia.com/c.csv", b"c" * 20)
+            self.assertEqual(scandir.call_count, 1)
+            cache.set("https://nsearchives.nseindia.com/d.csv", b"d" * 10)
+            self.assertEqual(scandir.call_count, 2)
+
+        self.assertEqual(cache._total, cache.size())
+        self.assertLessEqual(cache.size(), 25)
+
+    def test_past_report_is_downloaded_once(self):
+        archive_cache.configure_archive_cache(self.tmp_dir.name)
+        with patch("nselib.libutil.nse_urlfetch", return_value=_response()) as urlfetch:
+            first = capital_market.pe_ratio("17-03-2022")
+            second = capital_market.pe_ratio("17-03-2022")
+
+        self.assertEqual(urlfetch.call_count, 1)
+        self.assertEqual(second.to_dict(), first.to_dict())
+
+    def test_not_cached_by_default_or_for_today(self):
+        today = datetime.now().strftime("%d-%m-%Y")
+        with patch("nselib.libutil.nse_urlfetch", return_value=_response()) as urlfetch:
+            capital_market.pe_ratio("17-03-2022")
+            capital_market.pe_ratio("17-03-2022")
+            archive_cache.configure_archive_cache(self.tmp_dir.name)
+            capital_market.pe_ratio(today)
+            capital_market.pe_ratio(today)
+
+        self.assertEqual(urlfetch.call_count, 4)
+        self.assertEqual(archive_cache.get_archive_cache().size(), 0)
+
+    def test_missing_report_is_not_cached(self):
+        archive_cache.configure_archive_cache(self.tmp_dir.name)
+        with patch("nselib.libutil.nse_urlfetch", return_value=_response(404, b"")):
+            with self.assertRaises(FileNotFoundError):
+                capital_market.pe_ratio("17-03-2022")
+        self.assertEqual(archive_cache.get_archive_cache().size(), 0)
+
+    def test_bypass_and_refresh(self):
+        archive_cache.configure_archive_cache(self.tmp_dir.name)
+        yesterday = (datetime.now() - timedelta(days=1)).strftime("%d-%m-%Y")
+        updated = PE_CSV + b"INFY,EQ,25.0\n"
+        with patch("nselib.libutil.nse_urlfetch", side_effect=[_response(), _response(content=updated),
+                                                              _response(content=updated)]) as urlfetch:
+            capital_market.pe_ratio(yesterday)
+            with archive_cache.bypass():
+                self.assertEqual(len(capital_market.pe_ratio(yesterday)), 3)
+            self.assertEqual(len(capital_market.pe_ratio(yesterday)), 2)
+            with archive_cache.refresh():
+                capital_market.pe_ratio(yesterday)
+            self.assertEqual(len(capital_market.pe_ratio(yesterday)), 3)
+
+        self.assertEqual(urlfetch.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
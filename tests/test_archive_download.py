@@ -0,0 +1,72 @@
+import io
+import tempfile
+import unittest
+import zipfile
+from datetime import datetime
+from unittest.mock import patch
+
+import requests
+
+import payloads
+from nselib import archive_cache, capital_market, libutil
+from nselib.constants import udiff_bhavcopy_schema
+
+CM_URL = "https://nsearchives.nseindia.com/content/cm/BhavCopy_NSE_CM_0_0_0_20250217_F_0000.csv.zip"
+
+
+def _streamed_response(content, status_code=200):
+    response = requests.Response()
+    response.status_code = status_code
+    response.raw = io.BytesIO(content)
+    return response
+
+
+class TestArchiveDownload(unittest.TestCase):
+    def test_download_is_spooled_to_a_file(self):
+        content = payloads.udiff_bhav_copy_zip(2000, segment="CM")
+        with patch.object(libutil, "nse_urlfetch", return_value=_streamed_response(content)) as urlfetch, \
+                patch.object(libutil, "DOWNLOAD_SPOOL_SIZE", 1024), patch.object(libutil, "DOWNLOAD_CHUNK_SIZE", 512):
+            status_code, bhav_file = libutil.archive_download(CM_URL, datetime(2025, 2, 17))
+
+        with bhav_file:
+            self.assertEqual(status_code, 200)
+            self.assertTrue(bhav_file._rolled)
+            self.assertEqual(bhav_file.read(), content)
+        self.assertTrue(urlfetch.call_args.kwargs["stream"])
+
+    def test_failed_download_has_no_file(self):
+        with patch.object(libutil, "nse_urlfetch", return_value=_streamed_response(b"", status_code=403)):
+            self.assertEqual(libutil.archive_download(CM_URL, datetime(2025, 2, 17)), (403, None))
+
+    def test_only_the_expected_member_is_read(self):
+        zip_content = io.BytesIO()
+        with zipfile.ZipFile(zip_content, "w") as zip_file:
+            zip_file.writestr("readme.txt", "not a bhav copy")
+            zip_file.writestr("other.csv", "TckrSymb,ClsPric\nTCS,1.0\n")
+            zip_file.writestr("BhavCopy.csv", "TckrSymb,ClsPric\nSBIN,2.5\n")
+        zip_content.seek(0)
+
+        bhav_df = libutil.read_zipped_csv(zip_content, "BhavCopy.csv", udiff_bhavcopy_schema)
+
+        self.assertEqual(bhav_df["TckrSymb"].tolist(), ["SBIN"])
+        self.assertTrue(zip_content.closed)
+
+    def test_downloaded_file_is_cached_and_served_from_disk(self):
+        content = payloads.udiff_bhav_copy_zip(50, segment="CM")
+        with tempfile.TemporaryDirectory() as cache_dir:
+            archive_cache.configure_archive_cache(cache_dir)
+            self.addCleanup(archive_cache.disable_archive_cache)
+            with patch.object(libutil, "nse_urlfetch", return_value=_streamed_response(content)):
+                first = capital_market.bhav_copy_equities("17-02-2025")
+            with patch.object(libutil, "nse_urlfetch", side_effect=AssertionError("not cached")):
+                status_code, cached_file = libutil.archive_download(CM_URL, datetime(2025, 2, 17))
+                with cached_file:
+                    self.assertEqual(cached_file.read(), content)
+                second = capital_market.bhav_copy_equities("17-02-2025")
+
+        self.assertEqual(len(first), 50)
+        self.assertTrue(first.equals(second))
+
+
+if __name__ == "__main__":
+    unittest.main()
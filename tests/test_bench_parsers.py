@@ -0,0 +1,38 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+from nselib import transport
+
+# the benchmark scripts are plain files, not a package
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+import bench_parsers  # noqa: E402
+
+CASES = ["nse_live_option_chain", "participant_wise_open_interest", "mutual_fund_data._parse_pdf_report"]
+
+
+class TestBenchParsers(unittest.TestCase):
+    def test_report_is_json_with_time_and_memory_per_case(self):
+        report = json.loads(json.dumps(bench_parsers.run(repeat=1, cases=CASES)))
+
+        self.assertEqual([result["case"] for result in report["results"]], CASES)
+        for result in report["results"]:
+            self.assertEqual(result["status"], "ok", result)
+            self.assertGreater(result["rows"], 0)
+            self.assertGreater(result["payload_bytes"], 0)
+            self.assertGreater(result["peak_memory_bytes"], 0)
+            self.assertLessEqual(result["min_seconds"], result["median_seconds"])
+        self.assertIsInstance(transport.get_transport(), transport.LiveTransport)
+
+    def test_missing_recorded_fixture_is_skipped(self):
+        with tempfile.TemporaryDirectory() as fixtures:
+            report = bench_parsers.run(repeat=1, fixtures=fixtures, cases=["fno_bhav_copy"])
+
+        self.assertEqual(report["results"][0]["status"], "skipped")
+        self.assertEqual(report["results"][0]["payload"], "recorded")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from nselib import capital_market, derivatives
+
+FNO_BHAV_COPY = "nselib.derivatives.derivative_data.fno_bhav_copy"
+BHAV_COPY_EQUITIES = "nselib.capital_market.capital_market_data.bhav_copy_equities"
+
+# 01-01-2024 .. 12-01-2024 has 10 trading days, the two weekends are left out
+TRADING_DAYS = ["01-01-2024", "02-01-2024", "03-01-2024", "04-01-2024", "05-01-2024",
+                "08-01-2024", "09-01-2024", "10-01-2024", "11-01-2024", "12-01-2024"]
+
+
+def _fake_bhav_copy(trade_date):
+    # later days answer first, the result must still be in date order
+    time.sleep(0.02 if trade_date.startswith("01") else 0.001)
+    return pd.DataFrame({"TradDt": [trade_date, trade_date], "THREAD": threading.get_ident()})
+
+
+class TestBhavCopyRange(unittest.TestCase):
+    def test_only_trading_days_are_requested_in_order(self):
+        with patch(FNO_BHAV_COPY, side_effect=_fake_bhav_copy, autospec=True) as bhav_copy:
+            data_df = derivatives.fno_bhav_copy_range("01-01-2024", "12-01-2024", max_workers=4)
+
+        self.assertEqual(sorted(call.args[0] for call in bhav_copy.call_args_list), sorted(TRADING_DAYS))
+        self.assertEqual(data_df["TradDt"].drop_duplicates().tolist(), TRADING_DAYS)
+        self.assertEqual(len(data_df), 20)
+        self.assertGreater(data_df["THREAD"].nunique(), 1)
+
+    def test_missing_days_are_skipped(self):
+        def bhav_copy(trade_date):
+            if trade_date == "03-01-2024":
+                raise FileNotFoundError(" Data not found, change the trade_date...")
+            return pd.DataFrame() if trade_date == "04-01-2024" else _fake_bhav_copy(trade_date)
+
+        with patch(BHAV_COPY_EQUITIES, side_effect=bhav_copy, autospec=True):
+            data_df = capital_market.bhav_copy_equities_range("01-01-2024", "05-01-2024")
+
+        self.assertEqual(data_df["TradDt"].drop_duplicates().tolist(), ["01-01-2024", "02-01-2024", "05-01-2024"])
+
+    def test_interrupted_backfill_resumes_from_checkpoint(self):
+        def failing_bhav_copy(trade_date):
+            if trade_date == "08-01-2024":
+                raise ConnectionError("connection reset")
+            return _fake_bhav_copy(trade_date)
+
+        with tempfile.TemporaryDirectory() as checkpoint_dir:
+            with patch(FNO_BHAV_COPY, side_effect=failing_bhav_copy, autospec=True):
+                with self.assertRaises(ConnectionError):
+                    derivatives.fno_bhav_copy_range("01-01-2024", "12-01-2024", checkpoint_dir=checkpoint_dir)
+            self.assertEqual(len(os.listdir(checkpoint_dir)), 5)
+
+            with patch(FNO_BHAV_COPY, side_effect=_fake_bhav_copy, autospec=True) as bhav_copy:
+                data_df = derivatives.fno_bhav_copy_range("01-01-2024", "12-01-2024", checkpoint_dir=checkpoint_dir)
+
+        self.assertEqual([call.args[0] for call in bhav_copy.call_args_list], TRADING_DAYS[5:])
+        self.assertEqual(data_df["TradDt"].drop_duplicates().tolist(), TRADING_DAYS)
+
+    def test_generator_of_days(self):
+        with patch(FNO_BHAV_COPY, side_effect=_fake_bhav_copy, autospec=True) as bhav_copy:
+            day_frames = derivatives.fno_bhav_copy_range("01-01-2024", "12-01-2024", as_generator=True)
+            self.assertEqual(bhav_copy.call_count, 0)
+            trade_date, data_df = next(day_frames)
+
+        self.assertEqual(trade_date, "01-01-2024")
+        self.assertEqual(len(data_df), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
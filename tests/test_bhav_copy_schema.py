@@ -0,0 +1,66 @@
+import io
+import unittest
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
+
+import payloads
+from nselib import capital_market, derivatives, libutil
+from nselib.constants import udiff_bhavcopy_schema
+
+SEC_BHAVDATA_FULL = (
+    b"SYMBOL, SERIES, DATE1, PREV_CLOSE, CLOSE_PRICE, TTL_TRD_QNTY, NO_OF_TRADES, DELIV_QTY\n"
+    b"SBIN, EQ, 17-Mar-2022, 500.1, 505.55, 1000, 120, 600\n"
+    b"SBIN, N1, 17-Mar-2022, 101.0, 101.5, 10, 2, -\n"
+)
+
+
+def _response(content):
+    return Mock(status_code=200, content=content)
+
+
+class TestBhavCopySchema(unittest.TestCase):
+    def test_fno_bhav_copy_is_read_with_the_schema(self):
+        content = payloads.udiff_bhav_copy_zip(300, segment="FO")
+        with patch("nselib.derivatives.derivative_data.archive_download", return_value=(200, io.BytesIO(content))):
+            bhav_df = derivatives.fno_bhav_copy("17-02-2025")
+
+        for column in ("TckrSymb", "SctySrs", "FinInstrmTp", "OptnTp"):
+            self.assertIsInstance(bhav_df[column].dtype, pd.CategoricalDtype, column)
+        self.assertEqual(bhav_df["TradDt"].dt.strftime("%Y-%m-%d").unique().tolist(), ["2025-02-17"])
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(bhav_df["XpryDt"]))
+        self.assertEqual(bhav_df["NewBrdLotQty"].dtype, np.int32)
+        self.assertEqual(bhav_df["ClsPric"].dtype, np.float64)
+        self.assertEqual(bhav_df["TtlTradgVol"].dtype, np.int64)
+
+    def test_bhav_copy_with_delivery_is_stripped_and_typed(self):
+        with patch("nselib.capital_market.capital_market_data.archive_urlfetch",
+                   return_value=_response(SEC_BHAVDATA_FULL)):
+            bhav_df = capital_market.bhav_copy_with_delivery("17-03-2022")
+
+        self.assertEqual(bhav_df["SERIES"].tolist(), ["EQ", "N1"])
+        self.assertIsInstance(bhav_df["SERIES"].dtype, pd.CategoricalDtype)
+        self.assertEqual(bhav_df["DATE1"].iloc[0], pd.Timestamp("2022-03-17"))
+        self.assertEqual(bhav_df["NO_OF_TRADES"].dtype, np.int32)
+        self.assertEqual(bhav_df["DELIV_QTY"].tolist(), ["600", "-"])
+
+    def test_int32_is_only_used_when_the_values_fit(self):
+        data_df = pd.DataFrame({"FinInstrmId": [1, 2 ** 40], "TtlNbOfTxsExctd": [1.5, 2.0]})
+        libutil.apply_schema(data_df, udiff_bhavcopy_schema)
+
+        self.assertEqual(data_df["FinInstrmId"].dtype, np.int64)
+        self.assertEqual(data_df["TtlNbOfTxsExctd"].dtype, np.float64)
+
+    def test_concat_keeps_the_categoricals_of_different_days(self):
+        first = pd.DataFrame({"TckrSymb": pd.Categorical(["SBIN", "TCS"]), "ClsPric": [1.0, 2.0]})
+        second = pd.DataFrame({"TckrSymb": pd.Categorical(["INFY"]), "ClsPric": [3.0]})
+
+        data_df = libutil.concat_window_frames([first, second])
+
+        self.assertIsInstance(data_df["TckrSymb"].dtype, pd.CategoricalDtype)
+        self.assertEqual(data_df["TckrSymb"].tolist(), ["SBIN", "TCS", "INFY"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import threading
+import time
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+import pandas as pd
+
+from nselib import capital_market
+from nselib.constants import price_volume_and_deliverable_position_data_columns
+from nselib.libutil import date_windows
+
+
+class TestDateWindows(unittest.TestCase):
+    def test_windows_cover_the_range_in_365_day_steps(self):
+        windows = date_windows(datetime(2020, 1, 1), datetime(2022, 6, 30))
+        self.assertEqual(
+            windows,
+            [("01-01-2020", "30-12-2020"), ("31-12-2020", "30-12-2021"), ("31-12-2021", "30-06-2022")],
+        )
+
+    def test_short_range_is_one_window(self):
+        self.assertEqual(date_windows(datetime(2024, 3, 1), datetime(2024, 3, 8)), [("01-03-2024", "08-03-2024")])
+
+
+class TestParallelRangeFetch(unittest.TestCase):
+    @staticmethod
+    def _fake_index_data(index, from_date, to_date):
+        # later windows answer first, the result must still be in date order
+        time.sleep(0.05 if from_date.endswith("2015") else 0.01)
+        return pd.DataFrame({"INDEX_NAME": [index], "TIMESTAMP": [from_date], "THREAD": [threading.get_ident()]})
+
+    def test_windows_are_fetched_concurrently_and_kept_in_date_order(self):
+        with patch("nselib.capital_market.capital_market_data.get_index_data", side_effect=self._fake_index_data):
+            data_df = capital_market.index_data("NIFTY 50", "01-01-2015", "31-12-2019", max_workers=5)
+
+        expected = [window[0] for window in date_windows(datetime(2015, 1, 1), datetime(2019, 12, 31))]
+        self.assertEqual(data_df["TIMESTAMP"].tolist(), expected)
+        self.assertGreater(data_df["THREAD"].nunique(), 1)
+        self.assertEqual(list(data_df.index), list(range(len(expected))))
+
+    def test_sequential_by_default(self):
+        with patch("nselib.capital_market.capital_market_data.get_index_data", side_effect=self._fake_index_data):
+            data_df = capital_market.index_data("NIFTY 50", "01-01-2018", "31-12-2019")
+
+        self.assertEqual(data_df["THREAD"].nunique(), 1)
+        self.assertEqual(len(data_df), 2)
+
+    def test_empty_windows_are_skipped(self):
+        frames = [pd.DataFrame(), pd.DataFrame({"Date": ["02-01-2019"]})]
+        with patch("nselib.capital_market.capital_market_data.get_bulk_deal_data", side_effect=frames):
+            data_df = capital_market.bulk_deal_data("01-01-2018", "31-12-2019", max_workers=2)
+
+        self.assertEqual(data_df["Date"].tolist(), ["02-01-2019"])
+
+    def test_price_volume_and_deliverable_windows_are_joined_once(self):
+        frames = [
+            pd.DataFrame({"Symbol": ["SBIN"], "Date": ["02-Jan-2018"], "TotalTradedQuantity": ["1,000"],
+                          "DeliverableQty": [None]}),
+            pd.DataFrame(),
+            pd.DataFrame({"Symbol": ["SBIN"], "Date": ["02-Jan-2019"], "TotalTradedQuantity": ["2,000"],
+                          "DeliverableQty": ["500"]}),
+        ]
+        with patch("nselib.capital_market.capital_market_data.get_price_volume_and_deliverable_position_data",
+                   side_effect=frames):
+            data_df = capital_market.price_volume_and_deliverable_position_data("SBIN", "01-01-2018", "31-12-2020")
+
+        self.assertEqual(list(data_df.columns), price_volume_and_deliverable_position_data_columns)
+        self.assertEqual(data_df["Date"].tolist(), ["02-Jan-2018", "02-Jan-2019"])
+        self.assertEqual(data_df["TotalTradedQuantity"].tolist(), [1000, 2000])
+        self.assertEqual(data_df["Series"].tolist(), ["-", "-"])
+        self.assertTrue(pd.isna(data_df["DeliverableQty"].iloc[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
+
+import payloads
+from nselib import capital_market, derivatives, libutil
+
+CASH_URLFETCH = "nselib.capital_market.capital_market_data.nse_urlfetch"
+FO_URLFETCH = "nselib.derivatives.derivative_data.nse_urlfetch"
+
+
+def _xls(*blocks):
+    rows = [["Category-wise Turnover", None, None, None], [None] * 4]
+    for category_header, value_unit, categories in blocks:
+        rows.append(["Trade Date", category_header, f"Buy Value in {value_unit}", f"Sell Value in {value_unit}"])
+        for index, category in enumerate(categories):
+            rows.append(["17-Feb-2025", category, 100.0 + index, 40.0])
+        rows.extend([[None] * 4, ["Note: values are provisional", None, None, None]])
+    return payloads._xls_bytes({"Sheet1": rows})
+
+
+class TestCategoryTurnover(unittest.TestCase):
+    def test_tables_with_different_headers_are_combined(self):
+        content = _xls(("Category", "Rs.Crores", ["BANKS", "DII"]), ("Client Categories", "Rs.", ["FII/FPI"]))
+        with patch(CASH_URLFETCH, return_value=Mock(status_code=200, content=content)):
+            data_df = capital_market.category_turnover_cash("17-02-2025")
+
+        self.assertEqual(data_df.columns.tolist(), ["Trade Date", "Category", "Buy Value in Rs.Crores",
+                                                    "Sell Value in Rs.Crores", "Net Value in Rs.Crores"])
+        self.assertEqual(data_df["Category"].tolist(), ["BANKS", "DII", "FII/FPI"])
+        self.assertEqual(data_df["Net Value in Rs.Crores"].tolist(), [60.0, 61.0, 60.0])
+        self.assertEqual(data_df["Trade Date"].unique().tolist(), ["17-Feb-2025"])
+
+    def test_blocks_end_at_blank_rows_notes_and_headers(self):
+        raw = pd.DataFrame([
+            ["Title", None, None, None],
+            ["Trade Date", "Category", "Buy Value in Rs.Crores", "Sell Value in Rs.Crores"],
+            ["17-Feb-2025", "BANKS", 1.0, 2.0],
+            ["Trade Date", "Client Categories", "Buy Value in Rs.", "Sell Value in Rs."],
+            ["17-Feb-2025", "DII", 3.0, 4.0],
+            ["17-Feb-2025", "NRI", 5.0, 6.0],
+            ["Notes: provisional", None, None, None],
+            [" Trade Date ", "Category ", "Buy Value in Rs.Crores", "Sell Value in Rs.Crores"],
+            ["17-Feb-2025", "RETAIL", 7.0, 8.0],
+            [np.nan, None, None, None],
+            ["17-Feb-2025", "NOT IN A TABLE", 9.0, 9.0],
+        ], dtype=object)
+
+        blocks = libutil.category_turnover_blocks(raw)
+
+        self.assertEqual([block["Category"].tolist() for block in blocks], [["BANKS"], ["DII", "NRI"], ["RETAIL"]])
+        self.assertEqual(blocks[1].columns.tolist(), ["Trade Date", "Category", "Buy Value in Rs.Crores",
+                                                      "Sell Value in Rs.Crores"])
+        self.assertEqual(libutil.category_turnover_blocks(pd.DataFrame([["no table", None]])), [])
+
+    def test_fo_reads_the_first_table(self):
+        content = payloads.category_turnover_xls(blocks=2, category_header="Client Categories")
+        with patch(FO_URLFETCH, return_value=Mock(status_code=200, content=content)):
+            data_df = derivatives.category_turnover_fo("17-02-2025")
+        self.assertEqual(data_df["Category"].tolist(), payloads.CATEGORIES)
+
+        with patch(FO_URLFETCH, return_value=Mock(status_code=200, content=payloads._xls_bytes({"S": [["x"]]}))):
+            with self.assertRaises(derivatives.derivative_data.NSEdataNotFound):
+                derivatives.category_turnover_fo("17-02-2025")
+
+    def test_range_downloads_the_trading_days(self):
+        def urlfetch(url, *args, **kwargs):
+            if url.endswith("_190225.xls"):
+                return Mock(status_code=404, content=b"")
+            return Mock(status_code=200, content=payloads.category_turnover_xls(blocks=1))
+
+        with patch(CASH_URLFETCH, side_effect=urlfetch) as fetched:
+            data_df = capital_market.category_turnover_cash_range("14-02-2025", "19-02-2025")
+
+        # 15th and 16th are a weekend, the 19th file is missing
+        self.assertEqual(sorted(call.args[0][-10:-4] for call in fetched.call_args_list),
+                         ["140225", "170225", "180225", "190225"])
+        self.assertEqual(len(data_df), 3 * len(payloads.CATEGORIES))
+
+        with patch(FO_URLFETCH, return_value=Mock(status_code=200, content=payloads.category_turnover_xls(1))):
+            fo_df = derivatives.category_turnover_fo_range("17-02-2025", "18-02-2025", max_workers=2)
+        self.assertEqual(len(fo_df), 2 * len(payloads.CATEGORIES))
+
+
+if __name__ == "__main__":
+    unittest.main()
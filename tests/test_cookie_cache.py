@@ -0,0 +1,56 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from nselib.cookie_cache import CookieCache
+
+
+def _cookie(name="nsit", value="abc", expires=None):
+    cookie = Mock(value=value, domain=".nseindia.com", path="/", expires=expires, secure=True)
+    cookie.name = name
+    return cookie
+
+
+class TestCookieCache(unittest.TestCase):
+    origin = "https://www.nseindia.com/all-reports"
+
+    def test_entry_expires_after_ttl(self):
+        cache = CookieCache(ttl=60)
+        cache.set(self.origin, [_cookie()])
+        self.assertEqual(cache.get(self.origin)[0]["value"], "abc")
+
+        with patch("nselib.cookie_cache.time.time", return_value=time.time() + 61):
+            self.assertIsNone(cache.get(self.origin))
+
+    def test_entry_expires_with_earliest_cookie(self):
+        cache = CookieCache(ttl=3600)
+        cache.set(self.origin, [_cookie(expires=int(time.time()) - 1), _cookie(name="bm_sv")])
+        self.assertIsNone(cache.get(self.origin))
+
+    def test_invalidate(self):
+        cache = CookieCache()
+        cache.set(self.origin, [_cookie()])
+        cache.invalidate(self.origin)
+        self.assertIsNone(cache.get(self.origin))
+
+    def test_cookies_are_shared_through_the_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "cookies.json")
+            writer, reader = CookieCache(path=path), CookieCache(path=path)
+            writer.set(self.origin, [_cookie(value="from-disk")])
+
+            self.assertEqual(reader.get(self.origin)[0]["value"], "from-disk")
+            self.assertEqual(CookieCache(path=path).get(self.origin)[0]["value"], "from-disk")
+
+    def test_unreadable_file_is_ignored(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "cookies.json")
+            with open(path, "w") as fh:
+                fh.write("not json")
+            self.assertIsNone(CookieCache(path=path).get(self.origin))
+
+
+if __name__ == "__main__":
+    unittest.main()
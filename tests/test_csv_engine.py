@@ -0,0 +1,63 @@
+import importlib.util
+import io
+import unittest
+import zipfile
+from unittest.mock import Mock, patch
+
+import pandas as pd
+
+import payloads
+from nselib import capital_market, libutil
+from nselib.constants import udiff_bhavcopy_schema
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+class TestCsvEngine(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(libutil.set_csv_engine, "auto")
+
+    def test_unknown_engine_is_rejected(self):
+        with self.assertRaises(ValueError):
+            libutil.set_csv_engine("polars")
+
+    def test_pyarrow_needs_pyarrow_installed(self):
+        with patch.object(libutil, "_pyarrow_available", False):
+            with self.assertRaises(ImportError):
+                libutil.set_csv_engine("pyarrow")
+            self.assertEqual(libutil.get_csv_engine(), "c")
+
+    def test_options_pyarrow_does_not_support_use_the_c_engine(self):
+        with patch.object(libutil.pd, "read_csv", wraps=pd.read_csv) as read_csv:
+            data_df = libutil.read_archive_csv(io.BytesIO(b"title\nA,B\n1,2\n"), engine="pyarrow", skiprows=1)
+
+        self.assertEqual(read_csv.call_args.kwargs["engine"], "c")
+        self.assertEqual(data_df.to_dict("list"), {"A": [1], "B": [2]})
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_pyarrow_reads_the_bhav_copy_like_the_c_engine(self):
+        with zipfile.ZipFile(io.BytesIO(payloads.udiff_bhav_copy_zip(2000, segment="FO"))) as zip_file:
+            content = zip_file.read(zip_file.namelist()[0])
+        frames = {}
+        for engine in ("c", "pyarrow"):
+            libutil.set_csv_engine(engine)
+            frames[engine] = libutil.read_csv_with_schema(io.BytesIO(content), udiff_bhavcopy_schema)
+
+        pd.testing.assert_frame_equal(frames["pyarrow"], frames["c"], check_categorical=False)
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+    def test_readers_without_schema_keep_the_c_engine_dtypes(self):
+        bond_csv = b"SYMBOL,SERIES,TRADE DATE,SETTLEMENT DATE,PRICE\nIRFC,N1 ,2022-03-17,2022-03-18,101.5\n"
+        frames = {}
+        for engine in ("c", "pyarrow"):
+            libutil.set_csv_engine(engine)
+            with patch("nselib.capital_market.capital_market_data.archive_urlfetch",
+                       return_value=Mock(status_code=200, content=bond_csv)):
+                frames[engine] = capital_market.corporate_bond_trade_report("17-03-2022")
+
+        pd.testing.assert_series_equal(frames["pyarrow"].dtypes, frames["c"].dtypes)
+        self.assertIsInstance(frames["pyarrow"]["TRADEDATE"].iloc[0], str)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from nselib import derivatives
+from nselib.constants import future_price_volume_data_column
+
+
+def _window_frame(from_date, option_type="-"):
+    data = {name: [0.0] for name in future_price_volume_data_column}
+    data.update({"TIMESTAMP": [from_date], "OPTION_TYPE": [option_type]})
+    return pd.DataFrame(data)
+
+
+class TestDerivativeRangeFetch(unittest.TestCase):
+    def test_future_windows_are_joined_in_date_order(self):
+        def fake_future_data(symbol, instrument, from_date, to_date):
+            return _window_frame(from_date)
+
+        with patch("nselib.derivatives.derivative_data.get_future_price_volume_data",
+                   side_effect=fake_future_data) as get_data:
+            data_df = derivatives.future_price_volume_data("SBIN", "FUTSTK", "01-01-2024", "30-06-2024")
+
+        self.assertEqual(get_data.call_count, 2)
+        self.assertEqual(data_df["TIMESTAMP"].tolist(), ["01-01-2024", "01-04-2024"])
+        self.assertEqual(list(data_df.index), [0, 1])
+
+    def test_option_windows_keep_both_option_types(self):
+        def fake_option_data(symbol, instrument, option_type, from_date, to_date):
+            return _window_frame(from_date, option_type)
+
+        with patch("nselib.derivatives.derivative_data.get_option_price_volume_data", side_effect=fake_option_data):
+            data_df = derivatives.option_price_volume_data("NIFTY", "OPTIDX", from_date="01-01-2024",
+                                                           to_date="30-06-2024")
+
+        self.assertEqual(data_df["OPTION_TYPE"].tolist(), ["PE", "CE", "PE", "CE"])
+        self.assertEqual(list(data_df.columns), future_price_volume_data_column)
+
+
+if __name__ == "__main__":
+    unittest.main()
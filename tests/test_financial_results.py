@@ -0,0 +1,148 @@
+import tempfile
+import threading
+import xml.etree.ElementTree as ET
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+import pandas as pd
+
+import payloads
+from nselib import archive_cache, capital_market, xbrl_cache
+from nselib.capital_market import get_func
+
+NS = {
+    "xbrli": "http://www.xbrl.org/2003/instance",
+    "in-bse-fin": "http://www.bseindia.com/xbrl/fin/2020-03-31/in-bse-fin",
+}
+KEYS = ["Symbol", "RevenueFromOperations", "OtherExpenses", "ProfitLossForPeriod", "OtherExpenses"]
+XBRL_URL = "https://nsearchives.nseindia.com/corporate/xbrl/{}.xml"
+
+
+def _filing(symbol, revenue):
+    return (
+        f'<xbrli:xbrl xmlns:xbrli="{NS["xbrli"]}" xmlns:in-bse-fin="{NS["in-bse-fin"]}">'
+        f'<in-bse-fin:Symbol contextRef="OneD">{symbol}</in-bse-fin:Symbol>'
+        f'<in-bse-fin:RevenueFromOperations contextRef="OneD">{revenue}</in-bse-fin:RevenueFromOperations>'
+        f'</xbrli:xbrl>'
+    ).encode()
+
+
+def _master(symbols):
+    master_df = pd.DataFrame({"symbol": symbols, "xbrl": [XBRL_URL.format(symbol) for symbol in symbols]})
+    return master_df, {}, NS, KEYS
+
+
+class TestFinancialResults(unittest.TestCase):
+    def test_filings_are_fetched_concurrently_in_master_order(self):
+        symbols = [f"SYM{index}" for index in range(12)]
+        threads = set()
+
+        def urlfetch(url, origin_url=None, **kwargs):
+            threads.add(threading.get_ident())
+            time.sleep(0.01)
+            symbol = url.rsplit("/", 1)[1][:-4]
+            return Mock(status_code=200, content=_filing(symbol, len(symbol)))
+
+        with patch("nselib.capital_market.capital_market_data.get_financial_results_master",
+                   return_value=_master(symbols)), \
+                patch("nselib.capital_market.get_func.nse_urlfetch", side_effect=urlfetch):
+            fin_df = capital_market.financial_results_for_equity(period="1W", max_workers=4)
+
+        self.assertEqual(fin_df["Symbol"].tolist(), symbols)
+        self.assertEqual(fin_df.columns.tolist(),
+                         ["Symbol", "RevenueFromOperations", "OtherExpenses", "ProfitLossForPeriod", "xbrl", "error"])
+        self.assertTrue(fin_df["error"].isna().all())
+        self.assertTrue(pd.isna(fin_df["ProfitLossForPeriod"].iloc[0]))
+        self.assertGreater(len(threads), 1)
+
+    def test_failing_filing_is_recorded(self):
+        def urlfetch(url, origin_url=None, **kwargs):
+            if "BAD" in url:
+                return Mock(status_code=200, content=b"<xbrli:xbrl")
+            if "GONE" in url:
+                return Mock(status_code=404, content=b"")
+            return Mock(status_code=200, content=_filing("SBIN", "100"))
+
+        with patch("nselib.capital_market.capital_market_data.get_financial_results_master",
+                   return_value=_master(["SBIN", "BAD", "GONE"])), \
+                patch("nselib.capital_market.get_func.nse_urlfetch", side_effect=urlfetch):
+            fin_df = capital_market.financial_results_for_equity(period="1W")
+
+        self.assertEqual(fin_df["Symbol"].tolist()[0], "SBIN")
+        self.assertTrue(pd.isna(fin_df["error"].iloc[0]))
+        self.assertIn("ParseError", fin_df["error"].iloc[1])
+        self.assertIn("NSEdataNotFound", fin_df["error"].iloc[2])
+        self.assertEqual(fin_df["xbrl"].iloc[2], XBRL_URL.format("GONE"))
+        self.assertTrue(fin_df.iloc[1:][["Symbol", "RevenueFromOperations"]].isna().all().all())
+
+    def test_cached_filings_are_not_downloaded_again(self):
+        def urlfetch(url, origin_url=None, **kwargs):
+            if "BAD" in url:
+                return Mock(status_code=500, content=b"")
+            return Mock(status_code=200, content=_filing(url.rsplit("/", 1)[1][:-4], "100"))
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = xbrl_cache.configure_xbrl_cache(f"{cache_dir}/xbrl.sqlite3")
+            self.addCleanup(xbrl_cache.disable_xbrl_cache)
+            with patch("nselib.capital_market.capital_market_data.get_financial_results_master",
+                       return_value=_master(["SBIN", "TCS", "BAD"])), \
+                    patch("nselib.capital_market.get_func.nse_urlfetch", side_effect=urlfetch):
+                first = capital_market.financial_results_for_equity(period="1W")
+            self.assertEqual(len(cache), 2)
+
+            with patch("nselib.capital_market.capital_market_data.get_financial_results_master",
+                       return_value=_master(["SBIN", "TCS", "BAD", "INFY"])), \
+                    patch("nselib.capital_market.get_func.nse_urlfetch", side_effect=urlfetch) as fetched:
+                second = capital_market.financial_results_for_equity(period="1W")
+                with archive_cache.bypass():
+                    capital_market.financial_results_for_equity(period="1W")
+
+        self.assertEqual([call.args[0] for call in fetched.call_args_list[:2]],
+                         [XBRL_URL.format("BAD"), XBRL_URL.format("INFY")])
+        self.assertEqual(fetched.call_count, 6)
+        self.assertTrue(first.equals(second.iloc[:3]))
+        self.assertEqual(second["Symbol"].fillna("").tolist(), ["SBIN", "TCS", "", "INFY"])
+
+    def test_records_with_fewer_keys_are_parsed_again(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = xbrl_cache.XBRLCache(f"{cache_dir}/xbrl.sqlite3")
+            self.addCleanup(cache.close)
+            cache.set(XBRL_URL.format("SBIN"), {"Symbol": "SBIN"})
+
+            self.assertEqual(cache.get(XBRL_URL.format("SBIN")), {"Symbol": "SBIN"})
+            self.assertIsNone(cache.get(XBRL_URL.format("SBIN"), keys=KEYS))
+            self.assertEqual(cache.get_many([XBRL_URL.format(index) for index in range(1200)]), {})
+
+
+class TestParseXbrl(unittest.TestCase):
+    def _find_each_key(self, content, keys):
+        root = ET.fromstring(content)
+        return {key: getattr(root.find(f".//in-bse-fin:{key}", NS), "text", None) for key in keys}
+
+    def test_single_pass_matches_a_search_per_key(self):
+        content = payloads.xbrl_financial_result(KEYS[:2], segments=20)
+        keys = KEYS + ["SegmentRevenue", "SegmentAssets"]
+
+        self.assertEqual(get_func.parse_xbrl_financial_result(content, NS, keys), self._find_each_key(content, keys))
+
+    def test_first_element_wins_and_nested_or_empty_elements(self):
+        content = (
+            f'<xbrli:xbrl xmlns:xbrli="{NS["xbrli"]}" xmlns:in-bse-fin="{NS["in-bse-fin"]}">'
+            f'<xbrli:context id="OneD"><in-bse-fin:Symbol>NESTED</in-bse-fin:Symbol></xbrli:context>'
+            f'<in-bse-fin:Symbol contextRef="OneD">SBIN</in-bse-fin:Symbol>'
+            f'<in-bse-fin:OtherExpenses contextRef="OneD"/>'
+            f'<in-bse-fin:RevenueFromOperations contextRef="FourD">1</in-bse-fin:RevenueFromOperations>'
+            f'<in-bse-fin:RevenueFromOperations contextRef="OneD">2</in-bse-fin:RevenueFromOperations>'
+            f'</xbrli:xbrl>'
+        ).encode()
+
+        extracted = get_func.parse_xbrl_financial_result(content, NS, KEYS)
+
+        self.assertEqual(extracted, self._find_each_key(content, KEYS))
+        self.assertEqual(extracted["Symbol"], "NESTED")
+        self.assertEqual(extracted["RevenueFromOperations"], "1")
+
+
+if __name__ == "__main__":
+    unittest.main()
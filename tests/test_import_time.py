@@ -0,0 +1,56 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# bare `import nselib` only loads logging, a few ms; the budget leaves room for slow CI machines
+IMPORT_BUDGET_SECONDS = 0.25
+
+LAZY_MODULES = ["pandas_market_calendars", "pyppeteer", "pdfplumber", "pypdf"]
+
+
+def _run(code):
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+class TestImportTime(unittest.TestCase):
+    def test_import_nselib_is_fast(self):
+        result = _run(
+            "import json, sys, time\n"
+            "start = time.perf_counter()\n"
+            "import nselib\n"
+            "seconds = time.perf_counter() - start\n"
+            "print(json.dumps({'seconds': seconds, 'pandas': 'pandas' in sys.modules}))\n"
+        )
+        self.assertFalse(result["pandas"], "import nselib should not import pandas")
+        self.assertLess(result["seconds"], IMPORT_BUDGET_SECONDS)
+
+    def test_heavy_dependencies_load_on_first_use(self):
+        result = _run(
+            "import json, sys\n"
+            "import nselib.capital_market, nselib.derivatives, nselib.indices, nselib.debt, nselib.cash_market\n"
+            "import nselib.mutual_funds, nselib.nsdl_fpi, nselib.aio\n"
+            f"loaded = [name for name in {LAZY_MODULES!r} if name in sys.modules]\n"
+            "from nselib import libutil\n"
+            "libutil.nse_calendar\n"
+            "print(json.dumps({'loaded': loaded, 'calendar': 'pandas_market_calendars' in sys.modules}))\n"
+        )
+        self.assertEqual(result["loaded"], [])
+        self.assertTrue(result["calendar"])
+
+    def test_trading_holiday_calendar_is_still_exported(self):
+        result = _run(
+            "import json\n"
+            "import nselib\n"
+            "from nselib import trading_holiday_calendar\n"
+            "print(json.dumps({'name': trading_holiday_calendar.__name__}))\n"
+        )
+        self.assertEqual(result["name"], "trading_holiday_calendar")
+
+
+if __name__ == "__main__":
+    unittest.main()
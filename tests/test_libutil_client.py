@@ -0,0 +1,159 @@
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+
+from nselib import libutil
+from nselib.cookie_cache import CookieCache
+from nselib.rate_limit import RateLimiter
+from nselib.retry import RetryPolicy
+
+
+def _cookie(name="nsit", value="abc", expires=None):
+    cookie = Mock(value=value, domain=".nseindia.com", path="/", expires=expires, secure=True)
+    cookie.name = name
+    return cookie
+
+
+def _response(status_code=200, cookies=(), headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.cookies = list(cookies)
+    response.headers = headers or {}
+    return response
+
+
+class TestNSEClient(unittest.TestCase):
+    def setUp(self):
+        self.client = libutil.NSEClient(cookie_cache=CookieCache(), rate_limiter=RateLimiter())
+        self.origin = "https://www.nseindia.com/option-chain"
+        self.url = "https://www.nseindia.com/api/allIndices"
+
+    def test_origin_is_fetched_once_for_repeated_calls(self):
+        with patch.object(self.client.session, "get", return_value=_response()) as session_get:
+            for _ in range(3):
+                self.client.get(self.url, origin_url=self.origin)
+
+        requested = [call.args[0] for call in session_get.call_args_list]
+        self.assertEqual(requested.count(self.origin), 1)
+        self.assertEqual(requested.count(self.url), 3)
+
+    def test_cookies_are_refreshed_once_on_forbidden(self):
+        responses = [_response(), _response(403), _response(), _response(200)]
+        with patch.object(self.client.session, "get", side_effect=responses) as session_get:
+            response = self.client.get(self.url, origin_url=self.origin)
+
+        requested = [call.args[0] for call in session_get.call_args_list]
+        self.assertEqual(requested, [self.origin, self.url, self.origin, self.url])
+        self.assertEqual(response.status_code, 200)
+
+    def test_archive_forbidden_does_not_refresh_cookies(self):
+        url = "https://nsearchives.nseindia.com/content/fo/fo12345.zip"
+        with patch.object(self.client.session, "get", side_effect=[_response(), _response(403)]) as session_get:
+            response = self.client.get(url, origin_url=self.origin)
+
+        self.assertEqual([call.args[0] for call in session_get.call_args_list], [self.origin, url])
+        self.assertEqual(response.status_code, 403)
+
+    def test_concurrent_forbidden_refreshes_cookies_once(self):
+        workers = 4
+        rejected = threading.Barrier(workers)
+        origin_fetches = []
+
+        def session_get(url, **kwargs):
+            if url == self.origin:
+                origin_fetches.append(url)
+                return _response(cookies=[_cookie(value=str(len(origin_fetches)))])
+            if len(origin_fetches) == 1:
+                # every request is sent with the first cookies before any of them is refreshed
+                rejected.wait(timeout=5)
+                return _response(403)
+            return _response(200)
+
+        responses = []
+        with patch.object(self.client.session, "get", side_effect=session_get):
+            threads = [threading.Thread(target=lambda: responses.append(self.client.get(self.url, self.origin)))
+                       for _ in range(workers)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(origin_fetches), 2)
+        self.assertEqual([response.status_code for response in responses], [200] * workers)
+
+    def test_expired_cookies_are_refreshed(self):
+        expired_cookie = _cookie(expires=int(time.time()) - 1)
+        responses = [_response(cookies=[expired_cookie]), _response(), _response(), _response()]
+        with patch.object(self.client.session, "get", side_effect=responses) as session_get:
+            self.client.get(self.url, origin_url=self.origin)
+            self.client.get(self.url, origin_url=self.origin)
+
+        requested = [call.args[0] for call in session_get.call_args_list]
+        self.assertEqual(requested.count(self.origin), 2)
+
+    def test_second_client_reuses_cached_cookies(self):
+        cache = CookieCache()
+        first = libutil.NSEClient(cookie_cache=cache, rate_limiter=RateLimiter())
+        second = libutil.NSEClient(cookie_cache=cache, rate_limiter=RateLimiter())
+        with patch.object(first.session, "get", return_value=_response(cookies=[_cookie()])):
+            first.get(self.url, origin_url=self.origin)
+        with patch.object(second.session, "get", return_value=_response()) as session_get:
+            second.get(self.url, origin_url=self.origin)
+
+        self.assertEqual([call.args[0] for call in session_get.call_args_list], [self.url])
+        self.assertEqual(second.session.cookies.get("nsit"), "abc")
+
+    def test_get_nse_client_is_shared(self):
+        self.assertIs(libutil.get_nse_client(), libutil.get_nse_client())
+        self.assertIsNot(libutil.get_nse_client(), libutil.get_nse_client(trust_env=False))
+        self.assertFalse(libutil.get_nse_client(trust_env=False).session.trust_env)
+
+
+class TestNSEClientRetry(unittest.TestCase):
+    def setUp(self):
+        self.policy = RetryPolicy(max_attempts=3, backoff=0.5, jitter=0, timeout=(3, 30))
+        self.client = libutil.NSEClient(cookie_cache=CookieCache(), rate_limiter=RateLimiter(),
+                                        retry_policy=self.policy)
+        self.url = "https://nsearchives.nseindia.com/content/nsccl/fao_participant_oi_02012024.csv"
+        self.sleeps = []
+        patcher = patch("nselib.retry.time.sleep", side_effect=self.sleeps.append)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_server_errors_are_retried_with_backoff(self):
+        responses = [_response(), _response(503), _response(502), _response(200)]
+        with patch.object(self.client.session, "get", side_effect=responses) as session_get:
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.sleeps, [0.5, 1.0])
+        self.assertEqual(session_get.call_args.kwargs["timeout"], (3, 30))
+
+    def test_timeouts_are_retried_and_the_last_error_raised(self):
+        errors = [_response(), requests.Timeout("read timed out"), requests.ConnectionError("reset"),
+                  requests.Timeout("read timed out")]
+        with patch.object(self.client.session, "get", side_effect=errors):
+            with self.assertRaises(requests.Timeout):
+                self.client.get(self.url)
+        self.assertEqual(len(self.sleeps), 2)
+
+    def test_retry_after_is_respected_and_last_response_returned(self):
+        responses = [_response(), _response(429, headers={"Retry-After": "2"}), _response(429), _response(429)]
+        with patch.object(self.client.session, "get", side_effect=responses):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(self.sleeps, [2.0, 1.0])
+
+    def test_not_found_is_not_retried(self):
+        with patch.object(self.client.session, "get", side_effect=[_response(), _response(404)]) as session_get:
+            self.assertEqual(self.client.get(self.url).status_code, 404)
+        self.assertEqual(session_get.call_count, 2)
+        self.assertEqual(self.sleeps, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import json
+import os
+import unittest
+from unittest.mock import Mock, patch
+
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+
+from nselib import derivatives
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+
+def _load(name):
+    with open(os.path.join(DATA_DIR, name), encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+class TestLiveOptionChain(unittest.TestCase):
+    """
+    option_chain_nifty.json is a recorded NIFTY option-chain-v3 payload (trimmed to two expiries), the expected
+    frames were produced by the row by row parser this implementation replaced.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.payload = _load("option_chain_nifty.json")
+        cls.expected = _load("option_chain_nifty_expected.json")
+
+    def _option_chain(self, **kwargs):
+        response = Mock()
+        response.json.return_value = self.payload
+        with patch("nselib.derivatives.derivative_data.get_nse_option_chain", return_value=response):
+            return derivatives.nse_live_option_chain("NIFTY", **kwargs)
+
+    def _assert_matches(self, data_df, key):
+        expected = self.expected[key]
+        self.assertEqual(list(data_df.columns), expected["columns"])
+        expected_df = pd.DataFrame(expected["data"], columns=expected["columns"])
+        pd.testing.assert_frame_equal(data_df, expected_df, check_dtype=False)
+        for name, dtype in zip(expected["columns"], expected["dtypes"]):
+            if is_numeric_dtype(data_df[name]):
+                self.assertEqual(str(data_df[name].dtype), dtype, name)
+
+    def test_full_mode(self):
+        self._assert_matches(self._option_chain(oi_mode="full"), "full_all")
+
+    def test_compact_mode(self):
+        self._assert_matches(self._option_chain(oi_mode="compact"), "compact_all")
+
+    def test_expiry_filter(self):
+        self._assert_matches(self._option_chain(expiry_date="28-10-2025"), "full_28-10-2025")
+        self._assert_matches(self._option_chain(expiry_date="28-10-2025", oi_mode="compact"), "compact_28-10-2025")
+
+    def test_unknown_expiry_is_empty(self):
+        data_df = self._option_chain(expiry_date="04-11-2025")
+        self.assertTrue(data_df.empty)
+        self.assertEqual(list(data_df.columns), self.expected["full_none"]["columns"])
+
+    def test_missing_legs_are_zero(self):
+        data_df = self._option_chain()
+        self.assertEqual(data_df.loc[0, ["PUTS_OI", "PUTS_LTP", "PUTS_Ask_Qty"]].tolist(), [0, 0, 0])
+        self.assertEqual(data_df.loc[3, ["CALLS_OI", "CALLS_IV", "CALLS_Bid_Price"]].tolist(), [0, 0, 0])
+        # a leg without the best bid quantity is dropped in full mode only
+        self.assertEqual(data_df.loc[5, "CALLS_OI"], 0)
+        self.assertNotEqual(self._option_chain(oi_mode="compact").loc[5, "CALLS_OI"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
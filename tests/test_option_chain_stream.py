@@ -0,0 +1,72 @@
+import copy
+import json
+import os
+import unittest
+from unittest.mock import Mock, patch
+
+from nselib import derivatives
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+
+class TestOptionChainStream(unittest.TestCase):
+    def setUp(self):
+        with open(os.path.join(DATA_DIR, "option_chain_nifty.json"), encoding="utf-8") as fh:
+            self.payload = json.load(fh)
+        self.stream = derivatives.OptionChainStream("NIFTY", expiry_date="28-10-2025", interval=0)
+
+    def _poll(self, payload):
+        response = Mock()
+        response.json.return_value = payload
+        with patch("nselib.derivatives.option_chain_stream.get_nse_option_chain", return_value=response) as get_chain:
+            data_df = self.stream.poll()
+        get_chain.assert_called_once_with("NIFTY", "28-Oct-2025")
+        return data_df
+
+    def _tick(self, timestamp):
+        payload = copy.deepcopy(self.payload)
+        payload["records"]["timestamp"] = timestamp
+        return payload
+
+    def test_first_poll_is_the_whole_expiry(self):
+        data_df = self._poll(self.payload)
+        self.assertEqual(len(data_df), 13)
+        self.assertEqual(set(data_df["Expiry_Date"]), {"28-Oct-2025"})
+        self.assertEqual(self.stream.timestamp, "17-Oct-2025 15:30:00")
+
+    def test_only_changed_strikes_are_returned(self):
+        self._poll(self.payload)
+        payload = self._tick("17-Oct-2025 15:30:03")
+        rows = [row for row in payload["records"]["data"] if row["expiryDates"] == "28-Oct-2025"]
+        rows[2]["CE"]["openInterest"] += 75
+        rows[9]["PE"]["impliedVolatility"] += 0.5
+        rows[4]["CE"]["totalTradedVolume"] += 1000  # not watched
+
+        data_df = self._poll(payload)
+
+        self.assertEqual(data_df["Strike_Price"].tolist(), [rows[2]["strikePrice"], rows[9]["strikePrice"]])
+        self.assertEqual(data_df["Fetch_Time"].unique().tolist(), ["17-Oct-2025 15:30:03"])
+
+    def test_unchanged_poll_is_empty(self):
+        self._poll(self.payload)
+        data_df = self._poll(self._tick("17-Oct-2025 15:30:03"))
+        self.assertTrue(data_df.empty)
+        self.assertIn("CALLS_OI", data_df.columns)
+
+    def test_iteration_skips_quiet_ticks_and_failures(self):
+        changed = self._tick("17-Oct-2025 15:30:06")
+        changed["records"]["data"][-1]["PE"]["lastPrice"] += 1
+        responses = [Mock(json=Mock(return_value=self.payload)), Mock(json=Mock(return_value=self.payload)),
+                     ConnectionError("reset"), Mock(json=Mock(return_value=changed))]
+        received = []
+        with patch("nselib.derivatives.option_chain_stream.get_nse_option_chain", side_effect=responses):
+            for data_df in self.stream:
+                received.append(len(data_df))
+                if len(received) == 2:
+                    self.stream.stop()
+
+        self.assertEqual(received, [13, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from nselib import libutil
+from nselib.cookie_cache import CookieCache
+from nselib.rate_limit import RateLimiter
+
+ARCHIVE_URL = "https://nsearchives.nseindia.com/content/cm/BhavCopy_NSE_CM_0_0_0_20240102_F_0000.csv.zip"
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_requests_are_spread_at_the_configured_rate(self):
+        limiter = RateLimiter({("nsearchives.nseindia.com",): (20, None)})
+        start = time.monotonic()
+        for _ in range(25):
+            with limiter.request(ARCHIVE_URL):
+                pass
+        # a burst of 20 then 5 more at 20/s
+        self.assertGreaterEqual(time.monotonic() - start, 0.2)
+
+    def test_concurrency_is_capped(self):
+        limiter = RateLimiter({("nsearchives.nseindia.com",): (None, 2)})
+        peak, lock = [0], threading.Lock()
+
+        def fetch(_):
+            with limiter.request(ARCHIVE_URL):
+                with lock:
+                    peak[0] = max(peak[0], limiter.in_flight("nsearchives.nseindia.com"))
+                time.sleep(0.02)
+
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            list(executor.map(fetch, range(12)))
+
+        self.assertEqual(peak[0], 2)
+        self.assertEqual(limiter.in_flight("nsearchives.nseindia.com"), 0)
+
+    def test_hosts_share_a_limit_and_unknown_hosts_are_free(self):
+        limiter = RateLimiter({("www.nseindia.com", "nseindia.com"): (1, 1)})
+        self.assertIs(limiter.get("nseindia.com"), limiter.get("WWW.NSEINDIA.COM"))
+        self.assertIsNone(limiter.get("example.com"))
+        start = time.monotonic()
+        for _ in range(5):
+            with limiter.request("https://example.com/data.csv"):
+                pass
+        self.assertLess(time.monotonic() - start, 0.1)
+
+    def test_client_requests_go_through_the_limiter(self):
+        limiter = RateLimiter({("www.nseindia.com", "nseindia.com"): (None, 1)})
+        client = libutil.NSEClient(cookie_cache=CookieCache(), rate_limiter=limiter)
+        in_flight = []
+
+        def session_get(url, **kwargs):
+            in_flight.append(limiter.in_flight("www.nseindia.com"))
+            return Mock(status_code=200, cookies=[])
+
+        with patch.object(client.session, "get", side_effect=session_get):
+            client.get("https://www.nseindia.com/api/allIndices", origin_url="https://www.nseindia.com/")
+
+        self.assertEqual(in_flight, [1, 1])
+
+    def test_streamed_response_holds_its_slot_until_closed(self):
+        limiter = RateLimiter({("nsearchives.nseindia.com",): (None, 1)})
+        client = libutil.NSEClient(cookie_cache=CookieCache(), rate_limiter=limiter)
+        responses = [Mock(status_code=200, cookies=[]), Mock(status_code=200, cookies=[])]
+        close = responses[1].close
+
+        with patch.object(client.session, "get", side_effect=responses):
+            response = client.get(ARCHIVE_URL, origin_url="https://www.nseindia.com/", stream=True)
+            self.assertEqual(limiter.in_flight("nsearchives.nseindia.com"), 1)
+            response.close()
+            response.close()
+
+        self.assertEqual(limiter.in_flight("nsearchives.nseindia.com"), 0)
+        close.assert_called_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
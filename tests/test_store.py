@@ -0,0 +1,113 @@
+import importlib.util
+import io
+import os
+import tempfile
+import unittest
+from datetime import date, datetime
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+import payloads
+from nselib import libutil
+from nselib.constants import udiff_bhavcopy_schema
+
+FNO_BHAV_COPY = "nselib.derivatives.fno_bhav_copy"
+
+
+def _fake_fno_bhav_copy(trade_date):
+    day = datetime.strptime(trade_date, "%d-%m-%Y")
+    if day == datetime(2024, 1, 4):
+        raise FileNotFoundError(" Data not found, change the trade_date...")
+    # one day with more than 127 symbols, its dictionary index is wider than the other days'
+    rows = 13000 if day == datetime(2024, 1, 2) else 300
+    content = payloads.udiff_bhav_copy_zip(rows, segment="FO", trade_date=day.strftime("%Y-%m-%d"))
+    return libutil.read_zipped_csv(io.BytesIO(content), "", udiff_bhavcopy_schema)
+
+
+@unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow is not installed")
+class TestBhavCopyStore(unittest.TestCase):
+    def setUp(self):
+        from nselib.store import BhavCopyStore
+
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.store = BhavCopyStore("fno_bhav_copy", directory=tmp_dir.name)
+
+    def test_update_only_fetches_the_missing_trading_days(self):
+        with patch(FNO_BHAV_COPY, side_effect=_fake_fno_bhav_copy, autospec=True) as bhav_copy:
+            added = self.store.update("01-01-2024", "03-01-2024")
+        self.assertEqual(added, [date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 3)])
+        self.assertEqual(bhav_copy.call_count, 3)
+
+        with patch(FNO_BHAV_COPY, side_effect=_fake_fno_bhav_copy, autospec=True) as bhav_copy:
+            added = self.store.update("01-01-2024", "08-01-2024", max_workers=2)
+
+        self.assertEqual(sorted(call.args[0] for call in bhav_copy.call_args_list),
+                         ["04-01-2024", "05-01-2024", "08-01-2024"])
+        self.assertEqual(added, [date(2024, 1, 5), date(2024, 1, 8)])
+        self.assertEqual(len(self.store.dates()), 5)
+        self.assertEqual(self.store.missing_dates("01-01-2024", "08-01-2024"), [datetime(2024, 1, 4)])
+
+    def test_read_filters_symbols_and_dates(self):
+        for trade_date in ("01-01-2024", "02-01-2024", "03-01-2024"):
+            self.store.write(trade_date, _fake_fno_bhav_copy(trade_date))
+        symbols = _fake_fno_bhav_copy("01-01-2024")["TckrSymb"].unique().tolist()[:2]
+
+        data_df = self.store.read(symbols=symbols, from_date="02-01-2024", to_date="03-01-2024")
+
+        self.assertEqual(set(data_df["TckrSymb"]), set(symbols))
+        self.assertEqual(data_df["TradDt"].dt.strftime("%d-%m-%Y").unique().tolist(), ["02-01-2024", "03-01-2024"])
+        self.assertIsInstance(data_df["TckrSymb"].dtype, pd.CategoricalDtype)
+        self.assertEqual(data_df["TradDt"].dtype, np.dtype("datetime64[ns]"))
+        self.assertEqual(data_df["NewBrdLotQty"].dtype, np.int32)
+        self.assertNotIn("trade_date", data_df.columns)
+
+    def test_every_day_is_stored_with_the_same_types(self):
+        import pyarrow.parquet as pq
+
+        first = _fake_fno_bhav_copy("01-01-2024")
+        second = _fake_fno_bhav_copy("02-01-2024").head(50)
+        # a blank lot size makes pandas read the column as float64, whole prices as int64
+        second["NewBrdLotQty"] = second["NewBrdLotQty"].astype(np.float64).where(second.index > 0)
+        second["ClsPric"] = second["ClsPric"].round().astype(np.int64)
+        self.store.write("01-01-2024", first)
+        self.store.write("02-01-2024", second)
+
+        schemas = [pq.read_schema(os.path.join(self.store._partition_dir(day), "part-0.parquet")).remove_metadata()
+                   for day in self.store.dates()]
+        self.assertEqual(schemas[0], schemas[1])
+        self.assertEqual(str(schemas[0].field("NewBrdLotQty").type), "int32")
+        self.assertEqual(str(schemas[0].field("ClsPric").type), "double")
+        data_df = self.store.read(from_date="02-01-2024")
+        self.assertEqual(data_df["NewBrdLotQty"].isna().sum(), 1)
+        self.assertEqual(data_df["ClsPric"].dtype, np.float64)
+
+    def test_read_of_selected_columns_and_empty_store(self):
+        self.assertTrue(self.store.read().empty)
+        self.store.write("01-01-2024", _fake_fno_bhav_copy("01-01-2024"))
+
+        data_df = self.store.read(symbols="SYM0000", columns=["TckrSymb", "ClsPric"])
+
+        self.assertEqual(data_df.columns.tolist(), ["TckrSymb", "ClsPric"])
+        self.assertEqual(data_df["TckrSymb"].unique().tolist(), ["SYM0000"])
+
+    def test_rewritten_and_deleted_days(self):
+        self.store.write("01-01-2024", _fake_fno_bhav_copy("01-01-2024"))
+        self.store.write("01-01-2024", _fake_fno_bhav_copy("01-01-2024").head(5))
+        self.assertEqual(len(self.store.read()), 5)
+        self.assertEqual(os.listdir(self.store._partition_dir(date(2024, 1, 1))), ["part-0.parquet"])
+
+        self.store.delete("01-01-2024")
+        self.assertEqual(self.store.dates(), [])
+
+    def test_unknown_report(self):
+        from nselib.store import BhavCopyStore
+
+        with self.assertRaises(ValueError):
+            BhavCopyStore("option_chain")
+
+
+if __name__ == "__main__":
+    unittest.main()
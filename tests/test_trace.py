@@ -0,0 +1,114 @@
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pandas as pd
+import requests
+
+from nselib import archive_cache, capital_market, libutil, trace
+from nselib.cookie_cache import CookieCache
+from nselib.rate_limit import RateLimiter
+
+PE_URL = "https://nsearchives.nseindia.com/content/equities/peDetail/PE_170322.csv"
+PE_CSV = b"SYMBOL,SERIES,P/E\nSBIN,EQ,9.5\nTCS,EQ,30.1\n"
+
+
+def _session_get(url, headers=None, **kwargs):
+    response = requests.Response()
+    response.url = url
+    response.status_code = 200
+    response._content = PE_CSV if url == PE_URL else b"<html></html>"
+    return response
+
+
+@trace.traced
+def _backfill(windows):
+    return libutil.fetch_date_windows(lambda from_date, to_date: trace.emit("fetch", url=from_date, bytes=1),
+                                      windows, max_workers=4)
+
+
+def _bhav_copy(trade_date):
+    trace.emit("fetch", url=trade_date, bytes=1)
+    return pd.DataFrame({"TckrSymb": ["NIFTY"]})
+
+
+@trace.traced
+def _bhav_copy_range(days):
+    return libutil.fetch_trading_days(_bhav_copy, days, max_workers=2)
+
+
+class TestTrace(unittest.TestCase):
+    def setUp(self):
+        self.client = libutil.NSEClient(cookie_cache=CookieCache(), rate_limiter=RateLimiter())
+        patcher = patch.object(libutil, "get_nse_client", return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_phases_are_tagged_with_the_public_function(self):
+        with patch.object(self.client.session, "get", side_effect=_session_get):
+            with trace.collect() as events:
+                capital_market.pe_ratio("17-03-2022")
+
+        self.assertEqual([event.phase for event in events], ["cookie_fetch", "fetch", "parse"])
+        self.assertEqual({event.function for event in events}, {"capital_market.pe_ratio"})
+        cookie_fetch, fetch, parse = events
+        self.assertEqual(cookie_fetch.url, "http://nseindia.com")
+        self.assertEqual((fetch.url, fetch.status_code, fetch.bytes), (PE_URL, 200, len(PE_CSV)))
+        self.assertEqual(parse.rows, 2)
+        self.assertGreaterEqual(parse.elapsed, parse.duration)
+        self.assertIsNone(parse.error)
+
+    def test_failed_call_reports_the_error(self):
+        with patch.object(self.client.session, "get", side_effect=requests.ConnectionError("reset")):
+            with patch("nselib.retry.time.sleep"), trace.collect() as events:
+                with self.assertRaises(requests.ConnectionError):
+                    capital_market.pe_ratio("17-03-2022")
+
+        self.assertIn("reset", events[0].error)
+        self.assertEqual(events[-1].phase, "parse")
+        self.assertIn("ConnectionError", events[-1].error)
+
+    def test_concurrent_windows_keep_the_function_tag(self):
+        windows = [(f"0{day}-01-2024", f"0{day}-01-2024") for day in range(1, 9)]
+        with trace.collect() as events:
+            _backfill(windows)
+
+        fetches = [event for event in events if event.phase == "fetch"]
+        self.assertEqual(sorted(event.url for event in fetches), sorted(start for start, _ in windows))
+        self.assertEqual({event.function for event in events}, {"test_trace._backfill"})
+
+    def test_generator_result_is_traced_until_exhausted(self):
+        days = [datetime(2024, 1, day) for day in range(1, 6)]
+        with trace.collect() as events:
+            day_frames = _bhav_copy_range(days)
+            self.assertEqual(events, [])
+            self.assertEqual(len(list(day_frames)), len(days))
+
+        self.assertEqual([event.phase for event in events], ["fetch"] * len(days) + ["parse"])
+        self.assertEqual({event.function for event in events}, {"test_trace._bhav_copy_range"})
+        self.assertEqual(events[-1].rows, len(days))
+
+    def test_archive_cache_hit_is_a_cached_fetch(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            archive_cache.configure_archive_cache(cache_dir)
+            self.addCleanup(archive_cache.disable_archive_cache)
+            archive_cache.get_archive_cache().set(PE_URL, PE_CSV)
+            with trace.collect() as events:
+                libutil.archive_urlfetch(PE_URL, datetime(2022, 3, 17))
+
+        self.assertTrue(events[0].cached)
+        self.assertEqual(events[0].bytes, len(PE_CSV))
+
+    def test_failing_hook_does_not_break_the_call(self):
+        with patch.object(self.client.session, "get", side_effect=_session_get):
+            with trace.hook(Mock(side_effect=RuntimeError("metrics down"))) as hook:
+                data_df = capital_market.pe_ratio("17-03-2022")
+
+        self.assertEqual(hook.call_count, 3)
+        self.assertEqual(len(data_df), 2)
+        self.assertFalse(trace.enabled())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from datetime import date, datetime
+from unittest.mock import patch
+
+from nselib import libutil
+from nselib.libutil import TradingSessionIndex
+
+
+class TestTradingSessionIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = TradingSessionIndex()
+        patcher = patch.object(libutil, "trading_session_index", self.index)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_holidays_and_weekends(self):
+        # 26-01-2024 is Republic Day (Friday)
+        self.assertEqual(libutil.previous_trading_day("26-01-2024"), datetime(2024, 1, 25))
+        self.assertEqual(libutil.next_trading_day(date(2024, 1, 26)), datetime(2024, 1, 29))
+        self.assertEqual(libutil.previous_trading_day(datetime(2024, 1, 29)), datetime(2024, 1, 25))
+        self.assertEqual(libutil.previous_trading_day("25-01-2024", inclusive=True), datetime(2024, 1, 25))
+        self.assertEqual(libutil.next_trading_day("25-01-2024", inclusive=True), datetime(2024, 1, 25))
+        self.assertEqual(libutil.next_trading_day("25-01-2024"), datetime(2024, 1, 29))
+
+    def test_trading_days_between_matches_the_calendar(self):
+        expected = [
+            datetime(day.year, day.month, day.day)
+            for day in libutil.nse_calendar.valid_days(start_date="2023-12-20", end_date="2024-02-10")
+        ]
+        self.assertEqual(libutil.trading_days_between("20-12-2023", "10-02-2024"), expected)
+        self.assertEqual(libutil.trading_days_between("27-01-2024", "28-01-2024"), [])
+
+    def test_calendar_is_loaded_once_per_year_block(self):
+        with patch.object(libutil.nse_calendar, "valid_days", wraps=libutil.nse_calendar.valid_days) as valid_days:
+            for day in range(1, 29):
+                libutil.previous_trading_day(date(2024, 2, day))
+                libutil.trading_days_between(date(2024, 1, day), date(2024, 3, day))
+            self.assertEqual(valid_days.call_count, 1)
+
+            libutil.previous_trading_day("03-01-2012")
+            self.assertEqual(valid_days.call_count, 2)
+            self.assertEqual(libutil.previous_trading_day("15-06-2015"), datetime(2015, 6, 12))
+            self.assertEqual(valid_days.call_count, 2)
+
+    def test_previous_day_across_a_year_boundary(self):
+        libutil.trading_days_between("01-06-2024", "10-06-2024")
+        first_loaded = self.index._first_year
+        self.assertEqual(libutil.previous_trading_day(date(first_loaded, 1, 1)).year, first_loaded - 1)
+
+    def test_derive_from_and_to_date_moves_back_to_a_trading_day(self):
+        class FakeDate(date):
+            @classmethod
+            def today(cls):
+                return cls(2024, 1, 27)
+
+        with patch("nselib.libutil.date", FakeDate):
+            self.assertEqual(libutil.derive_from_and_to_date(period="1D"), ("25-01-2024", "27-01-2024"))
+            self.assertEqual(libutil.derive_from_and_to_date(period="1W"), ("19-01-2024", "27-01-2024"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import requests
+
+from nselib import capital_market, derivatives, libutil, transport
+from nselib.errors import FixtureNotFound
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+PE_CSV = b"SYMBOL,SERIES,P/E\nSBIN,EQ,9.5\nTCS,EQ,30.1\n"
+
+
+class StubTransport(transport.LiveTransport):
+    """answers every url with the body registered for it (an empty 200 for the origin pages)"""
+
+    def __init__(self, bodies):
+        self.bodies = bodies
+        self.urls = []
+
+    def send(self, session, url, headers, **kwargs):
+        self.urls.append(url)
+        response = requests.Response()
+        response.url = url
+        response.status_code = 200 if url in self.bodies or "/api/" not in url else 404
+        response.headers["Content-Type"] = "text/csv"
+        response.encoding = "utf-8"
+        response._content = self.bodies.get(url, b"")
+        return response
+
+
+class TestRecordReplay(unittest.TestCase):
+    def setUp(self):
+        self.fixtures = tempfile.TemporaryDirectory()
+        self.addCleanup(self.fixtures.cleanup)
+        self.addCleanup(transport.set_transport, None)
+        self.client = libutil.NSEClient()
+        patcher = patch.object(libutil, "get_nse_client", return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _record(self, bodies, call):
+        stub = StubTransport(bodies)
+        transport.set_transport(transport.RecordTransport(self.fixtures.name, transport=stub))
+        result = call()
+        transport.set_transport(transport.ReplayTransport(self.fixtures.name))
+        return stub, result
+
+    def test_replayed_report_parses_without_network(self):
+        url = "https://nsearchives.nseindia.com/content/equities/peDetail/PE_170322.csv"
+        stub, recorded = self._record({url: PE_CSV}, lambda: capital_market.pe_ratio("17-03-2022"))
+        self.assertIn(url, stub.urls)
+
+        with patch.object(self.client.session, "get", side_effect=AssertionError("network used")):
+            replayed = capital_market.pe_ratio("17-03-2022")
+
+        self.assertEqual(replayed.to_dict(), recorded.to_dict())
+        response = self.client.get(url)
+        self.assertEqual((response.status_code, response.headers["content-type"], response.text),
+                         (200, "text/csv", PE_CSV.decode()))
+
+    def test_replayed_option_chain(self):
+        with open(os.path.join(DATA_DIR, "option_chain_nifty.json"), "rb") as fh:
+            payload = fh.read()
+        url = "https://www.nseindia.com/api/option-chain-v3?type=Indices&symbol=NIFTY&expiry=28-Oct-2025"
+        _, recorded = self._record({url: payload}, lambda: derivatives.nse_live_option_chain("NIFTY", "28-10-2025"))
+
+        replayed = derivatives.nse_live_option_chain("NIFTY", "28-10-2025")
+
+        self.assertEqual(len(replayed), 13)
+        self.assertEqual(replayed.to_dict(), recorded.to_dict())
+
+    def test_missing_fixture(self):
+        transport.set_transport(transport.ReplayTransport(self.fixtures.name))
+        with self.assertRaises(FixtureNotFound):
+            capital_market.pe_ratio("18-03-2022")
+
+    def test_fixture_files(self):
+        url = "https://nsearchives.nseindia.com/content/equities/peDetail/PE_170322.csv"
+        self._record({url: PE_CSV}, lambda: capital_market.pe_ratio("17-03-2022"))
+        metas = []
+        for name in os.listdir(self.fixtures.name):
+            if name.endswith(".json"):
+                with open(os.path.join(self.fixtures.name, name), encoding="utf-8") as fh:
+                    metas.append(json.load(fh))
+        self.assertIn({"url": url, "status_code": 200, "headers": {"Content-Type": "text/csv"}, "encoding": "utf-8"},
+                      metas)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
+
+from nselib import capital_market
+
+VAR_URL = "https://nsearchives.nseindia.com/archives/nsccl/var/C_VAR1_{}_{}.DAT"
+SNAPSHOTS = ["begin_day", "1st_intra_day", "2nd_intra_day", "3rd_intra_day", "4th_intra_day", "end_of_day"]
+
+
+def _var_file(number):
+    return (
+        f"VaR Margin Rates for Trade Date 17-MAR-2022 : Snapshot {number}\n"
+        "Record Type,Symbol,Series,ISIN,Security VaR,Index VaR,VaR Margin,Extreme Loss Rate,Adhoc Margin,"
+        "Applicable Margin Rate\n"
+        f"20,SBIN,EQ,INE062A01020,{10 + number}.50,0.00,{10 + number}.50,3.50,0.00,{14 + number}.00\n"
+        "20,TCS,EQ,INE467B01029,9.75,0.00,9.75,3.50,-,13.25\n"
+    ).encode()
+
+
+class TestVarSnapshots(unittest.TestCase):
+    def test_six_snapshots_in_one_long_frame(self):
+        threads = set()
+
+        def urlfetch(url, trade_date):
+            threads.add(threading.get_ident())
+            time.sleep(0.01)
+            number = int(url[-5])
+            return Mock(status_code=200, content=_var_file(number))
+
+        with patch("nselib.capital_market.capital_market_data.archive_urlfetch", side_effect=urlfetch) as fetched:
+            var_df = capital_market.var_all_snapshots("17-03-2022")
+
+        self.assertEqual(sorted(call.args[0] for call in fetched.call_args_list),
+                         [VAR_URL.format("17032022", number) for number in range(1, 7)])
+        self.assertGreater(len(threads), 1)
+        self.assertEqual(var_df.columns.tolist()[:3], ["TradeDate", "Snapshot", "RecordType"])
+        self.assertEqual(var_df["Snapshot"].tolist(), [snapshot for snapshot in SNAPSHOTS for _ in range(2)])
+        self.assertTrue(var_df["Snapshot"].cat.ordered)
+        self.assertEqual(var_df["SecurityVaR"].iloc[::2].tolist(), [11.5, 12.5, 13.5, 14.5, 15.5, 16.5])
+        self.assertEqual(var_df["ApplicableMarginRate"].dtype, np.float64)
+        self.assertTrue(np.isnan(var_df["AdhocMargin"].iloc[1]))
+        self.assertEqual(var_df["RecordType"].dtype, np.int32)
+        self.assertEqual(var_df["TradeDate"].unique().tolist(), [pd.Timestamp("2022-03-17")])
+
+    def test_unpublished_snapshots_are_left_out(self):
+        def urlfetch(url, trade_date):
+            number = int(url[-5])
+            return Mock(status_code=200 if number <= 2 else 404, content=_var_file(number))
+
+        with patch("nselib.capital_market.capital_market_data.archive_urlfetch", side_effect=urlfetch):
+            var_df = capital_market.var_all_snapshots("17-03-2022")
+        self.assertEqual(var_df["Snapshot"].unique().tolist(), ["begin_day", "1st_intra_day"])
+
+        with patch("nselib.capital_market.capital_market_data.archive_urlfetch",
+                   return_value=Mock(status_code=404, content=b"")):
+            with self.assertRaises(FileNotFoundError):
+                capital_market.var_all_snapshots("17-03-2022")
+
+    def test_single_snapshot_functions_read_their_file(self):
+        functions = [capital_market.var_begin_day, capital_market.var_1st_intra_day, capital_market.var_2nd_intra_day,
+                     capital_market.var_3rd_intra_day, capital_market.var_4th_intra_day, capital_market.var_end_of_day]
+        for number, function in enumerate(functions, start=1):
+            with patch("nselib.capital_market.capital_market_data.archive_urlfetch",
+                       return_value=Mock(status_code=200, content=_var_file(number))) as fetched:
+                var_df = function("17-03-2022")
+            self.assertEqual(fetched.call_args.args[0], VAR_URL.format("17032022", number))
+            self.assertEqual(var_df.columns.tolist()[:2], ["RecordType", "Symbol"])
+            self.assertEqual(var_df["SecurityVaR"].tolist(), [10.5 + number, 9.75])
+
+        with patch("nselib.capital_market.capital_market_data.archive_urlfetch",
+                   return_value=Mock(status_code=404, content=b"")):
+            with self.assertRaises(FileNotFoundError):
+                capital_market.var_end_of_day("17-03-2022")
+
+    def test_range_walks_the_trading_days(self):
+        def urlfetch(url, trade_date):
+            return Mock(status_code=200, content=_var_file(int(url[-5])))
+
+        with patch("nselib.capital_market.capital_market_data.archive_urlfetch", side_effect=urlfetch):
+            var_df = capital_market.var_all_snapshots_range("17-03-2022", "21-03-2022", max_workers=2)
+
+        # 18th is Holi, 19th and 20th a weekend
+        self.assertEqual(var_df["TradeDate"].dt.strftime("%d-%m-%Y").unique().tolist(), ["17-03-2022", "21-03-2022"])
+        self.assertEqual(len(var_df), 2 * 12)
+        self.assertIsInstance(var_df["Snapshot"].dtype, pd.CategoricalDtype)
+        self.assertIsInstance(var_df["Symbol"].dtype, pd.CategoricalDtype)
+
+
+if __name__ == "__main__":
+    unittest.main()